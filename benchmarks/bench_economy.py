@@ -0,0 +1,64 @@
+"""Economy over a simulated year: hour-by-hour ticks vs. one batched call.
+
+    python -m benchmarks.bench_economy [--seed N] [--days N]
+
+Loads the real settlement economies (with the seed's per-run variation),
+then advances two identical copies by the same span — one clock hour at a
+time, as a clock_tick per hour would, and in a single advance_hours() call
+— and reports both timings and the largest divergence between them.
+"""
+
+import argparse
+import copy
+import random
+import time
+
+from bootstrap import DATA_DIR
+from core.rng import derive_seed
+from game.services.economy_service import EconomyService
+from game.services.world_graph_service import WorldGraphService
+
+
+def _economy(seed: int) -> EconomyService:
+    graph = WorldGraphService.from_file(f"{DATA_DIR}/world.json")
+    economy = EconomyService()
+    economy.load_from_world(graph, f"{DATA_DIR}/scenarios")
+    economy.apply_variation(random.Random(derive_seed(seed, "economy")))
+    return economy
+
+
+def _divergence(a: EconomyService, b: EconomyService) -> float:
+    worst = max((abs(a.prosperity[loc] - b.prosperity[loc]) for loc in a.prosperity), default=0.0)
+    for loc, stock in a.stocks.items():
+        for item_id, level in stock.items():
+            worst = max(worst, abs(level - b.stocks[loc][item_id]))
+    return worst
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args(argv)
+    hours = args.days * 24
+
+    hourly = _economy(args.seed)
+    batched = copy.deepcopy(hourly)
+
+    start = time.perf_counter()
+    for _ in range(hours):
+        hourly.advance_hours(1)
+    hourly_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched.advance_hours(hours)
+    batched_s = time.perf_counter() - start
+
+    print(f"{len(hourly.stocks)} settlements, {hours} hours")
+    print(f"hour-by-hour : {hourly_s * 1000:9.2f} ms")
+    print(f"batched      : {batched_s * 1000:9.2f} ms  ({hourly_s / batched_s:.0f}x)")
+    print(f"max deviation: {_divergence(hourly, batched):.2e}")
+
+
+if __name__ == "__main__":
+    main()
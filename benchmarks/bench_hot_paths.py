@@ -0,0 +1,241 @@
+"""Hot-path benchmarks with baseline tracking.
+
+    python -m benchmarks.bench_hot_paths [--filter visibility] [--quick]
+                                         [--save-baseline] [--baseline PATH] [--tolerance 0.15]
+
+Times the operations a turn or a frame spends most of its time in, on the
+real world of one seed:
+
+- VisibilityService.compute_visibility from a settlement's arrival point at
+  several radii
+- PathfindingService.get_path across each settlement (scenario) map, from
+  the arrival point to the farthest reachable tile
+- RenderService.render_map of a fully visible viewport onto an off-screen
+  surface
+- SaveService.save / load of a world with every location generated and
+  explored
+- MapContainer.freeze / thaw of the starting map
+- 1000 headless turns (player waits, enemy phase runs; see headless.py)
+
+The results are compared against a JSON baseline (``--baseline``, written
+with ``--save-baseline``); a benchmark more than ``--tolerance`` slower than
+its baseline is reported as a regression and the exit status is 1. No
+display is needed: SDL uses its dummy video driver.
+"""
+
+import argparse
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import sys
+import tempfile
+from collections import deque
+from functools import cache, partial
+
+import esper
+import pygame
+
+from benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    Benchmark,
+    compare,
+    format_report,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from bootstrap import build_game_context
+from config import TILE_SIZE
+from core.camera import Camera
+from core.ecs import reset_world
+from core.input_manager import InputCommand
+from core.visibility_service import VisibilityService
+from game.map.tile import VisibilityState
+from game.services.party_service import get_entity_closure
+from game.services.pathfinding_service import PathfindingService
+from game.services.render_service import RenderService
+from game.services.save_service import SaveService
+from headless import HeadlessSession
+
+SEED = 1234
+BASELINE_FILE = "profiles/bench_baseline.json"
+VISIBILITY_RADII = (5, 10, 20)
+HEADLESS_TURNS = 1000
+
+
+@cache
+def _maps() -> dict:
+    """Every settlement map of the seed's world, by location id (generated once)."""
+    ctx = build_game_context(seed=SEED)
+    graph = ctx.world_graph
+    return {loc.id: ctx.map_service.get_map(loc.id) for loc in graph.locations.values() if loc.type == "settlement"}
+
+
+def _start_map():
+    return next(iter(_maps().values()))
+
+
+def _transparency(layer):
+    tiles = layer.tiles
+
+    def is_transparent(x, y):
+        if 0 <= y < layer.height and 0 <= x < layer.width:
+            return tiles[y][x].is_transparent
+        return False
+
+    return is_transparent
+
+
+def _farthest_reachable(layer, start: tuple[int, int]) -> tuple[int, int]:
+    """Breadth-first search over walkable tiles; the last tile reached."""
+    seen = {start}
+    queue = deque([start])
+    last = start
+    while queue:
+        last = x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            inside = 0 <= nx < layer.width and 0 <= ny < layer.height
+            if inside and (nx, ny) not in seen and layer.tiles[ny][nx].walkable:
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+    return last
+
+
+# --- Cases ------------------------------------------------------------------
+
+
+def _visibility(radius: int):
+    def setup():
+        container = _start_map()
+        origin = container.arrival_pos or (1, 1)
+        transparent = _transparency(container.layers[0])
+        return lambda: VisibilityService.compute_visibility(origin, radius, transparent)
+
+    return setup
+
+
+def _pathfinding(location_id: str):
+    def setup():
+        container = _maps()[location_id]
+        start = container.arrival_pos or (1, 1)
+        end = _farthest_reachable(container.layers[0], start)
+        return lambda: PathfindingService.get_path(esper, container, start, end)
+
+    return setup
+
+
+def _render_map():
+    pygame.init()
+    container = _start_map()
+    for layer in container.layers:
+        for row in layer.tiles:
+            for tile in row:
+                tile.visibility_state = VisibilityState.VISIBLE
+    camera = Camera(960, 640)
+    ax, ay = container.arrival_pos or (1, 1)
+    camera.x = max(0, ax * TILE_SIZE - camera.width // 2)
+    camera.y = max(0, ay * TILE_SIZE - camera.height // 2)
+    surface = pygame.Surface((camera.width, camera.height))
+    service = RenderService()
+    return lambda: service.render_map(surface, container, camera)
+
+
+def _explored_session() -> HeadlessSession:
+    """A session with every location generated and every tile explored."""
+    session = HeadlessSession(SEED)
+    map_service = session.ctx.map_service
+    for location_id in session.ctx.world_graph.locations:
+        map_service.get_map(location_id)
+    for container in map_service.maps.values():
+        for layer in container.layers:
+            for row in layer.tiles:
+                for tile in row:
+                    tile.visibility_state = VisibilityState.SHROUDED
+    return session
+
+
+def _save(save_dir: str):
+    ctx = _explored_session().ctx
+    path = os.path.join(save_dir, "save.json")
+    return lambda: SaveService.save(ctx, path)
+
+
+def _load(save_dir: str):
+    ctx = _explored_session().ctx
+    path = os.path.join(save_dir, "load.json")
+    SaveService.save(ctx, path)
+    return lambda: SaveService.load(ctx, path)
+
+
+def _freeze_thaw():
+    ctx = HeadlessSession(SEED).ctx
+    container = ctx.map_container
+    party = get_entity_closure(esper, ctx.player_entity)
+
+    def freeze_thaw():
+        container.freeze(esper, exclude_entities=party)
+        container.thaw(esper)
+
+    return freeze_thaw
+
+
+def _headless_turns():
+    session = HeadlessSession(SEED)
+
+    def play():
+        for _ in range(HEADLESS_TURNS):
+            if not session.step(InputCommand.WAIT):
+                break
+
+    return play
+
+
+def benchmarks(save_dir: str) -> list[Benchmark]:
+    """The suite; the save/load cases write their files into `save_dir`."""
+    cases = [Benchmark(f"visibility[r={r}]", _visibility(r), number=200) for r in VISIBILITY_RADII]
+    cases += [Benchmark(f"pathfinding[{loc}]", _pathfinding(loc), number=5) for loc in _maps()]
+    cases += [
+        Benchmark("render_map[viewport]", _render_map, number=20),
+        Benchmark("save[explored world]", partial(_save, save_dir), number=1, repeat=3),
+        Benchmark("load[explored world]", partial(_load, save_dir), number=1, repeat=3),
+        Benchmark("freeze_thaw[start map]", _freeze_thaw, number=20),
+        Benchmark(f"headless_turns[{HEADLESS_TURNS}]", _headless_turns, number=1, repeat=1),
+    ]
+    return cases
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="Fewer calls and rounds (noisier)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help=f"Baseline JSON (default {BASELINE_FILE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    results = []
+    # Save files are large (an explored world); none outlives the run.
+    with tempfile.TemporaryDirectory(prefix="bench_save_") as save_dir:
+        for bench in benchmarks(save_dir):
+            if args.filter in bench.name:
+                # Each case starts from a clean ECS world.
+                reset_world()
+                results.append(run_benchmark(bench, scale=0.2 if args.quick else 1.0))
+
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else {}
+    comparisons = compare(results, baseline)
+    print(format_report(comparisons, args.tolerance))
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    regressions = [c.name for c in comparisons if c.is_regression(args.tolerance)]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
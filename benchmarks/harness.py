@@ -0,0 +1,121 @@
+"""Timing, JSON baselines and regression reports for the benchmark suite.
+
+A Benchmark is a named setup function returning the callable to time (so
+world building stays out of the measurement). ``run_benchmark`` calls it
+``number`` times per round for ``repeat`` rounds and keeps the per-call
+time of every round; the best round is the figure compared against a
+baseline, as it is the one least disturbed by the rest of the machine.
+
+Baselines are the JSON written by ``save_baseline``. They are only
+meaningful on the machine that recorded them, so they live under the
+git-ignored ``profiles/`` directory rather than in the repository.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+DEFAULT_TOLERANCE = 0.15  # 15% slower than the baseline is a regression
+
+
+@dataclass
+class Benchmark:
+    """A timed operation: ``setup()`` builds the state and returns the callable."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int = 1
+    repeat: int = 5
+
+
+@dataclass
+class BenchResult:
+    name: str
+    number: int
+    rounds: list[float] = field(default_factory=list)  # seconds per call, one entry per round
+
+    @property
+    def best(self) -> float:
+        return min(self.rounds)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.rounds)
+
+    def to_dict(self) -> dict:
+        return {"number": self.number, "best_s": self.best, "median_s": self.median, "rounds_s": self.rounds}
+
+
+@dataclass
+class Comparison:
+    name: str
+    current: float
+    baseline: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        return self.current / self.baseline if self.baseline else None
+
+    def is_regression(self, tolerance: float) -> bool:
+        return self.ratio is not None and self.ratio > 1.0 + tolerance
+
+
+def run_benchmark(bench: Benchmark, scale: float = 1.0) -> BenchResult:
+    """Time `bench`; ``scale`` < 1 shortens the run (fewer calls and rounds)."""
+    func = bench.setup()
+    number = max(1, round(bench.number * scale))
+    repeat = max(1, round(bench.repeat * scale))
+    result = BenchResult(bench.name, number)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        result.rounds.append((time.perf_counter() - start) / number)
+    return result
+
+
+def save_baseline(results: list[BenchResult], filepath: str) -> None:
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(filepath: str) -> dict[str, float]:
+    """``{benchmark name: best seconds per call}`` from a saved baseline."""
+    with open(filepath, encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: entry["best_s"] for name, entry in data["results"].items()}
+
+
+def compare(results: list[BenchResult], baseline: dict[str, float]) -> list[Comparison]:
+    return [Comparison(r.name, r.best, baseline.get(r.name)) for r in results]
+
+
+def format_report(comparisons: list[Comparison], tolerance: float) -> str:
+    lines = [f"{'benchmark':<34}{'best':>12}{'baseline':>12}{'change':>9}"]
+    for c in comparisons:
+        if c.baseline is None:
+            baseline, change, flag = "-", "new", ""
+        else:
+            baseline, change = _format_time(c.baseline), f"{c.ratio - 1:+.1%}"
+            flag = "  REGRESSION" if c.is_regression(tolerance) else ""
+        lines.append(f"{c.name:<34}{_format_time(c.current):>12}{baseline:>12}{change:>9}{flag}")
+    return "\n".join(lines)
+
+
+def _format_time(seconds: float) -> str:
+    if seconds >= 1.0:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
@@ -0,0 +1,140 @@
+"""Component memory per type, across the live world and every frozen map.
+
+    python -m benchmarks.memory_report [--seed N] [--turns N] [--all-maps] [--json PATH]
+
+Builds the seed's world (optionally generating every location and playing
+some headless turns first), then counts the instances of each component
+type and the bytes they occupy — in the live esper world and in the frozen
+entities of every map the MapService holds, including the evicted chunks of
+streamed maps.
+
+Bytes are ``sys.getsizeof`` of the component plus whatever it owns: the
+lists, dicts, tuples and sets in its fields, recursively, and dataclass
+instances inside them (e.g. an ActionList's Actions). Strings, numbers and
+enum members are shared or interned and are not counted.
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import esper
+
+from game.map.chunked_map_container import ChunkedMapContainer
+
+_CONTAINERS = (list, tuple, dict, set, frozenset)
+
+
+@dataclasses.dataclass
+class ComponentUsage:
+    live_count: int = 0
+    live_bytes: int = 0
+    frozen_count: int = 0
+    frozen_bytes: int = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self.live_bytes + self.frozen_bytes
+
+
+def owned_bytes(obj) -> int:
+    """Size of `obj` plus the containers and dataclass instances it owns."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(owned_bytes(v) for v in obj.values() if _is_owned(v))
+    elif isinstance(obj, _CONTAINERS):
+        size += sum(owned_bytes(item) for item in obj if _is_owned(item))
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        if hasattr(obj, "__dict__"):
+            size += sys.getsizeof(obj.__dict__)
+        for f in dataclasses.fields(obj):
+            value = getattr(obj, f.name)
+            if _is_owned(value):
+                size += owned_bytes(value)
+    return size
+
+
+def _is_owned(value) -> bool:
+    return isinstance(value, _CONTAINERS) or (dataclasses.is_dataclass(value) and not isinstance(value, type))
+
+
+def collect(map_service) -> dict[str, ComponentUsage]:
+    """Instances and bytes per component type name, live and frozen."""
+    usage: dict[str, ComponentUsage] = {}
+
+    def entry(component_type) -> ComponentUsage:
+        return usage.setdefault(component_type.__name__, ComponentUsage())
+
+    for entity_comps in esper._entities.values():
+        for component_type, component in entity_comps.items():
+            row = entry(component_type)
+            row.live_count += 1
+            row.live_bytes += owned_bytes(component)
+
+    for container in map_service.maps.values():
+        stores = [container.frozen_entities]
+        if isinstance(container, ChunkedMapContainer):
+            stores.extend(record.entities for record in container.evicted.values())
+        for store in stores:
+            for component_type, components in store.columns():
+                row = entry(component_type)
+                row.frozen_count += len(components)
+                row.frozen_bytes += sum(owned_bytes(c) for c in components)
+    return usage
+
+
+def format_report(usage: dict[str, ComponentUsage]) -> str:
+    """A table sorted by total bytes, largest first, with a totals line."""
+    lines = [f"{'component':<20}{'live':>9}{'live KiB':>11}{'frozen':>9}{'frozen KiB':>12}{'total KiB':>11}"]
+    rows = sorted(usage.items(), key=lambda item: item[1].total_bytes, reverse=True)
+    for name, row in rows:
+        lines.append(
+            f"{name:<20}{row.live_count:>9}{row.live_bytes / 1024:>11.1f}"
+            f"{row.frozen_count:>9}{row.frozen_bytes / 1024:>12.1f}{row.total_bytes / 1024:>11.1f}"
+        )
+    total = ComponentUsage(
+        sum(r.live_count for r in usage.values()),
+        sum(r.live_bytes for r in usage.values()),
+        sum(r.frozen_count for r in usage.values()),
+        sum(r.frozen_bytes for r in usage.values()),
+    )
+    lines.append(
+        f"{'total':<20}{total.live_count:>9}{total.live_bytes / 1024:>11.1f}"
+        f"{total.frozen_count:>9}{total.frozen_bytes / 1024:>12.1f}{total.total_bytes / 1024:>11.1f}"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--turns", type=int, default=0, help="Headless turns to play before measuring")
+    parser.add_argument("--all-maps", action="store_true", help="Generate every location first")
+    parser.add_argument("--json", help="Write the per-type figures to this file")
+    args = parser.parse_args(argv)
+
+    # Imported here: headless pulls in the whole game and pygame.
+    from headless import HeadlessSession, RandomPolicy
+
+    session = HeadlessSession(args.seed)
+    map_service = session.ctx.map_service
+    if args.all_maps:
+        for map_id in list(map_service.pending):
+            map_service.materialize(map_id)
+    if args.turns:
+        session.run(RandomPolicy(args.seed), args.turns)
+
+    usage = collect(map_service)
+    print(f"seed {args.seed}, {len(map_service.maps)} maps, {len(esper._entities)} live entities")
+    print(format_report(usage))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({name: dataclasses.asdict(row) for name, row in usage.items()}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
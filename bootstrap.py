@@ -8,13 +8,23 @@ import random
 
 import esper
 
-from config import HEADER_HEIGHT, LOG_HEIGHT, SCREEN_HEIGHT, SCREEN_WIDTH, SIDEBAR_WIDTH
+from config import (
+    CONTENT_CACHE_FILE,
+    ECS_BACKEND,
+    HEADER_HEIGHT,
+    LOG_HEIGHT,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SIDEBAR_WIDTH,
+)
 from core.camera import Camera
-from core.ecs import apply_esper_compat_patches
+from core.ecs import apply_esper_compat_patches, use_ecs_backend
+from core.event_bus import event_bus
 from core.input_manager import InputManager
 from core.rng import derive_seed
 from core.ui.stack_manager import UIStack
 from core.world_clock_service import WorldClockService
+from game.content.content_cache import content_cache
 from game.content.content_database import default_content
 from game.services.economy_service import EconomyService
 from game.services.faction_service import FactionService
@@ -29,12 +39,19 @@ from game.services.system_initializer import build_systems, register_processors
 from game.services.travel_encounter_service import TravelEncounterService
 from game.services.world_chronicle_service import WorldChronicleService
 from game.services.world_graph_service import WorldGraphService
+from game.services.world_template import WorldTemplate
 from game_context import GameContext
 
 DATA_DIR = "assets/data"
 
 
-def build_game_context(seed: int | None = None) -> GameContext:
+def build_game_context(
+    seed: int | None = None,
+    pregenerate: bool = False,
+    workers: int = 1,
+    template: WorldTemplate | None = None,
+    ecs_backend: str = ECS_BACKEND,
+) -> GameContext:
     """Load content, create services and systems, generate the start map.
 
     Args:
@@ -42,29 +59,67 @@ def build_game_context(seed: int | None = None) -> GameContext:
             run variation — wilderness/dungeon layout, chronicle rolls,
             economy jitter — derives from it, so the same seed reproduces
             the same world. None picks a random seed.
+        pregenerate: Build every location's maps up front. By default only
+            the start location is built; the rest are generated from their
+            seed the first time the player enters them.
+        workers: Process-pool size for pregeneration (1 = serial).
+        template: A WorldTemplate captured for this same seed. Its maps,
+            world graph and economy are cloned instead of regenerated, and
+            the (immutable) content registries are not reloaded.
+        ecs_backend: Entity storage behind esper's API ("esper" or
+            "archetype", see core.ecs.use_ecs_backend).
     """
     # Work around an esper 3.7 query bug before any entities are created.
     apply_esper_compat_patches()
+    use_ecs_backend(ecs_backend)
+    # All esper events go through the instrumented, coalescing bus.
+    event_bus.install()
 
     world_seed = seed if seed is not None else random.SystemRandom().randrange(2**31)
 
-    content = default_content.load(DATA_DIR)
+    if template is not None and template.seed != world_seed:
+        template = None
+
+    # Serve the JSON assets from the compiled, memory-mapped cache; it is
+    # rebuilt in place whenever a source file's content changes.
+    if not content_cache.is_open:
+        content_cache.open(DATA_DIR, CONTENT_CACHE_FILE)
+    if template is None or not default_content.is_loaded:
+        default_content.load(DATA_DIR)
+    content = default_content
 
-    map_service = MapService()
     world_clock = WorldClockService()
-    world_graph = WorldGraphService.from_file(f"{DATA_DIR}/world.json")
 
     # Viewport is the area not covered by UI header and log
     viewport_width = SCREEN_WIDTH - SIDEBAR_WIDTH
     viewport_height = SCREEN_HEIGHT - HEADER_HEIGHT - LOG_HEIGHT
     camera = Camera(viewport_width, viewport_height, 0, HEADER_HEIGHT)
 
-    MapGenerator(map_service, seed=derive_seed(world_seed, "maps")).create_world(esper, world_graph)
+    economy = None
+    if template is not None:
+        map_service, world_graph, economy = template.restore(esper)
+        # Locations the template never built stay on-demand.
+        MapGenerator(map_service, seed=derive_seed(world_seed, "maps")).defer_locations(world_graph)
+    else:
+        map_service = MapService()
+        world_graph = WorldGraphService.from_file(f"{DATA_DIR}/world.json")
+        MapGenerator(map_service, seed=derive_seed(world_seed, "maps")).create_world(
+            esper, world_graph, on_demand=not pregenerate, workers=workers
+        )
 
     systems = build_systems(world_clock, map_service.get_active_map())
     register_processors(systems)
-    # Reproducible ambient gossip per world seed (Phase L slice 2)
-    systems.gossip_system.rng.seed(derive_seed(world_seed, "gossip"))
+    # Runtime randomness draws from one seeded stream per subsystem, so a
+    # run is reproducible from its seed and recorded input (session replay).
+    # Gossip keeps its Phase L label.
+    for label, rng in (
+        ("gossip", systems.gossip_system.rng),
+        ("ai", systems.ai_system.rng),
+        ("combat", systems.combat_system.rng),
+        ("death", systems.death_system.rng),
+        ("dialogue", default_content.dialogues.rng),
+    ):
+        rng.seed(derive_seed(world_seed, label))
 
     ctx = GameContext(
         map_service=map_service,
@@ -87,14 +142,15 @@ def build_game_context(seed: int | None = None) -> GameContext:
     esper.set_handler("clock_tick", chronicle.on_clock_tick)
 
     # Settlement economy: stock levels drift hourly and drive local prices
-    economy = EconomyService()
-    economy.load_from_world(world_graph, f"{DATA_DIR}/scenarios")
-    economy.apply_variation(random.Random(derive_seed(world_seed, "economy")))
+    if economy is None:
+        economy = EconomyService()
+        economy.load_from_world(world_graph, f"{DATA_DIR}/scenarios")
+        economy.apply_variation(random.Random(derive_seed(world_seed, "economy")))
     ctx.economy = economy
     esper.set_handler("clock_tick", economy.on_clock_tick)
 
     # Shops refill their stock toward the starting menu over time (Phase K)
-    restock = MerchantRestockService(economy=economy, world_graph=world_graph)
+    restock = MerchantRestockService(economy=economy, world_graph=world_graph, chronicle=chronicle)
     ctx.merchant_restock = restock
     esper.set_handler("clock_tick", restock.on_clock_tick)
 
@@ -124,6 +180,7 @@ def build_game_context(seed: int | None = None) -> GameContext:
     # Rumors: smalltalk occasionally points at other settlements; locals give
     # directions out of town the first time you ask (how places become known).
     ctx.rumors = RumorService(ctx=ctx)
+    ctx.rumors.rng.seed(derive_seed(world_seed, "rumors"))
     default_content.dialogues.rumor_provider = ctx.rumors.maybe_rumor
     default_content.dialogues.directions_provider = ctx.rumors.directions
 
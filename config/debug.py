@@ -6,3 +6,14 @@ DEBUG_FONT_SIZE = 12
 DEBUG_NPC_FOV_COLOR = (255, 0, 0, 30)
 DEBUG_ARROW_COLOR = (255, 255, 0)
 DEBUG_TEXT_BG_COLOR = (0, 0, 0, 150)
+
+# System profiler (F8 overlay, F11 dump)
+PROFILER_HISTORY = 120  # recent process() durations kept per system
+PROFILE_DUMP_FILE = "profiles/systems.json"
+EVENT_PROFILE_DUMP_FILE = "profiles/events.json"
+DEBUG_PROFILER_ROWS = 12  # systems listed in the overlay, slowest first
+
+# Frame-time / hitch recorder (python main.py --hitch-ms [N])
+HITCH_THRESHOLD_MS = 50.0  # frames slower than this get a sampled profile
+HITCH_DIR = "profiles/hitches"
+HITCH_SAMPLE_INTERVAL = 0.001  # seconds between stack samples during a frame
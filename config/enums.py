@@ -38,6 +38,8 @@ class GameStates(Enum):
 
     GAME_OVER = 8
 
+    PICKUP = 9
+
 
 class LogCategory(Enum):
     DAMAGE_DEALT = 1
@@ -14,12 +14,28 @@ NIGHT_START = 20
 # Save game
 SAVE_FILE = "saves/save.json"
 
+# Compiled content cache (pre-parsed assets/data JSON, memory-mapped at start)
+CONTENT_CACHE_FILE = ".cache/content.bin"
+
+# Entity storage behind esper's API (core.ecs.ECS_BACKENDS): "esper" keeps
+# per-type entity sets, "archetype" groups entities into column tables.
+ECS_BACKEND = "esper"
+
 # Off-screen world simulation
 # Minimum absence (in ticks) before NPCs are snapped to their scheduled
 # positions on arrival — short door hops must not teleport anyone.
 SIM_RECONCILE_MIN_TICKS = 30
 # Chance per location per in-game hour that a chronicle event happens
 SIM_EVENT_CHANCE_PER_HOUR = 0.04
+# Chronicle retention: events older than this are compacted away once per
+# in-game day (longer than any consumer looks back: gossip, rumors, quests,
+# travel) — except each location's newest few, kept for the arrival log.
+CHRONICLE_RETENTION_TICKS = 30 * 24 * 60
+CHRONICLE_KEEP_PER_LOCATION = 10
+# Resting/waiting (TurnOrchestrator.advance_turns) steps only friendly NPCs
+# within this many tiles of the player turn by turn; the rest are snapped to
+# their schedule when the rest ends. Hostiles are always stepped.
+FAST_FORWARD_NEAR_RADIUS = 12
 
 # Travel encounters (events on the road between settlements)
 TRAVEL_ENCOUNTER_CHANCE_PER_HOUR = 0.05  # chance per in-game hour of travel time
@@ -0,0 +1,161 @@
+"""Archetype (table) storage for esper's entity database.
+
+esper keeps one dict of components per entity plus one set of entities per
+component type; a multi-component query walks the smallest set and looks
+every other requested type up in each entity's dict. Archetype storage
+additionally groups entities by their exact component signature: each
+Archetype is a table with one row per entity and one column (a plain list)
+per component type. A query visits only the archetypes whose signature
+contains the requested types and zips their columns, so building a result
+costs no per-entity hash lookups at all.
+
+ArchetypeStorage *is* the entity -> component dict mapping esper reads
+(``esper._entities``), so esper's lookups (``component_for_entity``,
+``try_component``, ``has_component`` ...) keep working untouched. Writes must
+go through the storage's methods, which keep the tables in step; core.ecs
+installs esper functions that do so (see ``core.ecs.use_ecs_backend``).
+"""
+
+from collections.abc import Iterable, Iterator
+
+
+class Archetype:
+    """All entities with exactly one component signature, as columns."""
+
+    __slots__ = ("types", "entities", "columns", "rows", "edges_add", "edges_remove")
+
+    def __init__(self, types: frozenset):
+        self.types = types
+        self.entities: list[int] = []
+        self.columns: dict[type, list] = {component_type: [] for component_type in types}
+        # entity -> row index into entities / every column
+        self.rows: dict[int, int] = {}
+        # Signature transitions, cached: component type -> neighbouring archetype
+        self.edges_add: dict[type, Archetype] = {}
+        self.edges_remove: dict[type, Archetype] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def append(self, entity: int, components: dict) -> None:
+        self.rows[entity] = len(self.entities)
+        self.entities.append(entity)
+        for component_type, column in self.columns.items():
+            column.append(components[component_type])
+
+    def discard(self, entity: int) -> None:
+        """Remove `entity`'s row; the last row is moved into the gap."""
+        row = self.rows.pop(entity)
+        last = len(self.entities) - 1
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved] = row
+            for column in self.columns.values():
+                column[row] = column[last]
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+
+
+class ArchetypeStorage(dict):
+    """entity -> {component type: instance}, backed by archetype tables."""
+
+    def __init__(self, entities: Iterable[tuple[int, dict]] = ()):
+        super().__init__()
+        self.archetypes: dict[frozenset, Archetype] = {}
+        self._where: dict[int, Archetype] = {}
+        # query signature -> archetypes whose types include it
+        self._matches: dict[tuple, list[Archetype]] = {}
+        for entity, components in entities:
+            self.insert(entity, components)
+
+    def __reduce__(self):
+        # Rebuild the tables on unpickling/copying instead of restoring bare dict items.
+        return type(self), (list(self.items()),)
+
+    # --- Tables -----------------------------------------------------------------
+
+    def archetype(self, types: frozenset) -> Archetype:
+        """The table for signature `types`, created on first use."""
+        archetype = self.archetypes.get(types)
+        if archetype is None:
+            archetype = self.archetypes[types] = Archetype(types)
+            for signature, matches in self._matches.items():
+                if types.issuperset(signature):
+                    matches.append(archetype)
+        return archetype
+
+    def matching(self, component_types: tuple) -> list[Archetype]:
+        """Every archetype holding all of `component_types` (cached)."""
+        matches = self._matches.get(component_types)
+        if matches is None:
+            wanted = frozenset(component_types)
+            matches = [a for types, a in self.archetypes.items() if types >= wanted]
+            self._matches[component_types] = matches
+        return matches
+
+    # --- Writes -------------------------------------------------------------------
+
+    def insert(self, entity: int, components: dict) -> None:
+        """Add a new entity; `components` is adopted, not copied."""
+        archetype = self.archetype(frozenset(components))
+        archetype.append(entity, components)
+        self._where[entity] = archetype
+        dict.__setitem__(self, entity, components)
+
+    def extract(self, entity: int) -> dict:
+        """Remove an entity and return its component dict (KeyError if absent)."""
+        components = dict.pop(self, entity)
+        self._where.pop(entity).discard(entity)
+        return components
+
+    def set_component(self, entity: int, component_type: type, component) -> None:
+        """Add or replace one component, moving the entity to its new table."""
+        components = self[entity]
+        archetype = self._where[entity]
+        if component_type in components:
+            components[component_type] = component
+            archetype.columns[component_type][archetype.rows[entity]] = component
+            return
+        components[component_type] = component
+        target = archetype.edges_add.get(component_type)
+        if target is None:
+            target = archetype.edges_add[component_type] = self.archetype(archetype.types | {component_type})
+        archetype.discard(entity)
+        target.append(entity, components)
+        self._where[entity] = target
+
+    def unset_component(self, entity: int, component_type: type):
+        """Remove one component and return it (KeyError if the entity lacks it)."""
+        components = self[entity]
+        component = components.pop(component_type)
+        archetype = self._where[entity]
+        target = archetype.edges_remove.get(component_type)
+        if target is None:
+            target = archetype.edges_remove[component_type] = self.archetype(archetype.types - {component_type})
+        archetype.discard(entity)
+        target.append(entity, components)
+        self._where[entity] = target
+        return component
+
+    def clear(self) -> None:
+        super().clear()
+        self.archetypes.clear()
+        self._where.clear()
+        self._matches.clear()
+
+    # --- Queries ------------------------------------------------------------------
+
+    def query(self, component_types: tuple) -> Iterator[tuple[int, tuple]]:
+        """(entity, components) for every entity holding all `component_types`."""
+        for archetype in self.matching(component_types):
+            if archetype.entities:
+                columns = [archetype.columns[component_type] for component_type in component_types]
+                yield from zip(archetype.entities, zip(*columns, strict=True), strict=True)
+
+    def query_one(self, component_type: type) -> Iterator[tuple[int, object]]:
+        """(entity, component) for every entity holding `component_type`."""
+        for archetype in self.matching((component_type,)):
+            if archetype.entities:
+                yield from zip(archetype.entities, archetype.columns[component_type], strict=True)
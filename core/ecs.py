@@ -1,5 +1,10 @@
+import itertools
+from contextlib import contextmanager
+
 import esper
 
+from core.archetype_storage import ArchetypeStorage
+
 
 def _fixed_get_components(*component_types):
     """Bug-free replacement for esper 3.7's private ``_get_components``.
@@ -43,16 +48,268 @@ def _fixed_get_components(*component_types):
             yield entity, tuple(entity_comps[ct] for ct in component_types)
 
 
+# --- Query views -----------------------------------------------------------------
+#
+# esper caches each get_component / get_components result (a list of
+# prebuilt ``(entity, components)`` tuples per component signature), but any
+# add_component, remove_component or entity creation/deletion throws away
+# *every* cached query. Systems that add or remove a marker component each
+# turn therefore make every other system rebuild its queries from scratch.
+#
+# The replacements below make the same changes to esper's tables but drop
+# only the cached views whose signature mentions one of the component types
+# that changed; every other view stays valid and the next identical query
+# returns it as is. esper's own clear_cache() (a full reset) still works and
+# wins: while the world is flagged dirty, nothing is invalidated piecemeal.
+
+
+def _invalidate_views(component_types) -> None:
+    """Drop the cached query results that involve any of `component_types`."""
+    if esper._cache_dirty:
+        return
+    single = esper._get_component_cache
+    for component_type in component_types:
+        single.pop(component_type, None)
+    views = esper._get_components_cache
+    if views:
+        changed = set(component_types)
+        for signature in [sig for sig in views if not changed.isdisjoint(sig)]:
+            del views[signature]
+
+
+def _create_entity(*components) -> int:
+    entity = next(esper._entity_count)
+    comp_db = esper._components
+    entity_dict = {}
+    for component_instance in components:
+        component_type = type(component_instance)
+        comp_set = comp_db.get(component_type)
+        if comp_set is None:
+            comp_set = comp_db[component_type] = set()
+        comp_set.add(entity)
+        entity_dict[component_type] = component_instance
+    esper._entities[entity] = entity_dict
+    _invalidate_views(entity_dict)
+    return entity
+
+
+def _remove_entity_now(entity) -> dict:
+    entity_comps = esper._entities.pop(entity)
+    comp_db = esper._components
+    for component_type in entity_comps:
+        comp_set = comp_db[component_type]
+        comp_set.discard(entity)
+        if not comp_set:
+            del comp_db[component_type]
+    return entity_comps
+
+
+def _delete_entity(entity: int, immediate: bool = False) -> None:
+    if immediate:
+        _invalidate_views(_remove_entity_now(entity))
+    else:
+        esper._dead_entities.add(entity)
+
+
+def _clear_dead_entities() -> None:
+    dead = esper._dead_entities
+    if not dead:
+        return
+    changed = set()
+    for entity in dead:
+        changed.update(_remove_entity_now(entity))
+    dead.clear()
+    _invalidate_views(changed)
+
+
+def _add_component(entity: int, component_instance, type_alias=None) -> None:
+    component_type = type_alias or type(component_instance)
+    comp_db = esper._components
+    comp_set = comp_db.get(component_type)
+    if comp_set is None:
+        comp_set = comp_db[component_type] = set()
+    comp_set.add(entity)
+    esper._entities[entity][component_type] = component_instance
+    _invalidate_views((component_type,))
+
+
+def _remove_component(entity: int, component_type):
+    comp_db = esper._components
+    comp_set = comp_db[component_type]
+    comp_set.discard(entity)
+    if not comp_set:
+        del comp_db[component_type]
+    _invalidate_views((component_type,))
+    return esper._entities[entity].pop(component_type)
+
+
+def _try_remove_component(entity: int, component_type):
+    # esper 3.7 raises KeyError here when other entities hold the type but
+    # this one does not; "try" means no error on either backend.
+    if component_type in esper._entities[entity]:
+        return _remove_component(entity, component_type)
+    return None
+
+
+# --- Archetype backend -------------------------------------------------------------
+#
+# With the "archetype" backend esper._entities is an ArchetypeStorage (still
+# the entity -> component dict esper's lookups read) and esper._components
+# stays empty: queries zip the columns of the matching archetype tables
+# instead of probing per-entity dicts. The functions below are the
+# backend's versions of esper's writers and query generators; the query
+# views above work the same on either backend.
+
+
+def _archetype_create_entity(*components) -> int:
+    entity = next(esper._entity_count)
+    entity_dict = {type(component): component for component in components}
+    esper._entities.insert(entity, entity_dict)
+    _invalidate_views(entity_dict)
+    return entity
+
+
+def _archetype_delete_entity(entity: int, immediate: bool = False) -> None:
+    if immediate:
+        _invalidate_views(esper._entities.extract(entity))
+    else:
+        esper._dead_entities.add(entity)
+
+
+def _archetype_clear_dead_entities() -> None:
+    dead = esper._dead_entities
+    if not dead:
+        return
+    storage = esper._entities
+    changed = set()
+    for entity in dead:
+        changed.update(storage.extract(entity))
+    dead.clear()
+    _invalidate_views(changed)
+
+
+def _archetype_add_component(entity: int, component_instance, type_alias=None) -> None:
+    component_type = type_alias or type(component_instance)
+    esper._entities.set_component(entity, component_type, component_instance)
+    _invalidate_views((component_type,))
+
+
+def _archetype_remove_component(entity: int, component_type):
+    component = esper._entities.unset_component(entity, component_type)
+    _invalidate_views((component_type,))
+    return component
+
+
+def _archetype_try_remove_component(entity: int, component_type):
+    if component_type in esper._entities[entity]:
+        return _archetype_remove_component(entity, component_type)
+    return None
+
+
+def _archetype_get_component(component_type):
+    return esper._entities.query_one(component_type)
+
+
+def _archetype_get_components(*component_types):
+    if not component_types:
+        return iter(())
+    return esper._entities.query(component_types)
+
+
+# Backend name -> the esper module functions it installs.
+ECS_BACKENDS = {
+    "esper": {
+        "_get_components": _fixed_get_components,
+        "create_entity": _create_entity,
+        "delete_entity": _delete_entity,
+        "clear_dead_entities": _clear_dead_entities,
+        "add_component": _add_component,
+        "remove_component": _remove_component,
+        "try_remove_component": _try_remove_component,
+    },
+    "archetype": {
+        "_get_component": _archetype_get_component,
+        "_get_components": _archetype_get_components,
+        "create_entity": _archetype_create_entity,
+        "delete_entity": _archetype_delete_entity,
+        "clear_dead_entities": _archetype_clear_dead_entities,
+        "add_component": _archetype_add_component,
+        "remove_component": _archetype_remove_component,
+        "try_remove_component": _archetype_try_remove_component,
+    },
+}
+_ESPER_ORIGINALS = {
+    name: getattr(esper, name) for name in {name for functions in ECS_BACKENDS.values() for name in functions}
+}
+_esper_switch_world = esper.switch_world
+_active_backend = "esper"
+
+
+def _adopt_entity_table() -> None:
+    """Convert the current world's entity table to the active backend's type."""
+    entities = esper._entities
+    wants_archetypes = _active_backend == "archetype"
+    if isinstance(entities, ArchetypeStorage) == wants_archetypes:
+        return
+    comp_db = esper._components
+    comp_db.clear()
+    if wants_archetypes:
+        table = ArchetypeStorage(entities.items())
+    else:
+        table = dict(entities)
+        for entity, entity_comps in table.items():
+            for component_type in entity_comps:
+                comp_db.setdefault(component_type, set()).add(entity)
+    esper._entities = table
+    # esper restores a world from its context map on switch_world.
+    context = esper._context_map.get(esper._current_world)
+    if context is not None:
+        esper._context_map[esper._current_world] = tuple(table if item is entities else item for item in context)
+    esper.clear_cache()
+
+
+def _switch_world(name: str) -> None:
+    _esper_switch_world(name)
+    _adopt_entity_table()
+
+
+def use_ecs_backend(name: str) -> None:
+    """Select the storage behind esper's API for the whole process.
+
+    "esper" keeps esper's per-type entity sets; "archetype" groups entities
+    by component signature into column tables (core.archetype_storage).
+    Both serve the same esper API. Existing entities are carried over, and
+    every world is converted when it is next switched to. Iteration order
+    of query results differs between the backends, so a seeded run is
+    reproducible on one backend but not identical across them.
+    """
+    global _active_backend
+    if name not in ECS_BACKENDS:
+        raise ValueError(f"Unknown ECS backend {name!r} (choose from {', '.join(ECS_BACKENDS)})")
+    _active_backend = name
+    apply_esper_compat_patches()
+
+
+def active_ecs_backend() -> str:
+    return _active_backend
+
+
 def apply_esper_compat_patches():
-    """Install fixes for known esper bugs. Idempotent; safe to call repeatedly.
+    """Install fixes for known esper bugs, the incremental query views and
+    the active storage backend's functions. Idempotent; safe to call
+    repeatedly.
 
     Applied at import time (so tests pick it up via ``conftest``) and again
     explicitly from ``bootstrap`` for the game runtime, which never imports
-    this module otherwise. ``esper.get_components`` resolves ``_get_components``
-    as a module global on every call, so reassigning it takes effect for all
-    existing call sites.
+    this module otherwise. esper's public functions resolve each other (and
+    ``_get_components``) as module globals on every call, and callers use
+    ``esper.<name>``, so reassigning them takes effect for all existing call
+    sites — including ``esper.process``, which calls ``clear_dead_entities``.
     """
-    esper._get_components = _fixed_get_components
+    for name, original in _ESPER_ORIGINALS.items():
+        setattr(esper, name, ECS_BACKENDS[_active_backend].get(name, original))
+    esper.switch_world = _switch_world
+    _adopt_entity_table()
 
 
 apply_esper_compat_patches()
@@ -75,3 +332,107 @@ def reset_world():
         esper._processors.clear()
     if hasattr(esper, "_processors_dict"):
         esper._processors_dict.clear()
+
+
+# Module globals that make up one esper world context (esper 3.7). Kept in
+# one place so isolated_world() can swap them wholesale.
+_WORLD_STATE_ATTRS = (
+    "_entity_count",
+    "_components",
+    "_entities",
+    "_dead_entities",
+    "_get_component_cache",
+    "_get_components_cache",
+    "_processors",
+    "_processors_dict",
+    "_cache_dirty",
+    "process_times",
+    "event_registry",
+    "_current_world",
+    "current_world",
+)
+_isolated_ids = itertools.count(1)
+
+
+@contextmanager
+def isolated_world():
+    """Run a block against a fresh, empty esper world, then restore the old one.
+
+    Used for on-demand map generation: generators create entities and call
+    ``MapContainer.freeze``, which sweeps *every* live MapBound entity — in
+    the game world that would swallow the active map's population. Inside a
+    scratch context nothing else is live, no handlers or processors fire, and
+    entity ids start at 1, so a map generates identically whenever it is
+    built.
+
+    The previous world is restored from a snapshot of esper's module
+    globals rather than via ``switch_world``: ``clear_database`` rebinds the
+    entity counter without updating esper's context map, so switching back
+    by name could resurrect a stale counter and hand out duplicate ids.
+    """
+    saved = {attr: getattr(esper, attr) for attr in _WORLD_STATE_ATTRS}
+    name = f"__isolated_{next(_isolated_ids)}"
+    esper.switch_world(name)
+    try:
+        yield
+    finally:
+        for attr, value in saved.items():
+            setattr(esper, attr, value)
+        esper._context_map.pop(name, None)
+
+
+def extract_entities(entities) -> list[dict]:
+    """Remove ``entities`` from the world at once and return their component
+    dicts (type -> instance), in the given order.
+
+    Bulk counterpart of ``delete_entity(immediate=True)``: the per-type
+    component sets (or archetype tables) are updated directly and esper's
+    query cache is cleared once instead of once per entity.
+    """
+    entity_db = esper._entities
+    comp_db = esper._components
+    archetypes = isinstance(entity_db, ArchetypeStorage)
+    extracted = []
+    for entity in entities:
+        if archetypes:
+            entity_comps = entity_db.extract(entity)
+        else:
+            entity_comps = entity_db.pop(entity)
+            for component_type in entity_comps:
+                comp_set = comp_db[component_type]
+                comp_set.discard(entity)
+                if not comp_set:
+                    del comp_db[component_type]
+        esper._dead_entities.discard(entity)
+        extracted.append(entity_comps)
+    if extracted:
+        esper.clear_cache()
+    return extracted
+
+
+def create_entities(component_dicts) -> list[int]:
+    """Create one entity per component dict (type -> instance) in bulk.
+
+    Equivalent to ``create_entity(*components)`` per dict — same id
+    sequence — but fills esper's tables directly and clears the query cache
+    once. The dicts are adopted, not copied.
+    """
+    entity_db = esper._entities
+    comp_db = esper._components
+    archetypes = isinstance(entity_db, ArchetypeStorage)
+    created = []
+    for entity_comps in component_dicts:
+        entity = next(esper._entity_count)
+        if archetypes:
+            entity_db.insert(entity, entity_comps)
+        else:
+            for component_type in entity_comps:
+                comp_set = comp_db.get(component_type)
+                if comp_set is None:
+                    comp_set = comp_db[component_type] = set()
+                comp_set.add(entity)
+            entity_db[entity] = entity_comps
+        created.append(entity)
+    if created:
+        esper.clear_cache()
+    return created
@@ -0,0 +1,169 @@
+"""Instrumented, coalescing front end for esper's event dispatch.
+
+``install()`` replaces ``esper.dispatch_event`` with ``EventBus.dispatch``;
+every existing ``esper.dispatch_event(...)`` call site goes through it
+unchanged, and handlers are still registered with ``esper.set_handler``.
+
+Two things on top of plain dispatch:
+
+- Counting: dispatches per event name are always counted. With ``timing``
+  on, every handler call is timed as well (calls and wall time per
+  event/handler pair); ``snapshot()`` / ``dump()`` report both.
+- Coalescing: inside ``with event_bus.coalescing("clock_tick"):`` a handler
+  marked ``@coalescible`` does not receive each dispatch. The bus keeps the
+  latest arguments and a count, and on leaving the block delivers one call
+  ``handler(*latest_args, coalesced=count)``. Handlers that are not marked
+  still receive every dispatch. Only handlers whose result depends on the
+  latest payload alone (catch-up style, like the clock_tick subscribers
+  that work from ``total_ticks``) should opt in.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import esper
+
+_esper_dispatch = esper.dispatch_event
+
+
+def coalescible(func):
+    """Mark an event handler as accepting coalesced delivery (``coalesced=n`` kwarg)."""
+    func.coalescible = True
+    return func
+
+
+def _accepts_coalesced(handler) -> bool:
+    return getattr(getattr(handler, "__func__", handler), "coalescible", False)
+
+
+def handler_name(handler) -> str:
+    func = getattr(handler, "__func__", handler)
+    owner = getattr(handler, "__self__", None)
+    name = getattr(func, "__qualname__", repr(func))
+    if owner is not None and "." not in name:
+        name = f"{type(owner).__name__}.{name}"
+    return name
+
+
+class EventBus:
+    """Counts, times and (for opted-in handlers) coalesces esper events."""
+
+    def __init__(self):
+        self.timing = False
+        self.dispatches: Counter = Counter()
+        # (event name, handler name) -> [calls, seconds, coalesced dispatches]
+        self.handler_stats: dict[tuple[str, str], list] = {}
+        # event name -> {handler ref: [latest args, count]} while coalescing
+        self._pending: dict[str, dict] = {}
+        self._depth: Counter = Counter()
+
+    # --- Installation ------------------------------------------------------------
+
+    def install(self) -> None:
+        """Route ``esper.dispatch_event`` through this bus. Idempotent."""
+        esper.dispatch_event = self.dispatch
+
+    @staticmethod
+    def uninstall() -> None:
+        esper.dispatch_event = _esper_dispatch
+
+    # --- Dispatch ----------------------------------------------------------------
+
+    def dispatch(self, name: str, *args) -> None:
+        self.dispatches[name] += 1
+        refs = esper.event_registry.get(name)
+        if not refs:
+            return
+        pending = self._pending.get(name)
+        timing = self.timing
+        # Copy: a handler may (un)register handlers of the same event.
+        for ref in list(refs):
+            handler = ref()
+            if handler is None:
+                continue
+            if pending is not None and _accepts_coalesced(handler):
+                entry = pending.get(ref)
+                if entry is None:
+                    pending[ref] = [args, 1]
+                else:
+                    entry[0] = args
+                    entry[1] += 1
+                continue
+            if timing:
+                self._timed_call(name, handler, args, {})
+            else:
+                handler(*args)
+
+    def _timed_call(self, name: str, handler, args, kwargs) -> None:
+        start = time.perf_counter()
+        try:
+            handler(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            key = (name, handler_name(handler))
+            stats = self.handler_stats.get(key)
+            if stats is None:
+                stats = self.handler_stats[key] = [0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += kwargs.get("coalesced", 1) - 1
+
+    @contextmanager
+    def coalescing(self, *names: str):
+        """Hold back dispatches of `names` from coalescible handlers until the block ends.
+
+        Nested blocks for the same event flush only when the outermost ends.
+        """
+        for name in names:
+            self._depth[name] += 1
+            self._pending.setdefault(name, {})
+        try:
+            yield self
+        finally:
+            for name in names:
+                self._depth[name] -= 1
+                if self._depth[name] == 0:
+                    del self._depth[name]
+                    self._flush(name, self._pending.pop(name))
+
+    def _flush(self, name: str, pending: dict) -> None:
+        for ref, (args, count) in pending.items():
+            handler = ref()
+            if handler is None:
+                continue
+            if self.timing:
+                self._timed_call(name, handler, args, {"coalesced": count})
+            else:
+                handler(*args, coalesced=count)
+
+    # --- Reporting ---------------------------------------------------------------
+
+    def reset(self) -> None:
+        self.dispatches.clear()
+        self.handler_stats.clear()
+
+    def snapshot(self) -> dict[str, dict]:
+        """``{event: {dispatches, handlers: {name: {calls, total_ms, coalesced}}}}``, busiest first."""
+        report = {name: {"dispatches": count, "handlers": {}} for name, count in self.dispatches.most_common()}
+        for (name, handler), (calls, seconds, coalesced) in sorted(
+            self.handler_stats.items(), key=lambda item: -item[1][1]
+        ):
+            entry = report.setdefault(name, {"dispatches": 0, "handlers": {}})
+            entry["handlers"][handler] = {"calls": calls, "total_ms": seconds * 1000, "coalesced": coalesced}
+        return report
+
+    def dump(self, filepath: str) -> None:
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+event_bus = EventBus()
+# Installed at import time, like the esper compat patches, so any code that
+# relies on coalescing (and the tests) gets it; bootstrap installs it again.
+event_bus.install()
@@ -0,0 +1,213 @@
+"""Frame-time recording with sampled profiles of slow frames (hitches).
+
+FrameRecorder wraps each frame of the main loop (``frame()``) and the
+stages inside it (``stage("update")``, ...). It keeps recent frame
+durations in a ring buffer for summary statistics. While a frame runs, a
+background thread samples the main thread's Python stack every
+``sample_interval`` seconds; the samples are plain tuples of code objects
+and are thrown away when the frame ends on time. Only when a frame takes
+longer than the threshold are they folded into collapsed-stack lines
+
+    frame;update;TurnOrchestrator.update (turn_orchestrator.py:28);... 7
+
+(loadable by flamegraph.pl, speedscope, inferno) and written to
+``<out_dir>/hitch_<frame>_<ms>ms.folded``, with the frame's exact stage
+timings appended to ``<out_dir>/hitches.jsonl``.
+
+A disabled recorder hands out a shared null context and starts no thread.
+The sampler needs the GIL to take a sample, so a frame busy in pure Python
+is sampled at most every ``sys.getswitchinterval()`` (5 ms by default).
+"""
+
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+logger = logging.getLogger(__name__)
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class FrameRecorder:
+    """Tracks frame durations; dumps a sampled profile of every hitch."""
+
+    def __init__(
+        self,
+        threshold_ms: float | None,
+        out_dir: str,
+        sample_interval: float = 0.001,
+        history: int = 600,
+        max_dumps: int = 50,
+    ):
+        """Args:
+        threshold_ms: Frames slower than this are dumped. None disables
+            the recorder entirely.
+        out_dir: Directory for the .folded files and hitches.jsonl.
+        sample_interval: Seconds between stack samples during a frame.
+        history: Frame durations kept for summary().
+        max_dumps: Stop writing profiles after this many hitches.
+        """
+        self.enabled = threshold_ms is not None
+        self.threshold = (threshold_ms or 0.0) / 1000.0
+        self.out_dir = out_dir
+        self.sample_interval = sample_interval
+        self.max_dumps = max_dumps
+        self.durations: deque[float] = deque(maxlen=history)
+        self.frame_count = 0
+        self.hitch_count = 0
+        self._stages: list[str] = []
+        self._stage_times: dict[str, float] = {}
+        self._samples: list = []
+        self._in_frame = False
+        self._root = None
+        self._sampler = None
+
+    # --- Frame / stage scopes -----------------------------------------------
+
+    def frame(self):
+        """Context manager around one whole frame."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._frame(sys._getframe(1))
+
+    def stage(self, name: str):
+        """Context manager around one stage of the current frame."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._stage(name)
+
+    @contextlib.contextmanager
+    def _frame(self, root):
+        if self._sampler is None:
+            self._start_sampler()
+        self._root = root
+        self._samples = []
+        self._stage_times = {}
+        self._in_frame = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._in_frame = False
+            duration = time.perf_counter() - start
+            self.frame_count += 1
+            self.durations.append(duration)
+            if duration > self.threshold:
+                self.hitch_count += 1
+                if self.hitch_count <= self.max_dumps:
+                    self._dump(duration, self._samples, self._stage_times)
+
+    @contextlib.contextmanager
+    def _stage(self, name: str):
+        self._stages.append(name)
+        path = ";".join(self._stages)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stage_times[path] = self._stage_times.get(path, 0.0) + time.perf_counter() - start
+            self._stages.pop()
+
+    # --- Sampling -------------------------------------------------------------
+
+    def _start_sampler(self) -> None:
+        self._sampler = _Sampler(self, threading.get_ident())
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread (a later frame restarts it)."""
+        if self._sampler is not None:
+            self._sampler.halt()
+            self._sampler = None
+
+    def _take_sample(self, frame) -> None:
+        if not self._in_frame:
+            return
+        root = self._root
+        codes = []
+        while frame is not None and frame is not root:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        self._samples.append((tuple(self._stages), tuple(codes)))
+
+    # --- Output ---------------------------------------------------------------
+
+    def _dump(self, duration: float, samples: list, stage_times: dict[str, float]) -> None:
+        os.makedirs(self.out_dir, exist_ok=True)
+        ms = duration * 1000
+        entry = {
+            "frame": self.frame_count,
+            "ms": round(ms, 3),
+            "stages_ms": {path: round(t * 1000, 3) for path, t in stage_times.items()},
+            "samples": len(samples),
+            "file": None,
+        }
+        if samples:
+            name = f"hitch_{self.frame_count:06d}_{ms:.0f}ms.folded"
+            entry["file"] = name
+            with open(os.path.join(self.out_dir, name), "w", encoding="utf-8") as f:
+                f.writelines(f"{stack} {count}\n" for stack, count in fold(samples).items())
+        with open(os.path.join(self.out_dir, "hitches.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        logger.info("Hitch: frame %d took %.1f ms (%d samples)", self.frame_count, ms, len(samples))
+
+    def summary(self) -> dict:
+        """Frame-time percentiles (ms) over the recent history."""
+        ordered = sorted(self.durations)
+        if not ordered:
+            return {"frames": self.frame_count, "hitches": self.hitch_count}
+
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+        return {
+            "frames": self.frame_count,
+            "hitches": self.hitch_count,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": ordered[-1] * 1000,
+        }
+
+
+def fold(samples: list) -> Counter:
+    """Collapse ``(stages, innermost-first code objects)`` samples to ``{stack line: count}``."""
+    labels: dict = {}
+    folded = Counter()
+    for stages, codes in samples:
+        parts = ["frame", *stages]
+        for code in reversed(codes):
+            label = labels.get(code)
+            if label is None:
+                name = getattr(code, "co_qualname", code.co_name)
+                label = labels[code] = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            parts.append(label)
+        folded[";".join(parts)] += 1
+    return folded
+
+
+class _Sampler(threading.Thread):
+    """Daemon thread sampling one thread's stack for a FrameRecorder."""
+
+    def __init__(self, recorder: FrameRecorder, thread_id: int):
+        super().__init__(name="frame-sampler", daemon=True)
+        self.recorder = recorder
+        self.thread_id = thread_id
+        self._halt = threading.Event()
+
+    def halt(self) -> None:
+        self._halt.set()
+
+    def run(self) -> None:
+        interval = self.recorder.sample_interval
+        while not self._halt.wait(interval):
+            if not self.recorder._in_frame:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.recorder._take_sample(frame)
@@ -34,6 +34,7 @@ class InputCommand(Enum):
     DROP_ITEM = auto()  # D
     USE_ITEM = auto()  # U
     EQUIP_ITEM = auto()  # E
+    PICKUP_ALL = auto()  # A (pickup chooser)
 
     # Meta
     SAVE_GAME = auto()  # F9
@@ -45,6 +46,8 @@ class InputCommand(Enum):
     DEBUG_TOGGLE_NPC_FOV = auto()
     DEBUG_TOGGLE_CHASE = auto()
     DEBUG_TOGGLE_LABELS = auto()
+    DEBUG_TOGGLE_PROFILER = auto()
+    DEBUG_DUMP_PROFILE = auto()
 
 
 class InputManager:
@@ -70,6 +73,8 @@ class InputManager:
                 pygame.K_F5: InputCommand.DEBUG_TOGGLE_NPC_FOV,
                 pygame.K_F6: InputCommand.DEBUG_TOGGLE_CHASE,
                 pygame.K_F7: InputCommand.DEBUG_TOGGLE_LABELS,
+                pygame.K_F8: InputCommand.DEBUG_TOGGLE_PROFILER,
+                pygame.K_F11: InputCommand.DEBUG_DUMP_PROFILE,
                 pygame.K_F9: InputCommand.SAVE_GAME,
                 pygame.K_F10: InputCommand.LOAD_GAME,
                 pygame.K_SPACE: InputCommand.WAIT,
@@ -128,12 +133,22 @@ class InputManager:
             },
         }
 
+        # The pickup chooser reads the inventory keys, plus 'a' for "take all".
+        self._maps[GameStates.PICKUP] = {**self._maps[GameStates.INVENTORY], pygame.K_a: InputCommand.PICKUP_ALL}
+
         # Default map for any other state
         self._default_map = {
             pygame.K_ESCAPE: InputCommand.CANCEL,
             pygame.K_RETURN: InputCommand.CONFIRM,
         }
 
+        # Session record/replay (game.services.session_recorder): every
+        # command handed out for a key press, to the game states and the UI
+        # windows alike, is reported to ``recorder``; during a replay the
+        # commands come from ``playback`` instead of the keys.
+        self.recorder = None
+        self.playback = None
+
     def handle_event(self, event, state=None):
         """
         Translates a pygame event into an InputCommand based on the current state.
@@ -141,6 +156,11 @@ class InputManager:
         """
         if event.type != pygame.KEYDOWN:
             return None
+        if self.playback is not None:
+            return self.playback.next_command(state)
 
         mapping = self._maps.get(state, self._default_map)
-        return mapping.get(event.key)
+        command = mapping.get(event.key)
+        if self.recorder is not None:
+            self.recorder.record(event, state, command)
+        return command
@@ -0,0 +1,117 @@
+"""Seeded value noise and quantile thresholds for procedural terrain.
+
+``value_noise(width, height, seed)`` returns a row-major grid of smooth,
+spatially coherent values: random values on a coarse lattice (one per
+``scale`` cells) smoothly interpolated in between, summed over a few
+octaves of halving scale. Neighbouring cells get similar values, so
+thresholding the grid yields clumps — groves, ponds, bare patches — instead
+of the salt-and-pepper of one independent roll per cell.
+
+Lattice values come from a stateless hash of (seed, i, j), so a grid can
+start anywhere on the plane (``origin``) and adjacent regions agree along
+their shared edge. The grid is built row by row: each lattice row pair is
+blended once per output row, and the per-column interpolation weights are
+precomputed, so the inner loop is a single list comprehension per row and
+octave.
+
+Value noise is not uniformly distributed (values cluster around the
+middle), so ``quantile_cutoffs`` turns "this share of the cells" into the
+matching noise level by rank; a terrain table of chances then covers
+exactly those shares of the map.
+"""
+
+import math
+from collections.abc import Sequence
+
+_MASK = 0xFFFFFFFF
+
+
+def _lattice_value(seed: int, i: int, j: int) -> float:
+    """Random value in [0, 1) of lattice point (i, j): a stateless integer hash,
+    so any region of the plane can be built on its own and matches its
+    neighbours exactly."""
+    h = (i * 0x27D4EB2F + j * 0x165667B1 + seed * 0x9E3779B1) & _MASK
+    h ^= h >> 15
+    h = (h * 0x85EBCA6B) & _MASK
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK
+    h ^= h >> 16
+    return h / 4294967296.0
+
+
+def _smoothstep(t: float) -> float:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _octave(width: int, height: int, scale: float, seed: int, origin: tuple[int, int]) -> list[list[float]]:
+    ox, oy = origin
+    i0 = math.floor(ox / scale)
+    j0 = math.floor(oy / scale)
+    cols = math.floor((ox + width - 1) / scale) - i0 + 2
+    rows = math.floor((oy + height - 1) / scale) - j0 + 2
+    lattice = [[_lattice_value(seed, i0 + i, j0 + j) for i in range(cols)] for j in range(rows)]
+    # Per output column: lattice cell and smoothed weight toward the next one.
+    weights = []
+    for x in range(width):
+        fx = (ox + x) / scale
+        i = math.floor(fx)
+        weights.append((i - i0, _smoothstep(fx - i)))
+    grid = []
+    for y in range(height):
+        fy = (oy + y) / scale
+        j = math.floor(fy)
+        ty = _smoothstep(fy - j)
+        top, bottom = lattice[j - j0], lattice[j - j0 + 1]
+        row = [a + (b - a) * ty for a, b in zip(top, bottom, strict=True)]
+        grid.append([row[i] + (row[i + 1] - row[i]) * tx for i, tx in weights])
+    return grid
+
+
+def value_noise(
+    width: int,
+    height: int,
+    seed: int,
+    scale: float = 8.0,
+    octaves: int = 3,
+    persistence: float = 0.5,
+    origin: tuple[int, int] = (0, 0),
+) -> list[list[float]]:
+    """Smooth noise in [0, 1), ``grid[y][x]``; the same seed gives the same grid.
+
+    Args:
+        scale: Cells per lattice step of the first (coarsest) octave.
+        octaves: Layers summed; each has half the scale of the previous.
+        persistence: Amplitude factor from one octave to the next.
+        origin: Plane coordinates of ``grid[0][0]``. Regions built with the
+            same seed line up seamlessly, so a large map can be generated
+            one chunk at a time.
+    """
+    total = [[0.0] * width for _ in range(height)]
+    amplitude, norm = 1.0, 0.0
+    for octave in range(octaves):
+        layer = _octave(width, height, max(scale, 1.0), (seed + octave * 0x632BE5AB) & _MASK, origin)
+        for out, row in zip(total, layer, strict=True):
+            out[:] = [a + b * amplitude for a, b in zip(out, row, strict=True)]
+        norm += amplitude
+        amplitude *= persistence
+        scale /= 2.0
+    return [[v / norm for v in row] for row in total]
+
+
+def quantile_cutoffs(grid: Sequence[Sequence[float]], shares: Sequence[float]) -> list[float]:
+    """Noise levels splitting off the top ``shares`` of the cells, highest band first.
+
+    ``shares=[0.09, 0.04]`` returns ascending cutoffs ``[c2, c1]`` such that
+    values >= c1 are the top 9% of cells and c2 <= value < c1 the next 4%.
+    ``bisect.bisect_right(cutoffs, value)`` then maps a value to its band:
+    ``len(shares)`` for the first share, ... 0 for "in none of them".
+    """
+    ordered = sorted(v for row in grid for v in row)
+    count = len(ordered)
+    cutoffs = []
+    covered = 0.0
+    for share in shares:
+        covered += share
+        rank = min(count - 1, max(0, int(round(count * (1.0 - covered)))))
+        cutoffs.append(ordered[rank] if covered < 1.0 else float("-inf"))
+    return cutoffs[::-1]
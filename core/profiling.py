@@ -0,0 +1,110 @@
+"""Per-system wall-time profiling.
+
+SystemProfiler times the ``process()`` calls of the systems attached to it.
+Attaching shadows a system's bound ``process`` with a timing wrapper on the
+instance (esper and the turn orchestrator call it unchanged); detaching
+removes the wrapper again, so a detached profiler costs nothing.
+
+For each system it keeps lifetime totals (calls, seconds) plus the most
+recent call durations in a ring buffer of ``history`` samples, which is
+what the debug overlay and the JSON dump report as last / mean / max.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+
+class SystemStats:
+    """Call count, total time and recent call durations of one system."""
+
+    __slots__ = ("calls", "total", "samples")
+
+    def __init__(self, history: int):
+        self.calls = 0
+        self.total = 0.0
+        self.samples: deque[float] = deque(maxlen=history)
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def to_dict(self) -> dict:
+        samples = self.samples
+        return {
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "last_ms": samples[-1] * 1000 if samples else 0.0,
+            "mean_ms": sum(samples) / len(samples) * 1000 if samples else 0.0,
+            "max_ms": max(samples) * 1000 if samples else 0.0,
+        }
+
+
+class SystemProfiler:
+    """Times process() of attached systems."""
+
+    def __init__(self, history: int = 120):
+        self.history = history
+        self.stats: dict[str, SystemStats] = {}
+        self._attached: dict[str, object] = {}
+
+    @property
+    def attached(self) -> bool:
+        return bool(self._attached)
+
+    def attach(self, systems: dict[str, object]) -> None:
+        """Start timing each ``{name: system}``; already attached names are skipped."""
+        for name, system in systems.items():
+            if system is None or name in self._attached:
+                continue
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = SystemStats(self.history)
+            system.process = _timed(system.process, stats)
+            self._attached[name] = system
+
+    def detach(self) -> None:
+        """Remove every timing wrapper (statistics are kept)."""
+        for system in self._attached.values():
+            vars(system).pop("process", None)
+        self._attached.clear()
+
+    def reset(self) -> None:
+        """Forget all statistics (attached systems stay attached)."""
+        for stats in self.stats.values():
+            stats.calls = 0
+            stats.total = 0.0
+            stats.samples.clear()
+
+    def snapshot(self) -> dict[str, dict]:
+        """``{name: {calls, total_ms, last_ms, mean_ms, max_ms}}``, slowest (mean) first."""
+        rows = {name: stats.to_dict() for name, stats in self.stats.items()}
+        return dict(sorted(rows.items(), key=lambda item: -item[1]["mean_ms"]))
+
+    def dump(self, filepath: str) -> None:
+        """Write the snapshot plus the raw ring-buffer samples (ms) as JSON."""
+        data = {
+            "history": self.history,
+            "systems": self.snapshot(),
+            "samples_ms": {name: [s * 1000 for s in stats.samples] for name, stats in self.stats.items()},
+        }
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+def _timed(process, stats: SystemStats):
+    perf_counter = time.perf_counter
+
+    def timed_process(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return process(*args, **kwargs)
+        finally:
+            stats.record(perf_counter() - start)
+
+    return timed_process
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import esper
 
 from config import DAWN_START, DAY_START, DN_SETTINGS, DUSK_START, NIGHT_START, TICKS_PER_HOUR
@@ -11,6 +13,9 @@ class WorldClockService:
 
     def __init__(self, total_ticks=0):
         self.total_ticks = total_ticks
+        # Inside hourly_dispatch(): only hour boundaries are dispatched.
+        self._hourly_only = False
+        self._undispatched = False
 
     @property
     def hour(self):
@@ -76,9 +81,32 @@ class WorldClockService:
 
     def advance(self, amount=1):
         """Increments total_ticks and dispatches event."""
+        previous_hour = self.total_ticks // TICKS_PER_HOUR
         self.total_ticks += amount
+        if self._hourly_only and self.total_ticks // TICKS_PER_HOUR == previous_hour:
+            self._undispatched = True
+            return
+        self._undispatched = False
         esper.dispatch_event("clock_tick", self.get_state())
 
+    @contextmanager
+    def hourly_dispatch(self):
+        """Coalesce ``clock_tick`` to hour boundaries for the duration of the block.
+
+        Every clock_tick subscriber (chronicle, economy, restock) works on
+        whole elapsed hours and ignores ticks within an hour, so during a
+        fast-forward the 59 in-between dispatches are pure overhead. The
+        final state is dispatched on exit if the last tick was swallowed.
+        """
+        self._hourly_only = True
+        try:
+            yield self
+        finally:
+            self._hourly_only = False
+            if self._undispatched:
+                self._undispatched = False
+                esper.dispatch_event("clock_tick", self.get_state())
+
     def get_state(self):
         """Returns a dictionary representation of the clock state."""
         return {
@@ -42,26 +42,26 @@ class SlotType(str, Enum):
     ACCESSORY = "accessory"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerTag:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateId:
     """Stores the registry template ID the entity was created from."""
 
     id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: int
     y: int
     layer: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Portal:
     target_map_id: str
     target_x: int
@@ -71,14 +71,14 @@ class Portal:
     travel_ticks: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Renderable:
     sprite: str
     layer: int
     color: tuple[int, int, int] = (255, 255, 255)
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     hp: int
     max_hp: int
@@ -100,7 +100,7 @@ class Stats:
     max_carry_weight: float = 20.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectiveStats:
     hp: int
     max_hp: int
@@ -112,7 +112,7 @@ class EffectiveStats:
     intelligence: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StatModifiers:
     hp: int = 0
     power: int = 0
@@ -122,7 +122,7 @@ class StatModifiers:
     intelligence: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Skills:
     """Learn-by-doing character progression (ROADMAP Phase I).
 
@@ -134,7 +134,7 @@ class Skills:
     xp: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Quality:
     """Crafted-item grade (ROADMAP Phase J).
 
@@ -147,7 +147,7 @@ class Quality:
     tier: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceNode:
     """A harvestable raw-material source on the map (ROADMAP Phase K).
 
@@ -162,71 +162,71 @@ class ResourceNode:
     ready_at: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Portable:
     weight: float  # kg
 
 
-@dataclass
+@dataclass(slots=True)
 class Equippable:
     slot: SlotType
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemMaterial:
     material: str  # e.g., 'iron', 'wood', 'glass'
 
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     items: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Equipment:
     slots: dict[SlotType, int | None] = field(default_factory=lambda: {s: None for s in SlotType})
 
 
-@dataclass
+@dataclass(slots=True)
 class Name:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Blocker:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AI:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnOrder:
     priority: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LightSource:
     radius: int
     # Lit only between dusk and dawn (street torches, campfires).
     night_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MovementRequest:
     dx: int
     dy: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackIntent:
     target_entity: int
     power_multiplier: float = 1.0  # abilities hit harder than a plain bump
 
 
-@dataclass
+@dataclass(slots=True)
 class Bleeding:
     """Status effect: loses HP at the end of each round (ROADMAP Phase G5).
 
@@ -237,7 +237,7 @@ class Bleeding:
     turns_left: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     name: str
     cost_mana: int = 0
@@ -248,13 +248,13 @@ class Action:
     power_multiplier: float = 1.0  # damage scale for attack abilities
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionList:
     actions: list[Action] = field(default_factory=list)
     selected_idx: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Targeting:
     origin_x: int
     origin_y: int
@@ -267,12 +267,12 @@ class Targeting:
     target_idx: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Corpse:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Description:
     base: str
     wounded_text: str = ""
@@ -289,13 +289,13 @@ class Description:
         return self.base
 
 
-@dataclass
+@dataclass(slots=True)
 class AIBehaviorState:
     state: AIState
     alignment: Alignment
 
 
-@dataclass
+@dataclass(slots=True)
 class Activity:
     current_activity: str = "IDLE"
     target_pos: tuple[int, int] | None = None
@@ -305,44 +305,44 @@ class Activity:
     need_override: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChaseData:
     last_known_x: int
     last_known_y: int
     turns_without_sight: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PathData:
     path: list[tuple[int, int]]
     destination: tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class LootTable:
     entries: list[tuple[str, float]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WanderData:
     """Stub component for wander state. Fields added when wander behavior is implemented."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Consumable:
     effect_type: str
     amount: int
     consumed_on_use: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     schedule_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Faction:
     """Which faction an NPC belongs to (Phase L slice 4).
 
@@ -354,7 +354,7 @@ class Faction:
     faction_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationships:
     """How an NPC feels about specific other townsfolk (Phase L slice 3).
 
@@ -366,7 +366,7 @@ class Relationships:
     affinity: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PatrolRoute:
     """A guard's looping beat. Assigned by ScheduleSystem the first time a
     PATROL entry with a `route` is encountered. `index` is staggered per
@@ -377,7 +377,7 @@ class PatrolRoute:
     index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Residence:
     """Where an NPC belongs in town, assigned once at village build by
     HousingService (capacity-based housing).
@@ -401,7 +401,7 @@ class Residence:
     patrol_route: list | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FCT:
     text: str
     color: tuple[int, int, int]
@@ -413,28 +413,28 @@ class FCT:
     offset_y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MapBound:
     """Marker component. Indicates entity belongs to the current map and should be frozen along with it."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Purse:
     """Gold carried by an entity (player or NPC)."""
 
     gold: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Value:
     """Base trade value of an item in gold."""
 
     amount: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Merchant:
     """Marks an NPC as a trader. Stock is a list of item template ids —
     fungible goods, not item entities, so freeze/thaw never dangles.
@@ -447,7 +447,7 @@ class Merchant:
     base_stock: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Animal:
     """Marker: wildlife. Bumping attacks (no dialogue), and hunting
     neutral animals never costs reputation."""
@@ -455,7 +455,7 @@ class Animal:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Hidden:
     """Marker: entity is concealed until revealed (ROADMAP Phase F).
 
@@ -467,7 +467,7 @@ class Hidden:
     reveal_radius: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class Skirmisher:
     """Locked in battle with a rival faction (travel encounters).
 
@@ -479,21 +479,21 @@ class Skirmisher:
     side: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestGiver:
     """Marker: bumping this NPC opens the quest window (ROADMAP Phase E)."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Innkeeper:
     """Marker: bumping this NPC opens the rest/sleep duration picker."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Needs:
     """Physical needs that can preempt an NPC's schedule (ROADMAP Phase D).
 
@@ -0,0 +1,220 @@
+"""Compiled content cache: JSON assets pre-parsed into one memory-mapped blob.
+
+Every start (and every new run) used to ``json.load`` the whole of
+``assets/data`` — tiles, entities, items, recipes, schedules, dialogues,
+world, factions, quests, events, biomes and the scenarios. The cache
+compiles each parsed document into a ``marshal`` record inside a single
+binary file; later starts memory-map that file and unmarshal only the
+documents the loaders actually ask for, skipping the JSON parser entirely.
+
+File layout::
+
+    MAGIC | u32 header length | marshal(header) | payload ...
+
+The header maps each source path (relative to the data directory) to
+``[mtime_ns, size, crc32, offset, length]``. A record is trusted while the
+source's mtime and size are unchanged; when they differ the file is
+re-hashed, and only files whose CRC32 really changed are re-parsed before
+the blob is rewritten. Malformed JSON is never cached, so the loaders still
+raise their usual ``ValueError`` for it.
+
+The cache is opt-in: ``bootstrap`` opens the default instance before loading
+content. Without an open cache ``read_json`` is a plain ``json.load``, which
+keeps tests independent of any file on disk.
+"""
+
+import json
+import logging
+import marshal
+import mmap
+import os
+import struct
+import zlib
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RLCC\x01"
+_HEADER_LEN = struct.Struct("<I")
+
+
+class ContentCache:
+    """Memory-mapped, mtime/hash-validated cache of parsed JSON documents."""
+
+    def __init__(self):
+        self.data_dir: str | None = None
+        self.cache_path: str | None = None
+        # relpath -> [mtime_ns, size, crc32, offset, length]
+        self._index: dict[str, list[int]] = {}
+        self._mmap: mmap.mmap | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.data_dir is not None
+
+    def open(self, data_dir: str, cache_path: str) -> "ContentCache":
+        """Validate (rebuilding if stale) and map the cache for data_dir.
+
+        Any I/O problem with the cache file itself is logged and the cache
+        stays closed — content then loads straight from JSON as before.
+        """
+        self.close()
+        data_dir = os.path.realpath(data_dir)
+        try:
+            old_index, old_blob = self._read_existing(cache_path)
+            index, changed = self._refresh(data_dir, old_index)
+            if changed or not os.path.exists(cache_path):
+                self._write(cache_path, data_dir, index, old_blob)
+            self._map(cache_path)
+        except OSError as exc:
+            logger.warning(f"Content cache disabled ({cache_path}): {exc}")
+            self.close()
+            return self
+        self.data_dir = data_dir
+        self.cache_path = cache_path
+        return self
+
+    def close(self) -> None:
+        """Unmap the blob; read_json falls back to plain JSON parsing."""
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = None
+        self._index = {}
+        self.data_dir = None
+        self.cache_path = None
+
+    def get(self, filepath: str):
+        """Return a fresh copy of the cached document for filepath, or None
+        if it is not covered by the cache (or its source changed since)."""
+        if self._mmap is None:
+            return None
+        real = os.path.realpath(filepath)
+        rel = os.path.relpath(real, self.data_dir)
+        entry = self._index.get(rel)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(real)
+        except OSError:
+            return None
+        if st.st_mtime_ns != entry[0] or st.st_size != entry[1]:
+            return None
+        offset, length = entry[3], entry[4]
+        return marshal.loads(self._mmap[offset : offset + length])
+
+    # ------------------------------------------------------------------
+    # Build / validation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_existing(cache_path: str) -> tuple[dict, bytes]:
+        """Load the previous header and payload, or empty on any mismatch."""
+        if not os.path.exists(cache_path):
+            return {}, b""
+        with open(cache_path, "rb") as f:
+            blob = f.read()
+        if not blob.startswith(MAGIC):
+            return {}, b""
+        start = len(MAGIC) + _HEADER_LEN.size
+        try:
+            (header_len,) = _HEADER_LEN.unpack_from(blob, len(MAGIC))
+            index = marshal.loads(blob[start : start + header_len])
+        except (struct.error, EOFError, ValueError, TypeError):
+            return {}, b""
+        if not isinstance(index, dict):
+            return {}, b""
+        return index, blob[start + header_len :]
+
+    @staticmethod
+    def _refresh(data_dir: str, old_index: dict) -> tuple[dict, bool]:
+        """Stat every JSON file; re-hash the ones whose stat changed.
+
+        Returns the new index (offsets still pointing into the old payload
+        for unchanged records, -1 for records that must be re-parsed) and
+        whether anything differs from the previous index.
+        """
+        index: dict[str, list[int]] = {}
+        changed = False
+        for rel in _json_files(data_dir):
+            st = os.stat(os.path.join(data_dir, rel))
+            prev = old_index.get(rel)
+            if prev is not None and prev[0] == st.st_mtime_ns and prev[1] == st.st_size:
+                index[rel] = list(prev)
+                continue
+            changed = True
+            with open(os.path.join(data_dir, rel), "rb") as f:
+                crc = zlib.crc32(f.read())
+            if prev is not None and prev[2] == crc:
+                # Touched but identical content: keep the compiled record.
+                index[rel] = [st.st_mtime_ns, st.st_size, crc, prev[3], prev[4]]
+            else:
+                index[rel] = [st.st_mtime_ns, st.st_size, crc, -1, 0]
+        if set(index) != set(old_index):
+            changed = True
+        return index, changed
+
+    @staticmethod
+    def _write(cache_path: str, data_dir: str, index: dict, old_blob: bytes) -> None:
+        """Compile re-parsed records and rewrite the blob atomically."""
+        payload = bytearray()
+        final: dict[str, list[int]] = {}
+        for rel, (mtime_ns, size, crc, offset, length) in index.items():
+            if offset >= 0:
+                record = old_blob[offset : offset + length]
+            else:
+                try:
+                    with open(os.path.join(data_dir, rel), encoding="utf-8") as f:
+                        record = marshal.dumps(json.load(f))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Leave malformed files to the loaders' own error paths.
+                    continue
+            final[rel] = [mtime_ns, size, crc, len(payload), len(record)]
+            payload += record
+        header = marshal.dumps(final)
+
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LEN.pack(len(header)))
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Compiled content cache with {len(final)} documents.")
+
+    def _map(self, cache_path: str) -> None:
+        """Memory-map the blob and adopt its header (offsets made absolute)."""
+        # mmap keeps its own handle, so the file object can be closed at once.
+        with open(cache_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (header_len,) = _HEADER_LEN.unpack_from(self._mmap, len(MAGIC))
+        start = len(MAGIC) + _HEADER_LEN.size
+        index = marshal.loads(self._mmap[start : start + header_len])
+        base = start + header_len
+        self._index = {rel: [e[0], e[1], e[2], base + e[3], e[4]] for rel, e in index.items()}
+
+
+def _json_files(data_dir: str) -> list[str]:
+    """All *.json files under data_dir, as sorted relative paths."""
+    found = []
+    for root, _dirs, files in os.walk(data_dir):
+        for name in files:
+            if name.endswith(".json"):
+                found.append(os.path.relpath(os.path.join(root, name), data_dir))
+    return sorted(found)
+
+
+# Module-level default instance, opened by bootstrap.
+content_cache = ContentCache()
+
+
+def read_json(filepath: str, encoding: str = "utf-8"):
+    """Parse a JSON asset, served from the compiled cache when it is open.
+
+    Raises exactly what ``json.load`` would (FileNotFoundError,
+    JSONDecodeError), so callers keep their existing error handling.
+    """
+    data = content_cache.get(filepath)
+    if data is not None:
+        return data
+    with open(filepath, encoding=encoding) as f:
+        return json.load(f)
@@ -36,6 +36,11 @@ class ContentDatabase:
         self.dialogues.load(f"{data_dir}/dialogues.json")
         return self
 
+    @property
+    def is_loaded(self) -> bool:
+        """True once load() has populated the registries (tiles at least)."""
+        return bool(self.tiles.all_ids())
+
     def clear_all(self) -> None:
         """Empty every registry (used by tests)."""
         self.tiles.clear()
@@ -26,6 +26,8 @@ import logging
 import os
 import random
 
+from game.content.content_cache import read_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,8 @@ class DialogueService:
         # directions out of the current town the first time you ask (wired in
         # bootstrap). Takes priority over rumors/smalltalk when it fires.
         self.directions_provider = None
+        # Line choice; seeded per world in bootstrap so a run replays exactly.
+        self.rng = random.Random()
 
     def load(self, filepath: str) -> None:
         """Load dialogue definitions from a JSON file.
@@ -59,8 +63,7 @@ class DialogueService:
             raise FileNotFoundError(f"Dialogue file not found: '{filepath}'")
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(filepath)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed JSON in dialogue file '{filepath}': {exc}") from exc
 
@@ -98,7 +101,7 @@ class DialogueService:
         lines = self._select_lines(entry, context or {})
         if not lines:
             return "..."
-        return random.choice(lines)
+        return self.rng.choice(lines)
 
     @staticmethod
     def _select_lines(entry, context: dict) -> list[str] | None:
@@ -11,6 +11,7 @@ import os
 
 from config import SpriteLayer
 from game.components import AIState, Alignment
+from game.content.content_cache import read_json
 from game.content.entity_registry import EntityRegistry, EntityTemplate, entity_registry
 from game.content.item_registry import ItemRegistry, ItemTemplate, item_registry
 from game.content.recipe_registry import Recipe, RecipeRegistry, recipe_registry
@@ -38,8 +39,7 @@ class ResourceLoader:
             raise FileNotFoundError(f"Schedule resource file not found: '{filepath}'.")
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(filepath)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed JSON in schedule resource file '{filepath}': {exc}") from exc
 
@@ -103,8 +103,7 @@ class ResourceLoader:
             )
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(filepath)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed JSON in tile resource file '{filepath}': {exc}") from exc
 
@@ -179,8 +178,7 @@ class ResourceLoader:
             )
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(filepath)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed JSON in entity resource file '{filepath}': {exc}") from exc
 
@@ -296,8 +294,7 @@ class ResourceLoader:
             )
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(filepath)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed JSON in item resource file '{filepath}': {exc}") from exc
 
@@ -350,8 +347,7 @@ class ResourceLoader:
             )
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(filepath)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed JSON in recipe resource file '{filepath}': {exc}") from exc
 
@@ -9,7 +9,8 @@ import logging
 
 import pygame
 
-from config import UI_MODAL_RECT, UI_REST_RECT, GameStates
+from config import EVENT_PROFILE_DUMP_FILE, PROFILE_DUMP_FILE, UI_MODAL_RECT, UI_REST_RECT, GameStates
+from core.event_bus import event_bus
 from core.input_manager import InputCommand
 from game.services import rest_service
 from game.services.player_action_service import PlayerActionService
@@ -88,6 +89,15 @@ class InputController:
         if not flags.master:
             return False
 
+        if command == InputCommand.DEBUG_TOGGLE_PROFILER:
+            self._toggle_profiler()
+            return True
+        if command == InputCommand.DEBUG_DUMP_PROFILE:
+            self.ctx.profiler.dump(PROFILE_DUMP_FILE)
+            event_bus.dump(EVENT_PROFILE_DUMP_FILE)
+            logger.info(f"System / event profiles written to {PROFILE_DUMP_FILE}, {EVENT_PROFILE_DUMP_FILE}")
+            return True
+
         toggles = {
             InputCommand.DEBUG_TOGGLE_PLAYER_FOV: "player_fov",
             InputCommand.DEBUG_TOGGLE_NPC_FOV: "npc_fov",
@@ -101,6 +111,17 @@ class InputController:
         logger.debug(f"Debug {attr}: {getattr(flags, attr)}")
         return True
 
+    def _toggle_profiler(self) -> None:
+        """Attach the system profiler (and time event handlers) while its overlay is on."""
+        flags = self.ctx.debug_flags
+        flags.profiler = not flags.profiler
+        event_bus.timing = flags.profiler
+        if flags.profiler:
+            self.ctx.profiler.attach(self.ctx.systems.profiled())
+        else:
+            self.ctx.profiler.detach()
+        logger.debug(f"Debug profiler: {flags.profiler}")
+
     def handle_player_input(self, command, game_instance):
         if self._handle_debug_toggle(command):
             return
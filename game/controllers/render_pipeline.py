@@ -54,7 +54,7 @@ class RenderPipeline:
 
         # 3. Debug overlay
         if ctx.debug_flags.master and systems.debug_render_system:
-            systems.debug_render_system.process(surface, ctx.debug_flags, player_layer)
+            systems.debug_render_system.process(surface, ctx.debug_flags, player_layer, ctx.profiler)
 
         # 4. Day/night viewport tint
         tint_color = ctx.world_clock.get_interpolated_tint()
@@ -6,8 +6,11 @@ AISystem -> back to PLAYER_TURN.
 
 import esper
 
-from config import GameStates
-from game.components import AIBehaviorState, AIState, Alignment, Position, Stats
+from config import FAST_FORWARD_NEAR_RADIUS, GameStates
+from core.event_bus import event_bus
+from game.components import AIBehaviorState, AIState, Alignment, Blocker, Position, Skirmisher, Stats
+from game.map.layer_partition import on_layer
+from game.services.world_simulation_service import WorldSimulationService
 
 
 class TurnOrchestrator:
@@ -40,22 +43,25 @@ class TurnOrchestrator:
         # Phase systems run during the enemy turn
         self._run_enemy_phase()
 
-    def _run_enemy_phase(self, ambient: bool = True) -> None:
+    def _run_enemy_phase(self, ambient: bool = True, dormant=frozenset()) -> None:
         """Run the enemy-turn phase systems if it is currently the enemy turn.
 
         ScheduleSystem/AISystem etc. only act during ENEMY_TURN; AISystem ends
         the enemy turn, flipping the state back to PLAYER_TURN. Ambient flavour
         (NPC gossip) is skipped during fast-forward (``ambient=False``) so a
-        long rest doesn't flood the log.
+        long rest doesn't flood the log, and ``dormant`` NPCs are not stepped.
         """
         ctx = self.ctx
         if ctx.systems.turn_system.current_state != GameStates.ENEMY_TURN:
             return
         player_layer = self._player_layer()
+        map_container = ctx.map_container
         ctx.systems.status_effect_system.process()
-        ctx.systems.schedule_system.process(ctx.world_clock, ctx.map_container)
-        ctx.systems.needs_system.process(ctx.map_container)
-        ctx.systems.ai_system.process(ctx.systems.turn_system, ctx.map_container, player_layer, ctx.player_entity)
+        ctx.systems.schedule_system.process(ctx.world_clock, map_container, dormant)
+        ctx.systems.needs_system.process(map_container, dormant)
+        ctx.systems.ai_system.process(
+            ctx.systems.turn_system, map_container, player_layer, ctx.player_entity, dormant=dormant
+        )
         if ambient:
             ctx.systems.gossip_system.process(ctx, player_layer)
 
@@ -64,35 +70,83 @@ class TurnOrchestrator:
     def advance_turns(self, ticks: int) -> dict:
         """Fast-forward up to `ticks` full turn cycles (resting / waiting).
 
-        Runs the normal turn loop — frame processors plus the enemy phase —
-        once per tick, without rendering, so the world clock, NPC schedules
-        and needs all advance faithfully. Stops early if the player is
-        threatened: a hostile begins hunting (CHASE) on the player's layer,
-        or the player loses HP during a round.
+        Runs the turn loop without rendering, cut down to what can change the
+        outcome of a rest:
+
+        - Only the simulating frame processors run per tick (see
+          ``Systems.fast_forward_processors``); the player's FOV catches up
+          on all elapsed rounds once at the end.
+        - ``clock_tick`` is dispatched once per hour boundary — every
+          subscriber works on whole hours anyway — and coalescible
+          subscribers (chronicle, economy) get a single catch-up call when
+          the rest ends. Merchant restock still runs hourly and first
+          advances the economy and the chronicle to each hour it reads
+          (``advance_to_hour``), so escalations due mid-rest count.
+        - Hostiles and NPCs within FAST_FORWARD_NEAR_RADIUS of the player
+          are stepped turn by turn. Friendly NPCs further away (or on other
+          layers) stay dormant and are snapped to their schedule position
+          afterwards, the same reconciliation a map gets on re-entry.
+
+        Stops early if the player is threatened: a hostile begins hunting
+        (CHASE) on the player's layer, or the player loses HP during a round.
 
         Returns a summary dict ``{"elapsed": int, "interrupted": bool}``.
         """
         player = self.ctx.player_entity
         elapsed = 0
         interrupted = False
-        for _ in range(max(0, ticks)):
-            if self._threatened(player):
-                interrupted = True
-                break
-            hp_before = self._player_hp(player)
-            self._advance_one_round()
-            elapsed += 1
-            if self._player_hp(player) < hp_before:
-                interrupted = True
-                break
+        dormant = self._dormant_npcs(player)
+        with event_bus.coalescing("clock_tick"), self.ctx.world_clock.hourly_dispatch():
+            for _ in range(max(0, ticks)):
+                if self._threatened(player):
+                    interrupted = True
+                    break
+                hp_before = self._player_hp(player)
+                self._advance_one_round(dormant)
+                elapsed += 1
+                if self._player_hp(player) < hp_before:
+                    interrupted = True
+                    break
+        if elapsed:
+            self._wake_dormant(dormant, elapsed)
+            self.ctx.systems.visibility_system.process(0, catch_up=True)
         return {"elapsed": elapsed, "interrupted": interrupted}
 
-    def _advance_one_round(self) -> None:
+    def _advance_one_round(self, dormant=frozenset()) -> None:
         """Run one full PLAYER->ENEMY->PLAYER cycle with no player action."""
         turn_system = self.ctx.systems.turn_system
         turn_system.end_player_turn()  # -> ENEMY_TURN, world clock +1
-        esper.process(0)  # frame processors apply queued movement / combat
-        self._run_enemy_phase(ambient=False)  # phase systems -> end_enemy_turn -> PLAYER_TURN
+        esper.clear_dead_entities()  # what esper.process() would do first
+        for processor in self.ctx.systems.fast_forward_processors():
+            processor.process(0)  # apply queued movement / combat
+        self._run_enemy_phase(ambient=False, dormant=dormant)  # phase systems -> end_enemy_turn -> PLAYER_TURN
+
+    def _dormant_npcs(self, player) -> set[int]:
+        """Friendly NPCs too far from the player to be stepped during a rest."""
+        player_pos = esper.try_component(player, Position) if player is not None else None
+        dormant = set()
+        for ent, (behavior, pos) in esper.get_components(AIBehaviorState, Position):
+            # Anything that can start a fight keeps full fidelity, so the
+            # interruption rules see exactly what they would tick by tick.
+            if behavior.alignment == Alignment.HOSTILE or esper.has_component(ent, Skirmisher):
+                continue
+            if (
+                player_pos is None
+                or pos.layer != player_pos.layer
+                or max(abs(pos.x - player_pos.x), abs(pos.y - player_pos.y)) > FAST_FORWARD_NEAR_RADIUS
+            ):
+                dormant.add(ent)
+        return dormant
+
+    def _wake_dormant(self, dormant: set[int], elapsed: int) -> None:
+        """Put dormant NPCs where their schedule has them after `elapsed` ticks."""
+        dormant = {ent for ent in dormant if esper.entity_exists(ent)}
+        if not dormant or self.ctx.map_container is None:
+            return
+        occupied = {(pos.x, pos.y) for ent, (pos, _) in esper.get_components(Position, Blocker) if ent not in dormant}
+        WorldSimulationService.reconcile_arrivals(
+            esper, self.ctx.map_container, self.ctx.world_clock.hour, elapsed, entities=dormant, occupied=occupied
+        )
 
     def _threatened(self, player) -> bool:
         """True if a hostile is actively hunting the player on their layer."""
@@ -100,9 +154,7 @@ class TurnOrchestrator:
             player_pos = esper.component_for_entity(player, Position)
         except KeyError:
             return False
-        for _ent, (behavior, pos) in esper.get_components(AIBehaviorState, Position):
-            if pos.layer != player_pos.layer:
-                continue
+        for _ent, (behavior, _pos) in on_layer(player_pos.layer, AIBehaviorState, Position):
             if behavior.alignment == Alignment.HOSTILE and behavior.state == AIState.CHASE:
                 return True
         return False
@@ -0,0 +1,299 @@
+"""A map that exists one chunk at a time around the player.
+
+A ChunkedMapContainer covers a large region (a streamed wilderness) split
+into square chunks of ``chunk_size`` tiles. Only the chunks near the player
+are *loaded* — real Tiles in the layer grids, their entities live in the
+world. Every other cell of the grids points at one shared, blocking void
+tile, so the familiar ``layers[i].tiles[y][x]`` access keeps working for
+renderers, pathfinding and FOV without any of them knowing about chunks.
+
+Chunks come into being lazily: the first time one is needed its terrain
+and population are generated from the map's seed by a *chunk source*
+(see ``register_chunk_source``). When the player moves away a chunk is
+evicted to a ChunkRecord — palette indices and visibility packed into
+zlib-compressed bytes plus its frozen entities — and is restored from it
+on return. Chunks never visited cost nothing, so memory aging, freeze /
+thaw and saving scale with the loaded area and the explored chunks rather
+than with the size of the region.
+"""
+
+import zlib
+from dataclasses import dataclass, field
+
+from core.ecs import create_entities
+from game.map.frozen_entities import FrozenEntities
+from game.map.map_container import MapContainer
+from game.map.map_layer import MapLayer
+from game.map.tile import Tile, VisibilityState, resolve_tile_type
+
+# Tiles per chunk side.
+CHUNK_SIZE = 16
+# Chunks (Chebyshev, in chunk units) kept loaded around the player's chunk.
+# Two chunks of margin keep every FOV and light radius inside loaded ground.
+LOAD_RADIUS = 2
+
+# Chunk source kind -> class, for rebuilding a container from a save.
+CHUNK_SOURCES: dict[str, type] = {}
+
+
+def register_chunk_source(cls: type) -> type:
+    """Class decorator registering a chunk source under its ``kind``.
+
+    A chunk source generates chunks on first load. It provides:
+
+    - ``kind`` (class attribute) and ``palette`` (type ids; the first
+      entries of the container's palette)
+    - ``generate(cx, cy, x0, y0, w, h)`` -> one grid of palette indices
+      per layer
+    - ``populate(world, container, cx, cy)`` -> create the chunk's entities
+      (called once, after its tiles are in place)
+    - ``to_dict()`` / ``from_dict(data)`` for saving
+    """
+    CHUNK_SOURCES[cls.kind] = cls
+    return cls
+
+
+class _VoidTile(Tile):
+    """Stand-in for every cell of an unloaded chunk: blocks movement and
+    sight, and is never seen or remembered."""
+
+    __slots__ = ()
+
+    @property
+    def visibility_state(self) -> VisibilityState:
+        return VisibilityState.UNEXPLORED
+
+    @visibility_state.setter
+    def visibility_state(self, _state: VisibilityState) -> None:
+        pass
+
+
+@dataclass
+class ChunkRecord:
+    """A generated chunk in compact form (evicted, or snapshotted for a save).
+
+    ``types`` and ``visibility`` hold one byte per tile — palette index and
+    VisibilityState value — layer by layer in row-major order, zlib
+    compressed. ``rounds`` keeps only the non-zero memory counters.
+    """
+
+    types: bytes
+    visibility: bytes
+    rounds: dict[int, int] = field(default_factory=dict)
+    entities: FrozenEntities = field(default_factory=FrozenEntities)
+    evicted_round: int = 0
+
+
+class ChunkedMapContainer(MapContainer):
+    """A large map streamed in chunks around the player (see module docstring)."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        source,
+        chunk_size: int = CHUNK_SIZE,
+        load_radius: int = LOAD_RADIUS,
+        layer_count: int = 1,
+        arrival_pos: tuple[int, int] | None = None,
+    ):
+        self.void_tile = _VoidTile(transparent=False, sprites={})
+        layers = [MapLayer([[self.void_tile] * width for _ in range(height)]) for _ in range(layer_count)]
+        super().__init__(layers, arrival_pos=arrival_pos)
+        self.source = source
+        self.chunk_size = chunk_size
+        self.load_radius = load_radius
+        self.palette: list[str] = list(source.palette)
+        self._palette_index = {type_id: i for i, type_id in enumerate(self.palette)}
+        self.loaded: set[tuple[int, int]] = set()
+        self.evicted: dict[tuple[int, int], ChunkRecord] = {}
+
+    # --- Geometry --------------------------------------------------------------
+
+    @property
+    def chunk_columns(self) -> int:
+        return -(-self.width // self.chunk_size)
+
+    @property
+    def chunk_rows(self) -> int:
+        return -(-self.height // self.chunk_size)
+
+    def chunk_of(self, x: int, y: int) -> tuple[int, int]:
+        """The chunk containing tile (x, y)."""
+        return (x // self.chunk_size, y // self.chunk_size)
+
+    def chunk_bounds(self, cx: int, cy: int) -> tuple[int, int, int, int]:
+        """(x0, y0, width, height) of a chunk, clipped to the map edge."""
+        x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+        return (x0, y0, min(self.chunk_size, self.width - x0), min(self.chunk_size, self.height - y0))
+
+    def is_generated(self, cx: int, cy: int) -> bool:
+        return (cx, cy) in self.loaded or (cx, cy) in self.evicted
+
+    def sample_position(self, rng, margin: int = 2) -> tuple[int, int]:
+        """A random (x, y) inside a random loaded chunk, `margin` from the map edge."""
+        if not self.loaded:
+            return super().sample_position(rng, margin)
+        x0, y0, w, h = self.chunk_bounds(*rng.choice(sorted(self.loaded)))
+        x = rng.randint(max(margin, x0), min(self.width - 1 - margin, x0 + w - 1))
+        y = rng.randint(max(margin, y0), min(self.height - 1 - margin, y0 + h - 1))
+        return (x, y)
+
+    def iter_tile_rows(self):
+        """Rows of the loaded chunks only; void cells carry no state."""
+        for cx, cy in self.loaded:
+            x0, y0, w, h = self.chunk_bounds(cx, cy)
+            for layer in self.layers:
+                for y in range(y0, y0 + h):
+                    yield layer.tiles[y][x0 : x0 + w]
+
+    # --- Streaming ---------------------------------------------------------------
+
+    def stream(self, world, x: int, y: int, current_round: int = 0, exclude_entities=()) -> bool:
+        """Load every chunk within ``load_radius`` of the one holding (x, y)
+        and evict loaded chunks more than one chunk beyond that.
+
+        The one-chunk band between the two radii keeps a player pacing along
+        a chunk border from evicting and reloading the same chunk each step.
+        ``exclude_entities`` (the player's party) are never evicted. Returns
+        True if any chunk was loaded or evicted.
+        """
+        pcx, pcy = self.chunk_of(x, y)
+        keep = self.load_radius + 1
+        far = {(cx, cy) for cx, cy in self.loaded if max(abs(cx - pcx), abs(cy - pcy)) > keep}
+        if far:
+            self.evict_chunks(world, far, current_round, exclude_entities)
+        wanted = [
+            (cx, cy)
+            for cy in range(max(0, pcy - self.load_radius), min(self.chunk_rows, pcy + self.load_radius + 1))
+            for cx in range(max(0, pcx - self.load_radius), min(self.chunk_columns, pcx + self.load_radius + 1))
+            if (cx, cy) not in self.loaded
+        ]
+        for cx, cy in wanted:
+            self.load_chunk(world, cx, cy, current_round)
+        return bool(far or wanted)
+
+    def load_chunk(self, world, cx: int, cy: int, current_round: int = 0) -> None:
+        """Bring a chunk in: restore it from its record or generate it."""
+        if (cx, cy) in self.loaded:
+            return
+        record = self.evicted.pop((cx, cy), None)
+        if record is not None:
+            self.restore_chunk(cx, cy, record, elapsed=max(0, current_round - record.evicted_round))
+            create_entities(record.entities.component_dicts())
+            return
+        x0, y0, w, h = self.chunk_bounds(cx, cy)
+        grids = self.source.generate(cx, cy, x0, y0, w, h)
+        types = [resolve_tile_type(type_id) for type_id in self.palette]
+        for layer, grid in zip(self.layers, grids, strict=True):
+            for y, grid_row in enumerate(grid, start=y0):
+                layer.write_span(x0, y, [Tile.of_type(types[index]) for index in grid_row])
+        self.loaded.add((cx, cy))
+        self.source.populate(world, self, cx, cy)
+
+    def evict_chunks(self, world, chunks, current_round: int = 0, exclude_entities=()) -> None:
+        """Pack loaded chunks into records and lift their entities out of the world."""
+        from game.components import MapBound, Position
+
+        chunks = set(chunks) & self.loaded
+        if not chunks:
+            return
+        excluded = set(exclude_entities)
+        residents: dict[tuple[int, int], list[int]] = {chunk: [] for chunk in chunks}
+        for ent, (_bound, pos) in world.get_components(MapBound, Position):
+            bucket = residents.get(self.chunk_of(pos.x, pos.y))
+            if bucket is not None and ent not in excluded:
+                bucket.append(ent)
+        for chunk, entities in residents.items():
+            record = self.snapshot_chunk(*chunk)
+            record.entities = self._extract_frozen(entities)
+            record.evicted_round = current_round
+            self._clear_chunk(*chunk)
+            self.evicted[chunk] = record
+        world.clear_dead_entities()
+
+    # --- Records -------------------------------------------------------------------
+
+    def snapshot_chunk(self, cx: int, cy: int) -> ChunkRecord:
+        """Encode a loaded chunk's tiles (not its entities) as a record.
+
+        Tiles still VISIBLE are recorded as freshly SHROUDED, as on_exit does.
+        """
+        x0, y0, w, h = self.chunk_bounds(cx, cy)
+        types, visibility = bytearray(), bytearray()
+        rounds = {}
+        index = 0
+        for layer in self.layers:
+            for y in range(y0, y0 + h):
+                for tile in layer.tiles[y][x0 : x0 + w]:
+                    types.append(self.palette_slot(tile.type_id))
+                    state = tile.visibility_state
+                    if state == VisibilityState.VISIBLE:
+                        state = VisibilityState.SHROUDED
+                    elif tile.rounds_since_seen:
+                        rounds[index] = tile.rounds_since_seen
+                    visibility.append(state.value)
+                    index += 1
+        return ChunkRecord(zlib.compress(bytes(types)), zlib.compress(bytes(visibility)), rounds)
+
+    def restore_chunk(self, cx: int, cy: int, record: ChunkRecord, elapsed: int = 0) -> None:
+        """Rebuild a chunk's tiles from a record and mark it loaded.
+
+        Remembered tiles age by ``elapsed`` rounds, like the tiles of a map
+        on re-entry; VisibilitySystem forgets them on its next aging pass.
+        Entities are the caller's business.
+        """
+        x0, y0, w, h = self.chunk_bounds(cx, cy)
+        types = [resolve_tile_type(type_id) for type_id in self.palette]
+        type_bytes = zlib.decompress(record.types)
+        visibility_bytes = zlib.decompress(record.visibility)
+        rounds = record.rounds
+        unexplored = VisibilityState.UNEXPLORED
+        index = 0
+        for layer in self.layers:
+            for y in range(y0, y0 + h):
+                row = []
+                for _ in range(w):
+                    tile = Tile.of_type(types[type_bytes[index]])
+                    state = VisibilityState(visibility_bytes[index])
+                    if state != unexplored:
+                        tile.visibility_state = state
+                        tile.rounds_since_seen = rounds.get(index, 0) + elapsed
+                    row.append(tile)
+                    index += 1
+                layer.write_span(x0, y, row)
+        self.loaded.add((cx, cy))
+
+    def _clear_chunk(self, cx: int, cy: int) -> None:
+        x0, y0, w, h = self.chunk_bounds(cx, cy)
+        void_row = [self.void_tile] * w
+        for layer in self.layers:
+            for y in range(y0, y0 + h):
+                layer.write_span(x0, y, void_row)
+        self.loaded.discard((cx, cy))
+
+    def palette_slot(self, type_id: str | None) -> int:
+        """Palette index of `type_id`, appending it on first use."""
+        type_id = type_id or "floor_stone"  # legacy tiles save as stone, as in encode_map
+        slot = self._palette_index.get(type_id)
+        if slot is None:
+            if len(self.palette) >= 256:
+                raise ValueError("ChunkedMapContainer palette is limited to 256 tile types.")
+            slot = self._palette_index[type_id] = len(self.palette)
+            self.palette.append(type_id)
+        return slot
+
+    # --- Whole-map transitions -------------------------------------------------------
+
+    def forget_all(self):
+        """Forget the loaded chunks and every evicted one."""
+        super().forget_all()
+        remembered = (VisibilityState.VISIBLE.value, VisibilityState.SHROUDED.value)
+        forgotten = VisibilityState.FORGOTTEN.value
+        for record in self.evicted.values():
+            states = bytearray(zlib.decompress(record.visibility))
+            for index, state in enumerate(states):
+                if state in remembered:
+                    states[index] = forgotten
+                    record.rounds[index] = 1000  # Ensure it stays forgotten
+            record.visibility = zlib.compress(bytes(states))
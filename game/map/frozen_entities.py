@@ -0,0 +1,94 @@
+"""Column-oriented storage for a frozen map's entities.
+
+A frozen entity used to be a Python list of its component objects, one
+list per entity, gathered by probing every known component type with
+try/except. FrozenEntities instead keeps one column per component type:
+the row numbers (entity index within this store) that carry the type and
+the component instances, in parallel lists. Freezing reads esper's
+per-entity component dicts directly; thawing rebuilds them column by
+column and hands them to ``core.ecs.create_entities`` in one batch.
+
+For callers that think in entities (save serialization, tests, quest and
+spawn checks) the store still iterates as a sequence of per-entity
+component lists and compares equal to such a list.
+"""
+
+from collections.abc import Iterable, Iterator
+
+
+class FrozenEntities:
+    """Frozen entities stored as per-component-type columns."""
+
+    __slots__ = ("_count", "_columns")
+
+    def __init__(self):
+        self._count = 0
+        # component type -> (row indices, component instances)
+        self._columns: dict[type, tuple[list[int], list]] = {}
+
+    @classmethod
+    def from_component_dicts(cls, component_dicts: Iterable[dict]) -> "FrozenEntities":
+        """Build from esper-style ``{type: instance}`` dicts, one per entity."""
+        store = cls()
+        columns = store._columns
+        row = -1
+        for row, entity_comps in enumerate(component_dicts):
+            for component_type, component in entity_comps.items():
+                column = columns.get(component_type)
+                if column is None:
+                    column = columns[component_type] = ([], [])
+                column[0].append(row)
+                column[1].append(component)
+        store._count = row + 1
+        return store
+
+    @classmethod
+    def from_lists(cls, entities: Iterable[list]) -> "FrozenEntities":
+        """Build from per-entity component lists (the legacy/save layout)."""
+        return cls.from_component_dicts({type(c): c for c in components} for components in entities)
+
+    def component_dicts(self) -> list[dict]:
+        """Per-entity ``{type: instance}`` dicts, assembled column by column."""
+        dicts: list[dict] = [{} for _ in range(self._count)]
+        for component_type, (rows, components) in self._columns.items():
+            for row, component in zip(rows, components, strict=True):
+                dicts[row][component_type] = component
+        return dicts
+
+    def column(self, component_type: type) -> list:
+        """All frozen instances of one component type (no per-entity walk)."""
+        column = self._columns.get(component_type)
+        return list(column[1]) if column else []
+
+    def columns(self) -> Iterator[tuple[type, list]]:
+        """(component type, frozen instances) for every stored type."""
+        return ((component_type, column[1]) for component_type, column in self._columns.items())
+
+    def append(self, components: list) -> None:
+        """Add one entity given as a list of its components."""
+        row = self._count
+        for component in components:
+            column = self._columns.get(type(component))
+            if column is None:
+                column = self._columns[type(component)] = ([], [])
+            column[0].append(row)
+            column[1].append(component)
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[list]:
+        return (list(entity_comps.values()) for entity_comps in self.component_dicts())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenEntities):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self) == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FrozenEntities({self._count} entities, {len(self._columns)} component types)"
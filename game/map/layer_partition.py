@@ -0,0 +1,60 @@
+"""Entities partitioned by the map layer their Position is on.
+
+Per-layer passes (AI turns, gossip, rendering, the fast-forward threat check)
+only care about the player's layer, or the layers below it, but used to walk
+every entity of a query and skip the ones elsewhere — so a multi-storey
+interior or a stack of dungeon levels made the ground-floor turn slower.
+
+``on_layer(layer, *component_types)`` returns the rows of
+``esper.get_components(*component_types)`` (which must include Position)
+whose Position is on ``layer``, in the query's own order. The rows of every
+layer are split out in one pass and kept until
+
+- esper's cached result for the query is replaced, i.e. a component of one
+  of its types was added or removed (spawns, deaths, a Position swapped for
+  a new one, thawed maps, loaded saves — see core.ecs query views); or
+- ``layer_changed()`` is called. Code that changes ``Position.layer`` in
+  place (portal traversal) must call it: in-place edits are invisible to
+  esper.
+"""
+
+import esper
+
+from game.components import Position
+
+# query signature -> (esper's result list, generation, layer -> rows)
+_partitions: dict[tuple, tuple[list, int, dict[int, list]]] = {}
+_generation = 0
+
+
+def layer_changed() -> None:
+    """Re-partition every query: some Position.layer was changed in place."""
+    global _generation
+    _generation += 1
+
+
+def partition(*component_types: type) -> dict[int, list]:
+    """Map layer -> the rows of ``esper.get_components(*component_types)`` on it."""
+    view = esper.get_components(*component_types)
+    cached = _partitions.get(component_types)
+    if cached is not None and cached[0] is view and cached[1] == _generation:
+        return cached[2]
+    index = component_types.index(Position)
+    layers: dict[int, list] = {}
+    for row in view:
+        layer = row[1][index].layer
+        rows = layers.get(layer)
+        if rows is None:
+            layers[layer] = [row]
+        else:
+            rows.append(row)
+    _partitions[component_types] = (view, _generation, layers)
+    return layers
+
+
+def on_layer(layer: int, *component_types: type) -> list:
+    """The rows of ``esper.get_components(*component_types)`` on `layer`.
+
+    The list is shared until the next change; copy it before mutating.
+    """
+    return partition(*component_types).get(layer, [])
@@ -1,3 +1,5 @@
+from core.ecs import create_entities, extract_entities
+from game.map.frozen_entities import FrozenEntities
 from game.map.map_layer import MapLayer
 from game.map.tile import VisibilityState
 
@@ -5,7 +7,7 @@ from game.map.tile import VisibilityState
 class MapContainer:
     def __init__(self, layers: list[MapLayer], arrival_pos: tuple[int, int] | None = None):
         self.layers = layers
-        self.frozen_entities: list[list] = []
+        self.frozen_entities = FrozenEntities()
         self.last_visited_turn: int = 0
         # Where the player appears when arriving via world travel (Phase A).
         self.arrival_pos = arrival_pos
@@ -36,6 +38,10 @@ class MapContainer:
         tile = self.get_tile(x, y, layer_idx)
         return tile.walkable if tile else False
 
+    def sample_position(self, rng, margin: int = 2) -> tuple[int, int]:
+        """A random (x, y) at least `margin` tiles from the map edge."""
+        return (rng.randint(margin, self.width - 1 - margin), rng.randint(margin, self.height - 1 - margin))
+
     def roof_cutaway(self, px: int, py: int, player_layer: int = 0) -> set[tuple[int, int]]:
         """Tiles whose roof should be peeled away because the player stands under it.
 
@@ -71,69 +77,73 @@ class MapContainer:
             stack.extend([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
         return footprint
 
+    def iter_tile_rows(self):
+        """Every row of tiles that holds live map state, across all layers.
+
+        Per-turn and per-visit passes over the whole map (memory aging, the
+        exit/enter transitions) walk these rows. A plain map yields all of
+        them; ChunkedMapContainer only its loaded chunks.
+        """
+        for layer in self.layers:
+            yield from layer.tiles
+
     def on_exit(self, current_turn: int):
         """Updates the last visited turn and transitions VISIBLE tiles to SHROUDED."""
         self.last_visited_turn = current_turn
-        for layer in self.layers:
-            for row in layer.tiles:
-                for tile in row:
-                    if tile.visibility_state == VisibilityState.VISIBLE:
-                        tile.visibility_state = VisibilityState.SHROUDED
-                        tile.rounds_since_seen = 0
+        for row in self.iter_tile_rows():
+            for tile in row:
+                if tile.visibility_state == VisibilityState.VISIBLE:
+                    tile.visibility_state = VisibilityState.SHROUDED
+                    tile.rounds_since_seen = 0
 
     def on_enter(self, current_turn: int, memory_threshold: int):
         """Calculates decay based on time passed since last visit."""
         turns_passed = current_turn - self.last_visited_turn
         if turns_passed > 0:
-            for layer in self.layers:
-                for row in layer.tiles:
-                    for tile in row:
-                        if tile.visibility_state == VisibilityState.SHROUDED:
-                            tile.rounds_since_seen += turns_passed
-                            if tile.rounds_since_seen > memory_threshold:
-                                tile.visibility_state = VisibilityState.FORGOTTEN
+            for row in self.iter_tile_rows():
+                for tile in row:
+                    if tile.visibility_state == VisibilityState.SHROUDED:
+                        tile.rounds_since_seen += turns_passed
+                        if tile.rounds_since_seen > memory_threshold:
+                            tile.visibility_state = VisibilityState.FORGOTTEN
 
     def forget_all(self):
         """Transitions all VISIBLE and SHROUDED tiles to FORGOTTEN state."""
-        for layer in self.layers:
-            for row in layer.tiles:
-                for tile in row:
-                    if tile.visibility_state in (VisibilityState.VISIBLE, VisibilityState.SHROUDED):
-                        tile.visibility_state = VisibilityState.FORGOTTEN
-                        tile.rounds_since_seen = 1000  # Ensure it stays forgotten
+        for row in self.iter_tile_rows():
+            for tile in row:
+                if tile.visibility_state in (VisibilityState.VISIBLE, VisibilityState.SHROUDED):
+                    tile.visibility_state = VisibilityState.FORGOTTEN
+                    tile.rounds_since_seen = 1000  # Ensure it stays forgotten
 
     def freeze(self, world, exclude_entities: list[int] = None):
-        """Removes entities from the world and stores them in this container."""
-        if exclude_entities is None:
-            exclude_entities = []
-
-        self.frozen_entities = []
-
-        from game.components import KNOWN_COMPONENT_TYPES, MapBound
-
-        entities_to_freeze = []
-        for ent, _ in list(world.get_component(MapBound)):
-            if ent not in exclude_entities:
-                entity_components = []
-                for comp_type in KNOWN_COMPONENT_TYPES:
-                    try:
-                        comp = world.component_for_entity(ent, comp_type)
-                        entity_components.append(comp)
-                    except KeyError:
-                        pass
-                self.frozen_entities.append(entity_components)
-                entities_to_freeze.append(ent)
-
-        for ent in entities_to_freeze:
-            world.delete_entity(ent)
-
-        # In esper, we must clear dead entities to actually remove them from _entities
+        """Removes entities from the world and stores them in this container.
+
+        Every live MapBound entity not in exclude_entities is lifted out of
+        esper's tables in one batch and stored column-wise (see
+        FrozenEntities). Only known component types are kept.
+        """
+        from game.components import MapBound
+
+        excluded = set(exclude_entities or ())
+        to_freeze = [ent for ent, _ in world.get_component(MapBound) if ent not in excluded]
+        self.frozen_entities = self._extract_frozen(to_freeze)
+
+        # Finalize any other pending deletions, as delete + clear_dead did.
         world.clear_dead_entities()
 
+    @staticmethod
+    def _extract_frozen(entities: list[int]) -> FrozenEntities:
+        """Lift `entities` out of the world into a FrozenEntities store,
+        keeping only known component types."""
+        from game.components import KNOWN_COMPONENT_TYPES
+
+        known = frozenset(KNOWN_COMPONENT_TYPES)
+        return FrozenEntities.from_component_dicts(
+            {ctype: comp for ctype, comp in entity_comps.items() if ctype in known}
+            for entity_comps in extract_entities(entities)
+        )
+
     def thaw(self, world):
-        """Restores frozen entities back into the world."""
-        for components in self.frozen_entities:
-            ent = world.create_entity()
-            for component in components:
-                world.add_component(ent, component)
-        self.frozen_entities = []
+        """Restores frozen entities back into the world (one batch)."""
+        create_entities(self.frozen_entities.component_dicts())
+        self.frozen_entities = FrozenEntities()
@@ -1,9 +1,58 @@
-from game.map.tile import Tile
+from collections.abc import Collection, Sequence
+
+from game.map.tile import Tile, resolve_tile_type
+from game.map.walkable_index import WalkableIndex
+
+# paint_array() palette index meaning "leave this tile as it is".
+KEEP = -1
 
 
 class MapLayer:
+    """One z-level of a map: a row-major grid of Tiles (``tiles[y][x]``).
+
+    Besides per-tile ``Tile.set_type`` the layer offers bulk painting for
+    generators: every operation resolves each type id against the registry
+    once and then writes all of its cells, instead of one lookup per cell.
+    Painting keeps the tiles' per-instance state (visibility, dark flag).
+
+    ``walkable_index`` (built on first use) answers spawning and placement
+    queries. The editing methods here keep it in sync; code that changes
+    tiles directly (``tiles[y][x].set_type`` or row assignment) after the
+    index exists must call ``refresh_walkable`` for the area it touched.
+    """
+
     def __init__(self, tiles: list[list[Tile]]):
         self.tiles = tiles
+        self._walkable_index: WalkableIndex | None = None
+
+    def __getstate__(self):
+        # The index is derived data; it is rebuilt on demand after unpickling.
+        return {"tiles": self.tiles}
+
+    def __setstate__(self, state):
+        self.tiles = state["tiles"]
+        self._walkable_index = None
+
+    @property
+    def walkable_index(self) -> WalkableIndex:
+        if self._walkable_index is None:
+            self._walkable_index = WalkableIndex(self.tiles)
+        return self._walkable_index
+
+    def refresh_walkable(self, x: int = 0, y: int = 0, w: int | None = None, h: int | None = None) -> None:
+        """Re-sync the walkable index over a rectangle (default: the whole layer)."""
+        if self._walkable_index is not None:
+            self._walkable_index.refresh(x, y, w, h)
+
+    def set_tile_type(self, x: int, y: int, type_id: str) -> None:
+        """``tiles[y][x].set_type(type_id)``, keeping the walkable index in sync."""
+        self.tiles[y][x].set_type(type_id)
+        self.refresh_walkable(x, y, 1, 1)
+
+    def write_span(self, x: int, y: int, tiles: list[Tile]) -> None:
+        """Replace ``tiles[y][x : x + len(tiles)]`` with `tiles`."""
+        self.tiles[y][x : x + len(tiles)] = tiles
+        self.refresh_walkable(x, y, len(tiles), 1)
 
     @property
     def width(self) -> int:
@@ -14,3 +63,73 @@ class MapLayer:
     @property
     def height(self) -> int:
         return len(self.tiles)
+
+    # --- Bulk construction ---------------------------------------------------
+
+    @classmethod
+    def filled(cls, width: int, height: int, type_id: str) -> "MapLayer":
+        """A width x height layer of `type_id` tiles."""
+        tile_type = resolve_tile_type(type_id)
+        return cls([[Tile.of_type(tile_type) for _ in range(width)] for _ in range(height)])
+
+    @classmethod
+    def from_type_array(cls, grid: Sequence[Sequence[int]], palette: Sequence[str]) -> "MapLayer":
+        """Build a layer from a row-major grid of indices into `palette` (type ids)."""
+        types = [resolve_tile_type(type_id) for type_id in palette]
+        return cls([[Tile.of_type(types[index]) for index in row] for row in grid])
+
+    # --- Bulk painting -------------------------------------------------------
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, type_id: str, border_only: bool = False) -> None:
+        """Paint the w x h rectangle at (x, y), clipped to the layer.
+
+        With ``border_only`` only the rectangle's outline is painted.
+        """
+        tile_type = resolve_tile_type(type_id)
+        x0, x1 = max(0, x), min(self.width, x + w)
+        y0, y1 = max(0, y), min(self.height, y + h)
+        for yy in range(y0, y1):
+            row = self.tiles[yy]
+            edge_row = yy == y or yy == y + h - 1
+            for xx in range(x0, x1):
+                if not border_only or edge_row or xx == x or xx == x + w - 1:
+                    row[xx]._apply_type(tile_type)
+        self.refresh_walkable(x0, y0, x1 - x0, y1 - y0)
+
+    def paint_mask(
+        self,
+        mask: Sequence[Sequence],
+        type_id: str,
+        origin: tuple[int, int] = (0, 0),
+        only: Collection[str] | None = None,
+    ) -> None:
+        """Paint `type_id` wherever `mask` (rows of truthy values) is set.
+
+        The mask's top-left cell lands on `origin`; cells outside the layer
+        are skipped. ``only`` restricts painting to tiles currently of one
+        of those type ids.
+        """
+        tile_type = resolve_tile_type(type_id)
+        ox, oy = origin
+        width, height = self.width, self.height
+        for my, mask_row in enumerate(mask):
+            y = oy + my
+            if not 0 <= y < height:
+                continue
+            row = self.tiles[y]
+            for mx, hit in enumerate(mask_row):
+                x = ox + mx
+                if hit and 0 <= x < width:
+                    tile = row[x]
+                    if only is None or tile._type_id in only:
+                        tile._apply_type(tile_type)
+        self.refresh_walkable(ox, oy, max((len(row) for row in mask), default=0), len(mask))
+
+    def paint_array(self, grid: Sequence[Sequence[int]], palette: Sequence[str]) -> None:
+        """Paint a full-size grid of indices into `palette`; ``KEEP`` cells stay unchanged."""
+        types = [resolve_tile_type(type_id) for type_id in palette]
+        for row, grid_row in zip(self.tiles, grid, strict=True):
+            for tile, index in zip(row, grid_row, strict=True):
+                if index != KEEP:
+                    tile._apply_type(types[index])
+        self.refresh_walkable()
@@ -14,12 +14,32 @@ class Tile:
     """A tile on the map.
 
     Tiles can be created either from a registry type_id (data-driven) or from
-    explicit properties (legacy / fallback). When a type_id is provided, all
-    shared properties (walkable, transparent, sprites, color) are initialised
-    from the TileRegistry flyweight; instance-specific state (visibility_state,
-    rounds_since_seen) is always per-instance.
+    explicit properties (legacy / fallback). A tile references its TileType
+    flyweight and reads the shared properties (walkable, transparent,
+    sprites, colors, roof, rest / station flags) from it; only
+    instance-specific state (visibility_state, rounds_since_seen, dark) is
+    stored per tile.
+
+    The sprite and sprite-color maps are the flyweight's read-only data.
+    A tile that really needs its own (a decor override) copies them on
+    write through ``set_sprite`` / ``set_sprite_color`` or by assigning
+    ``sprites``; ``set_type`` drops the override again.
     """
 
+    __slots__ = (
+        "_type",
+        "_type_id",
+        "_sprites",
+        "_sprite_colors",
+        "dark",
+        "visibility_state",
+        "rounds_since_seen",
+        "is_transparent",
+        "_walkable_computed",
+        "provides_rest",
+        "crafting_station",
+    )
+
     def __init__(
         self,
         type_id: str | None = None,
@@ -28,72 +48,159 @@ class Tile:
         dark: bool = False,
         sprites: dict | None = None,
     ):
-        # Import here to avoid circular imports at module level.
-        from game.map.tile_registry import tile_registry
-
+        self.dark = dark
         if type_id is not None:
+            # Import here to avoid circular imports at module level.
+            from game.map.tile_registry import tile_registry
+
             tile_type = tile_registry.get(type_id)
             if tile_type is None:
                 raise ValueError(
                     f"Tile type '{type_id}' not found in TileRegistry. "
                     "Ensure ResourceLoader.load_tiles() has been called."
                 )
-            self._type_id: str | None = type_id
-            # Copy the sprite dict so mutations are per-instance.
-            self.sprites: dict = dict(tile_type.sprites)
-            self.transparent: bool = tile_type.transparent
-            self._walkable: bool | None = tile_type.walkable
-            self.color = tile_type.color
-            self.bg_color = tile_type.bg_color
-            self.sprite_colors = dict(tile_type.sprite_colors)
-            self.is_roof = tile_type.roof
-            self.dark = dark
+            self._apply_type(tile_type)
         else:
-            # Legacy construction – explicit properties.
+            # Legacy construction – explicit properties on a private flyweight.
+            self._apply_type(_legacy_type(transparent if transparent is not None else True, sprites or {}))
             self._type_id = None
-            self.transparent = transparent if transparent is not None else True
-            self.dark = dark
-            self.sprites = sprites if sprites is not None else {}
-            self._walkable = None
-            self.color = (200, 200, 200)
-            self.bg_color = None
-            self.sprite_colors = {}
-            self.is_roof = False
-
-        self._update_computed_properties()
+            self._update_computed_properties()
 
         # Per-instance mutable state.
         self.visibility_state = VisibilityState.UNEXPLORED
         self.rounds_since_seen = 0
 
+    @classmethod
+    def of_type(cls, tile_type, dark: bool = False) -> "Tile":
+        """Build a tile from an already resolved TileType (no registry lookup).
+
+        The bulk constructors of MapLayer resolve each type id once and
+        create every tile of that type through here.
+        """
+        tile = cls.__new__(cls)
+        tile.dark = dark
+        tile._apply_type(tile_type)
+        tile.visibility_state = VisibilityState.UNEXPLORED
+        tile.rounds_since_seen = 0
+        return tile
+
     def set_type(self, type_id: str) -> None:
         """Replace this tile's type, re-initialising shared properties from the registry."""
-        from game.map.tile_registry import tile_registry
-
-        tile_type = tile_registry.get(type_id)
-        if tile_type is None:
-            raise ValueError(f"Tile type '{type_id}' not found in TileRegistry.")
-        self._type_id = type_id
-        self.sprites = dict(tile_type.sprites)
-        self.transparent = tile_type.transparent
-        self._walkable = tile_type.walkable
-        self.color = tile_type.color
-        self.bg_color = tile_type.bg_color
-        self.sprite_colors = dict(tile_type.sprite_colors)
-        self.is_roof = tile_type.roof
+        self._apply_type(resolve_tile_type(type_id))
+
+    def _apply_type(self, tile_type) -> None:
+        """Point at `tile_type`; per-instance state is kept, overrides are dropped."""
+        self._type = tile_type
+        self._type_id = tile_type.id
+        self._sprites = None
+        self._sprite_colors = None
+        self.provides_rest = tile_type.provides_rest
+        self.crafting_station = tile_type.crafting_station
+        self._update_computed_properties()
+
+    # --- Shared (flyweight) properties ------------------------------------
+
+    @property
+    def sprites(self):
+        """Sprite per layer: the TileType's read-only map unless overridden."""
+        return self._type.sprites if self._sprites is None else self._sprites
+
+    @sprites.setter
+    def sprites(self, sprites: dict) -> None:
+        self._sprites = dict(sprites)
         self._update_computed_properties()
 
+    @property
+    def sprite_colors(self):
+        return self._type.sprite_colors if self._sprite_colors is None else self._sprite_colors
+
+    def set_sprite(self, layer: SpriteLayer, char: str) -> None:
+        """Override one sprite on this tile only (copy-on-write)."""
+        sprites = dict(self.sprites)
+        sprites[layer] = char
+        self.sprites = sprites
+
+    def set_sprite_color(self, layer: SpriteLayer, color: tuple[int, int, int]) -> None:
+        """Override one sprite color on this tile only (copy-on-write)."""
+        if self._sprite_colors is None:
+            self._sprite_colors = dict(self._type.sprite_colors)
+        self._sprite_colors[layer] = color
+
+    @property
+    def is_customized(self) -> bool:
+        """True once this tile carries its own sprites or sprite colors."""
+        return self._sprites is not None or self._sprite_colors is not None
+
+    @property
+    def tile_type(self):
+        """The TileType flyweight (a private one for legacy tiles)."""
+        return self._type
+
+    @property
+    def transparent(self) -> bool:
+        return self._type.transparent
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return self._type.color
+
+    @property
+    def bg_color(self) -> tuple[int, int, int] | None:
+        return self._type.bg_color
+
+    @property
+    def is_roof(self) -> bool:
+        return self._type.roof
+
+    # --- Pickling -----------------------------------------------------------
+
+    def __getstate__(self):
+        """Compact pickle state for registry-backed tiles.
+
+        A tile without overrides pickles as just its type id plus
+        per-instance state; the rest is re-read from the registry on load.
+        World templates and process-pool generation ship whole maps this
+        way. Customized or legacy tiles also carry their sprite data.
+        """
+        instance = (self.dark, self.visibility_state.value, self.rounds_since_seen)
+        if self._type_id is not None and not self.is_customized:
+            return (self._type_id, *instance)
+        return {
+            "type_id": self._type_id,
+            "transparent": self.transparent,
+            "sprites": dict(self.sprites),
+            "sprite_colors": dict(self._sprite_colors) if self._sprite_colors is not None else None,
+            "instance": instance,
+        }
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            dark, visibility, rounds_since_seen = state["instance"]
+            if state["type_id"] is None:
+                self.__init__(transparent=state["transparent"], dark=dark, sprites=state["sprites"])
+            else:
+                self.dark = dark
+                self.set_type(state["type_id"])
+                if state["sprites"] != self._type.sprites:
+                    self.sprites = state["sprites"]
+                if state["sprite_colors"] is not None:
+                    self._sprite_colors = state["sprite_colors"]
+        else:
+            type_id, dark, visibility, rounds_since_seen = state
+            self.dark = dark
+            self.set_type(type_id)
+        self.visibility_state = VisibilityState(visibility)
+        self.rounds_since_seen = rounds_since_seen
+
     def _update_computed_properties(self):
         """Recompute derived properties when underlying properties change."""
-        self.is_transparent = self.transparent and self.sprites.get(SpriteLayer.GROUND) != "#"
-        if self._walkable is not None:
-            self._walkable_computed = self._walkable
+        sprites = self.sprites
+        self.is_transparent = self._type.transparent and sprites.get(SpriteLayer.GROUND) != "#"
+        if self._type_id is not None:
+            self._walkable_computed = self._type.walkable
         else:
             # Legacy fallback: derive from sprites.
-            if SpriteLayer.GROUND not in self.sprites:
-                self._walkable_computed = False
-            else:
-                self._walkable_computed = self.sprites[SpriteLayer.GROUND] != "#"
+            self._walkable_computed = sprites.get(SpriteLayer.GROUND, "#") != "#"
 
     @property
     def type_id(self) -> str | None:
@@ -109,26 +216,19 @@ class Tile:
         """
         return self._walkable_computed
 
-    @property
-    def provides_rest(self) -> bool:
-        """Whether bumping this tile offers rest (e.g. a bed). Registry-backed."""
-        if self._type_id is None:
-            return False
-        from game.map.tile_registry import tile_registry
 
-        tile_type = tile_registry.get(self._type_id)
-        return bool(tile_type and tile_type.provides_rest)
+def _legacy_type(transparent: bool, sprites: dict):
+    """A private, unregistered TileType holding a legacy tile's explicit properties."""
+    from game.map.tile_registry import TileType
 
-    @property
-    def crafting_station(self) -> str:
-        """Station type if bumping this tile opens a crafting bench, else "".
+    return TileType(id="", name="", walkable=False, transparent=transparent, sprites=sprites, color=(200, 200, 200))
 
-        Registry-backed (e.g. "forge", "mill"). Empty string for ordinary
-        tiles.
-        """
-        if self._type_id is None:
-            return ""
-        from game.map.tile_registry import tile_registry
 
-        tile_type = tile_registry.get(self._type_id)
-        return tile_type.crafting_station if tile_type else ""
+def resolve_tile_type(type_id: str):
+    """The registered TileType for `type_id`; ValueError if there is none."""
+    from game.map.tile_registry import tile_registry
+
+    tile_type = tile_registry.get(type_id)
+    if tile_type is None:
+        raise ValueError(f"Tile type '{type_id}' not found in TileRegistry.")
+    return tile_type
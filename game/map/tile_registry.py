@@ -6,6 +6,7 @@ TileRegistry maps type IDs to TileType instances.
 """
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from config import SpriteLayer
 from core.registry import Registry
@@ -36,6 +37,12 @@ class TileType:
     # Per-sprite-layer foreground colors; layers not listed fall back to `color`.
     sprite_colors: dict[SpriteLayer, tuple[int, int, int]] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Every Tile of this type reads these maps directly; make them
+        # read-only so a stray write cannot repaint all of them at once.
+        self.sprites = MappingProxyType(dict(self.sprites))
+        self.sprite_colors = MappingProxyType(dict(self.sprite_colors))
+
 
 class TileRegistry(Registry[TileType]):
     """Registry mapping tile type IDs to TileType flyweights."""
@@ -0,0 +1,222 @@
+"""Walkability of one MapLayer, indexed for spawning and placement queries.
+
+Generators, spawners and the off-screen simulation keep asking the same
+questions of a layer — "all walkable cells", "a random one", "the nearest
+one to here, but not these" — and used to answer each by walking the tile
+grid again. A WalkableIndex answers them from three structures:
+
+- a bitmap, one byte per cell (``y * width + x``), so probing a cell is a
+  single index and bulk work (counting, listing) runs in C through
+  ``bytes.count`` / ``itertools.compress``;
+- the packed walkable cells in row-major order, rebuilt from the bitmap on
+  demand, for O(1) random picks and order-stable sampling;
+- a Chebyshev distance transform (distance from each cell to the nearest
+  walkable one), which lets a nearest-walkable search start directly at the
+  first ring that can hold an answer, or give up at once.
+
+The index is owned by its MapLayer (``MapLayer.walkable_index``) and kept in
+sync by the layer's editing methods. The cell list and distance transform
+are derived lazily: edits only flip bitmap bytes. The distance transform is
+rebuilt on the second query after an edit, so generators that alternate
+edits with single lookups never pay for it, while a settled map gets it
+once.
+"""
+
+import itertools
+from array import array
+from collections.abc import Collection
+
+
+class WalkableIndex:
+    """Bitmap, cell list and distance transform over a tile grid."""
+
+    def __init__(self, tiles: list[list]):
+        self._tiles = tiles
+        self.height = len(tiles)
+        self.width = len(tiles[0]) if tiles else 0
+        self._bits = bytearray(tile.walkable for row in tiles for tile in row)
+        self._cells: array | None = None
+        self._distance: list[int] | None = None
+        self._stale_queries = 0
+
+    # --- Keeping in sync -------------------------------------------------------
+
+    def refresh(self, x: int = 0, y: int = 0, w: int | None = None, h: int | None = None) -> None:
+        """Re-read the walkable flags of a rectangle (default: the whole layer)."""
+        x0, y0 = max(0, x), max(0, y)
+        x1 = self.width if w is None else min(self.width, x + w)
+        y1 = self.height if h is None else min(self.height, y + h)
+        if x0 >= x1:
+            return
+        bits, width = self._bits, self.width
+        changed = False
+        for yy in range(y0, y1):
+            start = yy * width
+            span = bytes(tile.walkable for tile in self._tiles[yy][x0:x1])
+            if bits[start + x0 : start + x1] != span:
+                bits[start + x0 : start + x1] = span
+                changed = True
+        if changed:
+            self._cells = None
+            self._distance = None
+
+    # --- Queries -----------------------------------------------------------------
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self._bits[y * self.width + x])
+
+    def __len__(self) -> int:
+        return self._bits.count(1)
+
+    @property
+    def cells(self) -> array:
+        """Packed walkable cells (``y * width + x``), row-major."""
+        if self._cells is None:
+            self._cells = array("i", itertools.compress(range(len(self._bits)), self._bits))
+        return self._cells
+
+    def positions(
+        self,
+        exclude: Collection[tuple[int, int]] | None = None,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Walkable (x, y) in row-major order, minus `exclude`, optionally
+        restricted to the rectangle `region` = (x, y, w, h)."""
+        width = self.width
+        if region is None:
+            found = [(cell % width, cell // width) for cell in self.cells]
+        else:
+            rx, ry, rw, rh = region
+            x0, x1 = max(0, rx), min(width, rx + rw)
+            found = []
+            for y in range(max(0, ry), min(self.height, ry + rh)):
+                start = y * width
+                found.extend((x, y) for x in itertools.compress(range(x0, x1), self._bits[start + x0 : start + x1]))
+        if exclude:
+            found = [pos for pos in found if pos not in exclude]
+        return found
+
+    def sample(self, rng, k: int, exclude: Collection[tuple[int, int]] | None = None) -> list[tuple[int, int]]:
+        """Up to `k` distinct walkable positions, as ``rng.sample`` over positions()."""
+        population = self.positions(exclude)
+        return rng.sample(population, min(k, len(population)))
+
+    def choice(self, rng, exclude: Collection[tuple[int, int]] | None = None) -> tuple[int, int] | None:
+        """One random walkable position not in `exclude` (None if there is none).
+
+        O(1) while exclusions are rare: a few random picks from the cell list
+        are tried before falling back to filtering it.
+        """
+        cells, width = self.cells, self.width
+        if not cells:
+            return None
+        for _ in range(8):
+            cell = cells[rng.randrange(len(cells))]
+            pos = (cell % width, cell // width)
+            if not exclude or pos not in exclude:
+                return pos
+        remaining = self.positions(exclude)
+        return rng.choice(remaining) if remaining else None
+
+    def distance(self, x: int, y: int) -> int:
+        """Chebyshev distance from (x, y) to the nearest walkable cell."""
+        if self._distance is None:
+            self._distance = self._distance_transform()
+        return self._distance[y * self.width + x]
+
+    def nearest(
+        self,
+        x: int,
+        y: int,
+        max_radius: int = 5,
+        exclude: Collection[tuple[int, int]] | None = None,
+        avoid_type_ids: Collection[str] | None = None,
+    ) -> tuple[int, int] | None:
+        """The nearest acceptable walkable cell within `max_radius`, or None.
+
+        Rings around (x, y) are searched in the same order as
+        get_nearest_walkable_tile's spiral, so the answer is the same; the
+        distance transform skips the rings that hold no walkable cell at all.
+        ``avoid_type_ids`` are only accepted if nothing else is in reach.
+        """
+        first_ring = 0
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if self._distance is None:
+                self._stale_queries += 1
+                if self._stale_queries >= 2:
+                    self._distance = self._distance_transform()
+            if self._distance is not None:
+                first_ring = self._distance[y * self.width + x]
+                if first_ring > max_radius:
+                    return None
+        result = self._ring_search(x, y, first_ring, max_radius, exclude, avoid_type_ids)
+        if result is None and avoid_type_ids:
+            result = self._ring_search(x, y, first_ring, max_radius, exclude, None)
+        return result
+
+    # --- Internals -----------------------------------------------------------------
+
+    def _ring_search(self, x, y, first_ring, max_radius, exclude, avoid_type_ids):
+        bits, width, height, tiles = self._bits, self.width, self.height, self._tiles
+
+        def accept(nx, ny):
+            if not (0 <= nx < width and 0 <= ny < height and bits[ny * width + nx]):
+                return False
+            if exclude and (nx, ny) in exclude:
+                return False
+            return not (avoid_type_ids and tiles[ny][nx].type_id in avoid_type_ids)
+
+        if first_ring == 0:
+            if accept(x, y):
+                return x, y
+            first_ring = 1
+        for r in range(first_ring, max_radius + 1):
+            for dx in range(-r, r + 1):
+                if abs(dx) == r:
+                    for dy in range(-r, r + 1):
+                        if accept(x + dx, y + dy):
+                            return x + dx, y + dy
+                else:
+                    if accept(x + dx, y - r):
+                        return x + dx, y - r
+                    if accept(x + dx, y + r):
+                        return x + dx, y + r
+        return None
+
+    def _distance_transform(self) -> list[int]:
+        """Two-pass Chebyshev distance transform over the bitmap."""
+        self._stale_queries = 0
+        width, height = self.width, self.height
+        far = width + height
+        dist = [0 if bit else far for bit in self._bits]
+        for y in range(height):
+            row = y * width
+            above = row - width
+            for x in range(width):
+                i = row + x
+                d = dist[i]
+                if d == 0:
+                    continue
+                if x > 0 and dist[i - 1] + 1 < d:
+                    d = dist[i - 1] + 1
+                if y > 0:
+                    for j in range(above + max(0, x - 1), above + min(width, x + 2)):
+                        if dist[j] + 1 < d:
+                            d = dist[j] + 1
+                dist[i] = d
+        for y in range(height - 1, -1, -1):
+            row = y * width
+            below = row + width
+            for x in range(width - 1, -1, -1):
+                i = row + x
+                d = dist[i]
+                if d == 0:
+                    continue
+                if x < width - 1 and dist[i + 1] + 1 < d:
+                    d = dist[i + 1] + 1
+                if y < height - 1:
+                    for j in range(below + max(0, x - 1), below + min(width, x + 2)):
+                        if dist[j] + 1 < d:
+                            d = dist[j] + 1
+                dist[i] = d
+        return dist
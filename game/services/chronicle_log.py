@@ -0,0 +1,111 @@
+"""Indexed storage for the world chronicle's events.
+
+The chronicle used to be one flat list, and every query ("what happened
+in Eastmoor in the last four days?") scanned all of it — gossip does so
+every enemy turn, quest generation on every arrival. Over a long campaign
+the list only grows, so everything that reads it slowed down with it.
+
+ChronicleLog keeps each event in a handful of tick-sorted series: one for
+the whole world, one per location, one per event type and one per
+(location, event type) pair. A query picks the narrowest series for its
+filters and bisects to its start tick, so its cost depends on the number
+of matching events, not on the length of the campaign.
+
+``compact()`` applies the retention policy: events older than the
+retention window are dropped, except the newest few per location, which
+still back the "word around town" log for long-abandoned settlements.
+
+The log still behaves like the list it replaced for iteration, ``len()``
+and indexing (chronological order).
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+
+
+class _Series:
+    """Events sorted by tick (ties keep insertion order), with a parallel tick list."""
+
+    __slots__ = ("ticks", "events")
+
+    def __init__(self):
+        self.ticks: list[int] = []
+        self.events: list = []
+
+    def add(self, event) -> None:
+        if not self.ticks or event.tick >= self.ticks[-1]:
+            self.ticks.append(event.tick)
+            self.events.append(event)
+            return
+        index = bisect_right(self.ticks, event.tick)
+        self.ticks.insert(index, event.tick)
+        self.events.insert(index, event)
+
+    def after(self, tick: int) -> list:
+        """Events strictly after `tick`."""
+        return self.events[bisect_right(self.ticks, tick) :]
+
+
+class ChronicleLog:
+    """Chronicle events indexed by location, event type and tick."""
+
+    __slots__ = ("_series",)
+
+    def __init__(self, events: Iterable = ()):
+        # (location_id | None, event_id | None) -> series; None = any.
+        self._series: dict[tuple[str | None, str | None], _Series] = {}
+        self._rebuild(events)
+
+    def _rebuild(self, events: Iterable) -> None:
+        self._series = {(None, None): _Series()}
+        for event in events:
+            self.append(event)
+
+    def append(self, event) -> None:
+        for key in (
+            (None, None),
+            (event.location_id, None),
+            (None, event.event_id),
+            (event.location_id, event.event_id),
+        ):
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.add(event)
+
+    def since(self, since_tick: int = 0, location_id: str | None = None, event_id: str | None = None) -> list:
+        """Events after `since_tick`, optionally only at one location and/or of one type."""
+        series = self._series.get((location_id, event_id))
+        return series.after(since_tick) if series is not None else []
+
+    def compact(self, now_tick: int, retention_ticks: int, keep_per_location: int) -> int:
+        """Drop events older than the retention window; returns how many went.
+
+        The newest `keep_per_location` events of every location survive
+        regardless of age.
+        """
+        cutoff = now_tick - retention_ticks
+        everything = self._series[(None, None)]
+        if not everything.ticks or everything.ticks[0] > cutoff:
+            return 0
+        protected = set()
+        for (location_id, event_id), series in self._series.items():
+            if location_id is not None and event_id is None and keep_per_location > 0:
+                protected.update(id(event) for event in series.events[-keep_per_location:])
+        kept = [event for event in everything.events if event.tick > cutoff or id(event) in protected]
+        dropped = len(everything.events) - len(kept)
+        if dropped:
+            self._rebuild(kept)
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self._series[(None, None)].events)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._series[(None, None)].events)
+
+    def __getitem__(self, index):
+        return self._series[(None, None)].events[index]
+
+    def __repr__(self) -> str:
+        return f"ChronicleLog({len(self)} events)"
@@ -41,6 +41,7 @@ class ConsumableService:
             # to remain consistent with the CombatSystem pattern
             if eff:
                 eff.hp = stats.hp
+            esper.dispatch_event("stats_changed", user_ent)
 
             category = LogCategory.HEALING if esper.has_component(user_ent, PlayerTag) else LogCategory.SYSTEM
             esper.dispatch_event("log_message", f"You drink the {item_name}. (+{heal_amt} HP)", None, category)
@@ -56,6 +57,7 @@ class ConsumableService:
             stats.mana += restore_amt
             if eff:
                 eff.mana = stats.mana
+            esper.dispatch_event("stats_changed", user_ent)
 
             category = LogCategory.HEALING if esper.has_component(user_ent, PlayerTag) else LogCategory.SYSTEM
             esper.dispatch_event("log_message", f"You drink the {item_name}. (+{restore_amt} MP)", None, category)
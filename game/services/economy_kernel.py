@@ -0,0 +1,295 @@
+"""Batched settlement economy: advance many hours in one call (Phase G3).
+
+EconomyService used to drift a settlement's stock by lumping all elapsed
+hours into one big step, which is wrong as soon as a bound is hit halfway
+(a forge whose ore runs out on day two does not keep forging until day
+ten). Stepping hour by hour is right but costs a full pass over every
+good per hour, which a multi-day journey or a long sleep multiplies out.
+
+A SettlementPlan compiles one settlement's rates and production inputs
+into index form once per call. One hour of economy is then a
+piecewise-affine map on the stock (and prosperity) vector: each clamp,
+each input-gated ``min`` and each prosperity threshold picks a branch, and
+within a fixed choice of branches the map is affine.
+
+The change per hour is constant only while every gated production makes a
+fixed amount. Running at its rate, or on an empty input, it does. Limited
+by an input's level or by the stock cap, it makes whatever that level
+allows, which is fixed only if the level itself is: the gate emptied the
+input (or filled its store to the cap) the hour before, and everything
+that touched the good since moved it by fixed amounts, as with a forge
+fed by a steady ore trickle. Inputs that feed each other in a cycle are
+never fixed: their amounts shrink or grow from hour to hour, however
+little, and must not be extrapolated. ``advance()`` therefore steps exact
+hours until two consecutive hours take the same branches, with the same
+change, and every gated production is fixed (``_steady``). From there
+every stock moves by a constant per hour, and the plan jumps straight to the
+hour before the next branch change (a stock reaching 0 or ECON_MAX_STOCK,
+an input running dry, a shortage starting or ending). The result is the
+hour-by-hour result, up to float rounding, at the cost of a few steps per
+regime change instead of one per hour. (Some input cycles amplify that
+rounding hour after hour; stepping them hourly from a start one ulp off
+drifts just as far.)
+"""
+
+import math
+
+from config import (
+    ECON_EQUILIBRIUM_STOCK,
+    ECON_MAX_STOCK,
+    PROSPERITY_COMFORT_DRIFT,
+    PROSPERITY_MAX,
+    PROSPERITY_MIN,
+    PROSPERITY_SHORTAGE_DRIFT,
+    PROSPERITY_SHORTAGE_LEVEL,
+)
+
+# Below this, quantities and per-hour changes count as zero (float noise
+# from consuming an input exactly down to nothing).
+_EPSILON = 1e-9
+
+# How an op changes a good, for SettlementPlan._steady: set to a fixed level
+# (emptied, or filled to the cap), or moved by a fixed amount. An op index
+# instead means "by that gated production's output".
+_PIN = -1
+_FIXED = -2
+
+
+def _sign(value: float) -> int:
+    if value > _EPSILON:
+        return 1
+    if value < -_EPSILON:
+        return -1
+    return 0
+
+
+class SettlementPlan:
+    """One settlement's production and consumption, compiled to indices."""
+
+    __slots__ = ("goods", "ops", "consumed", "written", "_steady_regimes")
+
+    def __init__(self, rates: dict[str, float], inputs: dict[str, dict[str, float]]):
+        index: dict[str, int] = {}
+
+        def slot(item_id: str) -> int:
+            return index.setdefault(item_id, len(index))
+
+        # (target slot, change per hour, ((input slot, need per unit), ...) or None)
+        ops = []
+        written: set[int] = set()
+        consumed: set[int] = set()
+        for item_id, per_day in rates.items():
+            target = slot(item_id)
+            written.add(target)
+            per_hour = per_day / 24.0
+            requires = inputs.get(item_id)
+            if per_hour > 0 and requires:
+                gates = tuple((slot(input_id), need) for input_id, need in requires.items())
+                written.update(input_slot for input_slot, _ in gates)
+                ops.append((target, per_hour, gates))
+            else:
+                ops.append((target, per_hour, None))
+            if per_day < 0:
+                consumed.add(target)
+        # Inputs count as consumed goods whether or not production runs.
+        for requires in inputs.values():
+            consumed.update(slot(input_id) for input_id in requires)
+
+        self.goods = list(index)
+        self.ops = ops
+        self.consumed = sorted(consumed)
+        self.written = sorted(written)
+        self._steady_regimes: dict[tuple, bool] = {}
+
+    def read(self, stock: dict[str, float]) -> list[float]:
+        return [stock.get(item_id, 0.0) for item_id in self.goods]
+
+    def write(self, stock: dict[str, float], levels: list[float]) -> None:
+        """Store the levels of every good the plan changes (others stay absent)."""
+        for i in self.written:
+            stock[self.goods[i]] = levels[i]
+
+    def step(self, levels: list[float], prosperity: float | None) -> tuple[float | None, tuple, list[float]]:
+        """Advance one hour in place, exactly like a single hourly tick.
+
+        Returns:
+            (prosperity, regime, quantities) — the new prosperity, the
+            affine regime and the signed quantities whose signs decide every
+            non-gate branch. The regime is the branch taken by every gated
+            production, the signs of the quantities, and the ops whose
+            output was limited by a level (an input or the cap) rather than
+            fixed (their rate, or nothing).
+        """
+        branches = []
+        quantities = []
+        limited = []
+        for op_index, (target, per_hour, gates) in enumerate(self.ops):
+            if gates is None:
+                level = levels[target] + per_hour
+                quantities.append(level)
+                quantities.append(ECON_MAX_STOCK - level)
+                levels[target] = max(0.0, min(ECON_MAX_STOCK, level))
+                continue
+            # Production gated by input goods (G3): no ore, no swords.
+            # Output is limited by the scarcest input and the stock cap.
+            headroom = ECON_MAX_STOCK - levels[target]
+            candidates = [per_hour, max(0.0, headroom)]
+            candidates.extend(levels[input_slot] / need for input_slot, need in gates if need > 0)
+            chosen = min(range(len(candidates)), key=candidates.__getitem__)
+            branches.append(chosen)
+            if chosen != 0 and candidates[chosen] > 0.0:
+                limited.append(op_index)
+            quantities.append(headroom)
+            quantities.extend(value - candidates[chosen] for value in candidates)
+            produced = max(0.0, candidates[chosen])
+            for input_slot, need in gates:
+                remaining = levels[input_slot] - produced * need
+                quantities.append(remaining)
+                levels[input_slot] = max(0.0, remaining)
+            levels[target] += produced
+
+        if prosperity is not None and self.consumed:
+            # Persistent shortages pull a settlement down; plenty lifts it.
+            shortages = 0
+            plentiful = True
+            for i in self.consumed:
+                shortfall = levels[i] - PROSPERITY_SHORTAGE_LEVEL
+                surplus = levels[i] - ECON_EQUILIBRIUM_STOCK
+                quantities.append(shortfall)
+                quantities.append(surplus)
+                if shortfall <= 0:
+                    shortages += 1
+                if surplus < 0:
+                    plentiful = False
+            if shortages:
+                prosperity += PROSPERITY_SHORTAGE_DRIFT * shortages
+            elif plentiful:
+                prosperity += PROSPERITY_COMFORT_DRIFT
+            quantities.append(prosperity - PROSPERITY_MIN)
+            quantities.append(PROSPERITY_MAX - prosperity)
+            prosperity = max(PROSPERITY_MIN, min(PROSPERITY_MAX, prosperity))
+
+        regime = (tuple(branches), tuple(_sign(q) for q in quantities), tuple(limited))
+        return prosperity, regime, quantities
+
+    def advance(self, levels: list[float], prosperity: float | None, hours: int) -> float | None:
+        """Advance ``hours`` hours in place; returns the new prosperity."""
+        remaining = hours
+        previous = None  # (regime, quantities, change) of the last exact step
+        while remaining > 0:
+            before = list(levels)
+            prosperity_before = prosperity
+            prosperity, regime, quantities = self.step(levels, prosperity)
+            remaining -= 1
+            change = [after - old for after, old in zip(levels, before, strict=True)]
+            if prosperity is not None:
+                change.append(prosperity - prosperity_before)
+
+            if previous is not None and previous[0] == regime and _same(previous[2], change) and self._steady(regime):
+                jump = _hours_in_regime(previous[1], quantities, remaining)
+                if jump:
+                    for i in range(len(levels)):
+                        levels[i] += change[i] * jump
+                    if prosperity is not None:
+                        prosperity += change[-1] * jump
+                    remaining -= jump
+                    previous = None
+                    continue
+            previous = (regime, quantities, change)
+        return prosperity
+
+    def _steady(self, regime: tuple) -> bool:
+        """True if every gated production makes a fixed amount per hour in `regime`.
+
+        A level-limited production is fixed when the level it reads was
+        pinned by itself an hour earlier (the input emptied, the store
+        filled to the cap) and every op that touched that good since either
+        pinned it again or moved it by a fixed amount. Whether a gated op's
+        flow is fixed depends on other gates, so this settles to a fixpoint.
+        """
+        branches, signs, limited = regime
+        if not limited:
+            return True
+        steady = self._steady_regimes.get(regime)
+        if steady is not None:
+            return steady
+
+        # Per op, in the order it applies them: (slot, _PIN | _FIXED | op index)
+        effects: list[list[tuple[int, int]]] = []
+        reads: dict[int, int] = {}  # level-limited op -> the slot it is limited by
+        gate = 0
+        q = 0
+        for op_index, (target, _per_hour, gates) in enumerate(self.ops):
+            if gates is None:
+                pinned = signs[q] < 0 or signs[q + 1] < 0  # clamped at 0 or the cap
+                effects.append([(target, _PIN if pinned else _FIXED)])
+                q += 2
+                continue
+            chosen = branches[gate]
+            gate += 1
+            gated_inputs = [input_slot for input_slot, need in gates if need > 0]
+            q += 3 + len(gated_inputs)  # headroom and the candidate margins
+            reads[op_index] = target if chosen == 1 else gated_inputs[chosen - 2] if chosen > 1 else -1
+            # Only a level this op resets is pinned: the input it used up,
+            # one clamped at 0, the store it filled. A level merely near
+            # zero still moves with whatever fed it.
+            limiting = reads[op_index] if op_index in limited else -1
+            op_effects = []
+            for input_slot, _need in gates:
+                pinned = signs[q] < 0 or input_slot == limiting
+                op_effects.append((input_slot, _PIN if pinned else op_index))
+                q += 1
+            op_effects.append((target, _PIN if target == limiting else op_index))
+            effects.append(op_effects)
+
+        fixed = set(range(len(self.ops))) - set(limited)
+        progress = True
+        while progress:
+            progress = False
+            for op_index in limited:
+                if op_index not in fixed and _pinned_since(effects, op_index, reads[op_index], fixed):
+                    fixed.add(op_index)
+                    progress = True
+        steady = self._steady_regimes[regime] = fixed.issuperset(limited)
+        return steady
+
+
+def _pinned_since(effects: list, op_index: int, slot: int, fixed: set[int]) -> bool:
+    """Walk back from op `op_index` reading `slot` (this hour's earlier ops,
+    then last hour's later ones, then the op itself) to the last pin of the
+    slot; True if every change met on the way was a fixed amount."""
+    count = len(effects)
+    for back in range(1, count + 1):
+        for effect_slot, effect in reversed(effects[(op_index - back) % count]):
+            if effect_slot != slot:
+                continue
+            if effect == _PIN:
+                return True
+            if effect != _FIXED and effect not in fixed:
+                return False
+    return False
+
+
+def _same(a: list[float], b: list[float]) -> bool:
+    return all(abs(x - y) <= _EPSILON * (1.0 + abs(x)) for x, y in zip(a, b, strict=True))
+
+
+def _hours_in_regime(previous: list[float], current: list[float], limit: int) -> int:
+    """How many more hours every quantity keeps its sign.
+
+    Inside one regime each quantity moves by a constant per hour (the
+    difference between its last two values); the first one heading for
+    zero bounds the jump.
+    """
+    hours = limit
+    for old, value in zip(previous, current, strict=True):
+        slope = value - old
+        if abs(slope) <= _EPSILON:
+            continue
+        if _sign(value) == 0:
+            return 0  # sitting on a boundary and moving: step exactly
+        if value * slope < 0:
+            hours = min(hours, math.ceil(abs(value) / abs(slope)) - 1)
+            if hours <= 0:
+                return 0
+    return hours
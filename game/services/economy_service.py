@@ -16,9 +16,10 @@ inputs consumed per produced unit — when the input runs out, production
 stalls, the local price climbs and the shortage shows up as a generated
 delivery request. Supply chains across settlements emerge from data.
 
-Stock drifts hourly via the ``clock_tick`` event (multi-hour travel jumps
-are caught up). The price factor is a function of scarcity: equilibrium
-stock ~ factor 1.0, empty shelves ~ 2.0, glut ~ 0.5. Player trades feed
+Stock drifts hourly via the ``clock_tick`` event; multi-hour travel and
+sleep jumps are caught up in one batched call (see economy_kernel). The
+price factor is a function of scarcity: equilibrium stock ~ factor 1.0,
+empty shelves ~ 2.0, glut ~ 0.5. Player trades feed
 back into stock, so hauling goods between settlements moves both markets.
 
 Each settlement also carries a prosperity value (0..100, Phase G3):
@@ -27,7 +28,6 @@ quests lift it. Prosperity shifts the local price baseline and is visible
 in dialogue and the arrival log — settlements visibly thrive or decay.
 """
 
-import json
 import logging
 import os
 import random
@@ -40,17 +40,17 @@ from config import (
     ECON_PRICE_FACTOR_MIN,
     ECON_RATE_JITTER,
     ECON_STOCK_JITTER,
-    PROSPERITY_COMFORT_DRIFT,
     PROSPERITY_HIGH,
     PROSPERITY_LOW,
     PROSPERITY_MAX,
     PROSPERITY_MIN,
     PROSPERITY_PRICE_SPAN,
-    PROSPERITY_SHORTAGE_DRIFT,
-    PROSPERITY_SHORTAGE_LEVEL,
     PROSPERITY_START,
     TICKS_PER_HOUR,
 )
+from core.event_bus import coalescible
+from game.content.content_cache import read_json
+from game.services.economy_kernel import SettlementPlan
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +75,7 @@ class EconomyService:
             path = os.path.join(scenarios_dir, f"{location.scenario}.json")
             if not os.path.exists(path):
                 continue
-            with open(path) as f:
-                config = json.load(f)
+            config = read_json(path)
             economy = config.get("economy", {})
             stock = {k: float(v) for k, v in economy.get("stock", {}).items()}
             rates: dict[str, float] = {}
@@ -118,38 +117,43 @@ class EconomyService:
 
     # --- Simulation -----------------------------------------------------------
 
-    def on_clock_tick(self, clock_state: dict) -> None:
-        """esper handler: drift stock levels for every full hour passed."""
-        absolute_hour = clock_state["total_ticks"] // TICKS_PER_HOUR
+    @coalescible
+    def on_clock_tick(self, clock_state: dict, coalesced: int = 1) -> None:
+        """esper handler: drift stock levels for every full hour passed.
+
+        Coalescible: advance_hours() gives the same result for one long
+        span as for many short ones.
+        """
+        self.advance_to_hour(clock_state["total_ticks"] // TICKS_PER_HOUR)
+
+    def advance_to_hour(self, absolute_hour: int) -> None:
+        """Catch the stocks up to `absolute_hour`; a no-op if already there.
+
+        Readers that run on every clock_tick (merchant restock) call this
+        before looking at the stocks: while a rest coalesces this service's
+        own clock_tick, the stocks would otherwise still show the hour the
+        rest began.
+        """
         if absolute_hour <= self.last_processed_hour:
             return
-        hours = absolute_hour - self.last_processed_hour
-        for location_id, rates in self.rates_per_day.items():
-            stock = self.stocks.setdefault(location_id, {})
-            inputs_of = self.production_inputs.get(location_id, {})
-            for item_id, per_day in rates.items():
-                amount = per_day / 24.0 * hours
-                inputs = inputs_of.get(item_id)
-                if amount > 0 and inputs:
-                    self._produce_with_inputs(stock, item_id, amount, inputs)
-                else:
-                    stock[item_id] = max(0.0, min(ECON_MAX_STOCK, stock.get(item_id, 0.0) + amount))
-        self._drift_prosperity(hours)
+        self.advance_hours(absolute_hour - self.last_processed_hour)
         self.last_processed_hour = absolute_hour
 
-    @staticmethod
-    def _produce_with_inputs(stock: dict, item_id: str, amount: float, inputs: dict[str, float]) -> None:
-        """Production gated by input goods (G3): no ore, no swords.
+    def advance_hours(self, hours: int) -> None:
+        """Run `hours` hours of production, consumption and prosperity drift.
 
-        Output is limited by the scarcest input; consumed inputs leave the
-        local stock, so a working forge visibly drains its ore pile.
+        One call regardless of the span (see economy_kernel): the result is
+        what hourly ticking would give, including stocks pinned at 0 or
+        ECON_MAX_STOCK and production stalling when its inputs run out.
         """
-        headroom = max(0.0, ECON_MAX_STOCK - stock.get(item_id, 0.0))
-        max_units = min(stock.get(i, 0.0) / need for i, need in inputs.items() if need > 0)
-        produced = max(0.0, min(amount, max_units, headroom))
-        for input_id, need in inputs.items():
-            stock[input_id] = max(0.0, stock.get(input_id, 0.0) - produced * need)
-        stock[item_id] = stock.get(item_id, 0.0) + produced
+        for location_id, rates in self.rates_per_day.items():
+            plan = SettlementPlan(rates, self.production_inputs.get(location_id, {}))
+            stock = self.stocks.setdefault(location_id, {})
+            levels = plan.read(stock)
+            prosperity = plan.advance(levels, self.prosperity.get(location_id), hours)
+            plan.write(stock, levels)
+            if prosperity is not None:
+                self.prosperity[location_id] = prosperity
 
     def consumes(self, location_id: str | None, item_id: str) -> bool:
         """True if the settlement uses this good up — by direct consumption
@@ -160,28 +164,6 @@ class EconomyService:
 
     # --- Prosperity (G3) ---------------------------------------------------------
 
-    def _consumed_goods(self, location_id: str) -> set[str]:
-        goods = {i for i, rate in self.rates_per_day.get(location_id, {}).items() if rate < 0}
-        for inputs in self.production_inputs.get(location_id, {}).values():
-            goods.update(inputs)
-        return goods
-
-    def _drift_prosperity(self, hours: int) -> None:
-        """Persistent shortages pull a settlement down; plenty lifts it."""
-        for location_id in self.prosperity:
-            consumed = self._consumed_goods(location_id)
-            if not consumed:
-                continue
-            stock = self.stocks.get(location_id, {})
-            shortages = sum(1 for i in consumed if stock.get(i, 0.0) <= PROSPERITY_SHORTAGE_LEVEL)
-            if shortages:
-                delta = PROSPERITY_SHORTAGE_DRIFT * shortages * hours
-            elif all(stock.get(i, 0.0) >= ECON_EQUILIBRIUM_STOCK for i in consumed):
-                delta = PROSPERITY_COMFORT_DRIFT * hours
-            else:
-                continue
-            self.adjust_prosperity(location_id, delta)
-
     def adjust_prosperity(self, location_id: str, delta: float) -> None:
         level = self.prosperity.get(location_id, PROSPERITY_START) + delta
         self.prosperity[location_id] = max(PROSPERITY_MIN, min(PROSPERITY_MAX, level))
@@ -33,6 +33,7 @@ def equip_item(world, entity, item_id):
             esper.dispatch_event("log_message", f"You unequip the {old_item_name}.")
 
         equipment.slots[slot] = item_id
+        esper.dispatch_event("stats_changed", entity)
         esper.dispatch_event("log_message", f"You equip the {item_name}.")
 
 
@@ -48,4 +49,5 @@ def unequip_item(world, entity, slot):
         item_id = equipment.slots[slot]
         item_name = world.component_for_entity(item_id, Name).name if world.has_component(item_id, Name) else "item"
         equipment.slots[slot] = None
+        esper.dispatch_event("stats_changed", entity)
         esper.dispatch_event("log_message", f"You unequip the {item_name}.")
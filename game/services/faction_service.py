@@ -17,7 +17,6 @@ and to the player — the missing matrix the world has lacked.
   when standing recovers); the existing chase/bump logic does the rest.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 
@@ -33,6 +32,7 @@ from config import (
     FACTION_TRUSTED,
 )
 from game.components import AIBehaviorState, Alignment, Animal, Corpse, Faction, PlayerTag, TemplateId
+from game.content.content_cache import read_json
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +52,7 @@ class FactionService:
     # --- Loading ------------------------------------------------------------
 
     def load(self, filepath: str) -> None:
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(filepath)
         for fid, fdef in data.get("factions", {}).items():
             self.standing.setdefault(fid, int(fdef.get("player_start", 0)))
             self.relations[fid] = dict(fdef.get("relations", {}))
@@ -1,19 +1,25 @@
-import json
+import bisect
 import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 
 import esper as _esper
 
 from config import SpriteLayer
+from core.ecs import isolated_world
+from core.noise import quantile_cutoffs, value_noise
 from core.rng import derive_seed
 from game.components import LightSource, MapBound, Name, Portal, Position, Renderable
+from game.content.content_cache import read_json
 from game.content.entity_factory import EntityFactory
 from game.content.item_factory import ItemFactory
+from game.map.chunked_map_container import CHUNK_SIZE, ChunkedMapContainer, register_chunk_source
 from game.map.map_container import MapContainer
 from game.map.map_generator_utils import draw_rectangle, get_nearest_walkable_tile
-from game.map.map_layer import MapLayer
-from game.map.tile import Tile, VisibilityState
+from game.map.map_layer import KEEP, MapLayer
+from game.map.tile import Tile, VisibilityState, resolve_tile_type
 from game.services.gather_service import create_resource_node
 from game.services.housing_service import HousingService
 from game.services.map_service import MapService
@@ -21,6 +27,14 @@ from game.services.social_service import SocialService
 from game.services.spawn_service import SpawnService
 
 WILDERNESS_SIZE = 40
+# Tiles per lattice step of the wilderness terrain noise (clump size).
+WILDERNESS_NOISE_SCALE = 6.0
+# Wildernesses at least this wide are streamed in chunks (ChunkedMapContainer)
+# instead of being generated and kept whole.
+WILDERNESS_STREAM_SIZE = 96
+# Side of the sample window a streamed wilderness calibrates its terrain
+# cutoffs on.
+WILDERNESS_CALIBRATION_SIZE = 64
 
 # House style -> wall material for both the exterior shell and the interior.
 HOUSE_WALL_MATERIAL = {"home": "wall_wood", "tavern": "wall_wood", "shop": "wall_stone"}
@@ -83,14 +97,49 @@ LIGHT_PROPS = {
 }
 
 
+def _classify_terrain(
+    feature_noise: list[list[float]],
+    patch_noise: list[list[float]],
+    feature_cuts: list[float],
+    patch_cuts: list[float],
+    n_features: int,
+    n_patches: int,
+) -> list[list[int]]:
+    """Wilderness palette indices from two noise fields and their cutoffs.
+
+    Palette order: base, features, patches. bisect_right gives the band
+    counted from the lowest: band k of n is table entry n - k (palette index
+    n - k + 1), band 0 is "none"; a feature wins over a patch.
+    """
+    feature_index = [0] + [n_features - k + 1 for k in range(1, n_features + 1)]
+    patch_index = [0] + [n_features + n_patches - k + 1 for k in range(1, n_patches + 1)]
+    return [
+        [
+            feature_index[bisect.bisect_right(feature_cuts, f)] or patch_index[bisect.bisect_right(patch_cuts, p)]
+            for f, p in zip(feature_row, patch_row, strict=True)
+        ]
+        for feature_row, patch_row in zip(feature_noise, patch_noise, strict=True)
+    ]
+
+
+def _clear_arrival(grid: list[list[int]], arrival: tuple[int, int], origin: tuple[int, int]) -> None:
+    """Reset the 5x5 clearing around `arrival` to the base (index 0) in a grid placed at `origin`."""
+    ax, ay = arrival[0] - origin[0], arrival[1] - origin[1]
+    height, width = len(grid), len(grid[0]) if grid else 0
+    x0, x1 = max(0, ax - 2), min(width, ax + 3)
+    for y in range(max(0, ay - 2), min(height, ay + 3)):
+        if x0 < x1:
+            grid[y][x0:x1] = [0] * (x1 - x0)
+
+
 def wilderness_map_id(settlement_id: str) -> str:
     """Map id of a settlement's surrounding wilderness."""
     return f"{settlement_id} Wilderness"
 
 
-def wilderness_arrival_pos() -> tuple[int, int]:
+def wilderness_arrival_pos(size: int = WILDERNESS_SIZE) -> tuple[int, int]:
     """Where the player enters the wilderness (kept clear of features)."""
-    return (WILDERNESS_SIZE // 2, WILDERNESS_SIZE - 3)
+    return (size // 2, size - 3)
 
 
 @dataclass
@@ -105,6 +154,100 @@ class HouseGenConfig:
     style: str = "home"
 
 
+def _scaled_count(expected: float, rng: random.Random) -> int:
+    """A whole count whose average is `expected` (the fraction becomes a roll)."""
+    whole = int(expected)
+    return whole + (rng.random() < expected - whole)
+
+
+@register_chunk_source
+class WildernessChunkSource:
+    """Generates a streamed wilderness (ChunkedMapContainer) chunk by chunk.
+
+    Same terrain recipe as MapGenerator.create_wilderness, but every chunk
+    is built on its own: the noise fields are seamless across chunks, the
+    feature/patch cutoffs are calibrated once on a sample window, and big
+    trees, wildlife and resources come at the biome's per-area density from
+    a per-chunk RNG. A chunk therefore comes out the same no matter when or
+    in which order it is first visited.
+    """
+
+    kind = "wilderness"
+
+    def __init__(self, biome_id: str, seed: int, size: int):
+        self.biome_id = biome_id
+        self.seed = seed
+        self.size = size
+        self.biome = read_json("assets/data/biomes.json")[biome_id]
+        features = self.biome.get("features", [])
+        patches = self.biome.get("patches", [])
+        self._counts = (len(features), len(patches))
+        self.palette = [
+            self.biome["base"],
+            *(type_id for type_id, _ in features + patches),
+            "tree_canopy",
+            "tree_trunk",
+        ]
+        self._walkable = [resolve_tile_type(type_id).walkable for type_id in self.palette]
+        rng = random.Random(seed)
+        self._feature_seed = rng.getrandbits(32)
+        self._patch_seed = rng.getrandbits(32)
+        sample = min(size, WILDERNESS_CALIBRATION_SIZE)
+        self._feature_cuts = quantile_cutoffs(
+            value_noise(sample, sample, self._feature_seed, scale=WILDERNESS_NOISE_SCALE),
+            [chance for _, chance in features],
+        )
+        self._patch_cuts = quantile_cutoffs(
+            value_noise(sample, sample, self._patch_seed, scale=WILDERNESS_NOISE_SCALE),
+            [chance for _, chance in patches],
+        )
+
+    def to_dict(self) -> dict:
+        return {"biome_id": self.biome_id, "seed": self.seed, "size": self.size}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WildernessChunkSource":
+        return cls(data["biome_id"], data["seed"], data["size"])
+
+    def _rng(self, label: str, cx: int, cy: int) -> random.Random:
+        return random.Random(derive_seed(self.seed, f"{label}:{cx},{cy}"))
+
+    def _density(self, per_map: float, w: int, h: int) -> float:
+        """A per-40x40-map biome count scaled to a w x h area."""
+        return per_map * w * h / (WILDERNESS_SIZE * WILDERNESS_SIZE)
+
+    def generate(self, cx: int, cy: int, x0: int, y0: int, w: int, h: int) -> list[list[list[int]]]:
+        feature_noise = value_noise(w, h, self._feature_seed, scale=WILDERNESS_NOISE_SCALE, origin=(x0, y0))
+        patch_noise = value_noise(w, h, self._patch_seed, scale=WILDERNESS_NOISE_SCALE, origin=(x0, y0))
+        grid = _classify_terrain(feature_noise, patch_noise, self._feature_cuts, self._patch_cuts, *self._counts)
+        arrival = wilderness_arrival_pos(self.size)
+        _clear_arrival(grid, arrival, (x0, y0))
+        # Big trees stay inside their chunk so neighbours never cut a stamp.
+        rng = self._rng("trees", cx, cy)
+        count = _scaled_count(self._density(self.biome.get("big_trees", 0), w, h), rng)
+        clearing = (arrival[0] - x0, arrival[1] - y0)
+        MapGenerator._stamp_big_trees(grid, self._walkable, count, rng, clearing)
+        return [grid]
+
+    def populate(self, world, container, cx: int, cy: int) -> None:
+        bounds = container.chunk_bounds(cx, cy)
+        _x0, _y0, w, h = bounds
+        ax, ay = wilderness_arrival_pos(self.size)
+        clearing = {(x, y) for x in range(ax - 2, ax + 3) for y in range(ay - 2, ay + 3)}
+        spots = container.layers[0].walkable_index.positions(exclude=clearing, region=bounds)
+        rng = self._rng("population", cx, cy)
+        rng.shuffle(spots)
+        spots.reverse()
+        for template_id, count in self.biome.get("spawns", []):
+            for _ in range(_scaled_count(self._density(count, w, h), rng)):
+                if spots:
+                    EntityFactory.create(world, template_id, *spots.pop())
+        for kind, count in self.biome.get("resources", []):
+            for _ in range(_scaled_count(self._density(count, w, h), rng)):
+                if spots:
+                    create_resource_node(world, kind, *spots.pop(), 0)
+
+
 class MapGenerator:
     def __init__(self, map_service: MapService, seed: int | None = None):
         """Args:
@@ -156,18 +299,18 @@ class MapGenerator:
                 if not (0 <= yy < ground.height and 0 <= xx < ground.width):
                     continue
                 # Open floor underfoot, a roof overhead.
-                ground.tiles[yy][xx].set_type("floor_wood")
-                roof.tiles[yy][xx].set_type(SHELTER_ROOF)
+                ground.set_tile_type(xx, yy, "floor_wood")
+                roof.set_tile_type(xx, yy, SHELTER_ROOF)
 
         # Corner posts hold the roof up; the sides stay open to walk through.
         for cx, cy in ((x0, y0), (x0 + w - 1, y0), (x0, y0 + h - 1), (x0 + w - 1, y0 + h - 1)):
             if 0 <= cy < ground.height and 0 <= cx < ground.width:
-                ground.tiles[cy][cx].set_type("wall_wood")
+                ground.set_tile_type(cx, cy, "wall_wood")
 
         # The workstation sits at the heart of the shelter.
         sx, sy = x0 + w // 2, y0 + h // 2
         if 0 <= sy < ground.height and 0 <= sx < ground.width:
-            ground.tiles[sy][sx].set_type(station_tile)
+            ground.set_tile_type(sx, sy, station_tile)
 
         if spec.get("light", True):
             lx, ly = get_nearest_walkable_tile(ground, x0 + w // 2, y0 + h - 1)
@@ -179,17 +322,10 @@ class MapGenerator:
         if spec is None:
             return
 
-        def paint(x: int, y: int) -> None:
-            if not (0 <= y < layer.height and 0 <= x < layer.width):
-                return
-            tile = layer.tiles[y][x]
-            if tile.type_id in DECOR_PAINTABLE:
-                tile.set_type(spec["tile"])
-
-        if spec["fill_node"]:
-            paint(nx, ny)
-
+        # Roll the patch into a mask around the node, then paint it in one go.
         r = spec["radius"]
+        mask = [[False] * (2 * r + 1) for _ in range(2 * r + 1)]
+        mask[r][r] = spec["fill_node"]
         for dy in range(-r, r + 1):
             for dx in range(-r, r + 1):
                 if dx == 0 and dy == 0:
@@ -199,7 +335,8 @@ class MapGenerator:
                 if spec["blocking"] and abs(dx) + abs(dy) == 1:
                     continue
                 if self._rng.random() < spec["chance"]:
-                    paint(nx + dx, ny + dy)
+                    mask[r + dy][r + dx] = True
+        layer.paint_mask(mask, spec["tile"], origin=(nx - r, ny - r), only=DECOR_PAINTABLE)
 
     def apply_terrain_variety(self, layer: MapLayer, chance: float, type_id_choices: list):
         """
@@ -210,13 +347,16 @@ class MapGenerator:
             chance:           Probability (0-1) of replacing each floor tile.
             type_id_choices:  List of registry type_ids to randomly choose from.
         """
-        for y in range(layer.height):
-            for x in range(layer.width):
-                tile = layer.tiles[y][x]
+        indices = range(len(type_id_choices))
+        grid = [
+            [
                 # Only apply to walkable ground tiles (floor_stone equivalent).
-                if tile.walkable and self._rng.random() < chance:
-                    type_id = self._rng.choice(type_id_choices)
-                    tile.set_type(type_id)
+                self._rng.choice(indices) if tile.walkable and self._rng.random() < chance else KEEP
+                for tile in row
+            ]
+            for row in layer.tiles
+        ]
+        layer.paint_array(grid, type_id_choices)
 
     def add_house_to_map(
         self,
@@ -235,14 +375,7 @@ class MapGenerator:
         # Ensure we have enough layers in the container
         while len(map_container.layers) < config.num_layers:
             # Create a blank layer if needed
-            tiles = []
-            for y in range(map_container.height):
-                row = []
-                for x in range(map_container.width):
-                    tile = Tile(type_id="floor_stone")
-                    row.append(tile)
-                tiles.append(row)
-            map_container.layers.append(MapLayer(tiles))
+            map_container.layers.append(MapLayer.filled(map_container.width, map_container.height, "floor_stone"))
 
         map_id = None
         # Find map_id by value in self.map_service.maps
@@ -261,7 +394,7 @@ class MapGenerator:
             self._add_windows(layer, config)
             if z == 0:
                 # Front door in the south wall (matches the exterior shell)
-                layer.tiles[config.start_y + config.h - 1][config.start_x + config.w // 2].set_type("door_wood")
+                layer.set_tile_type(config.start_x + config.w // 2, config.start_y + config.h - 1, "door_wood")
 
             # 3. Place stairs
             # Alternate positions to ensure they never overlap on the same layer
@@ -296,10 +429,10 @@ class MapGenerator:
     def _add_windows(layer: MapLayer, config: HouseGenConfig) -> None:
         """Cut windows into the north, west and east walls (every 3rd tile)."""
         for x in range(config.start_x + 2, config.start_x + config.w - 2, 3):
-            layer.tiles[config.start_y][x].set_type("wall_window")
+            layer.set_tile_type(x, config.start_y, "wall_window")
         for y in range(config.start_y + 2, config.start_y + config.h - 2, 3):
-            layer.tiles[y][config.start_x].set_type("wall_window")
-            layer.tiles[y][config.start_x + config.w - 1].set_type("wall_window")
+            layer.set_tile_type(config.start_x, y, "wall_window")
+            layer.set_tile_type(config.start_x + config.w - 1, y, "wall_window")
 
     @staticmethod
     def _furnish_house(map_container: MapContainer, config: HouseGenConfig) -> None:
@@ -329,7 +462,7 @@ class MapGenerator:
                 return
             tile = layer.tiles[y][x]
             if tile.walkable and tile._type_id == "floor_wood":
-                tile.set_type(type_id)
+                layer.set_tile_type(x, y, type_id)
 
         def table_with_chairs(layer, x, y):
             place(layer, x, y, "furniture_table")
@@ -375,32 +508,107 @@ class MapGenerator:
                     place(layer, cx, config.start_y + 1, "furniture_bed")
                     place(layer, cx + 1, config.start_y + 1, "furniture_shelf")
 
-    def create_world(self, world, world_graph) -> None:
+    def create_world(self, world, world_graph, on_demand: bool = False, workers: int = 1) -> None:
         """Build a map for every location on the world graph, then activate
         the start location (ROADMAP Phase A; POI dungeons: Phase F).
 
+        Every location is generated in its own isolated ECS world, so eager,
+        parallel and on-demand generation all produce identical maps.
+
         Args:
             world: The ECS world.
             world_graph: WorldGraphService with locations referencing scenarios.
+            on_demand: Defer every location to a generator thunk on the
+                MapService (see defer_locations()); only the start location
+                is built now, the rest on first entry.
+            workers: With more than one, build the locations in a process
+                pool (see generate_parallel()). Ignored when on_demand.
         """
-        for location in world_graph.locations.values():
-            if location.type == "settlement":
-                scenario_path = f"assets/data/scenarios/{location.scenario}.json"
-                self.create_scenario(world, scenario_path, map_id=location.id)
-            elif location.type == "poi":
-                self.create_dungeon(
-                    world,
-                    map_id=location.id,
-                    seed=self._map_seed(location.id),
-                    monsters=location.monsters or None,
-                    cache=location.cache or None,
-                    resources=location.resources or None,
-                )
+        if on_demand:
+            self.defer_locations(world_graph)
+        elif workers > 1:
+            self.generate_parallel(world_graph, workers)
+        else:
+            for location in world_graph.locations.values():
+                self._generate_isolated(location)
 
         start_id = world_graph.start_location_id
         self.map_service.set_active_map(start_id)
         self.map_service.get_map(start_id).thaw(world)
 
+    def location_map_ids(self, location) -> list[str]:
+        """Every map id generate_location() registers for a location: a
+        settlement's exterior, its structure interiors and its wilderness;
+        a POI's dungeon. Empty for location types without a map."""
+        if location.type == "poi":
+            return [location.id]
+        if location.type != "settlement":
+            return []
+        config = read_json(f"assets/data/scenarios/{location.scenario}.json")
+        map_ids = [location.id] + [h["id"] for h in config.get("structures", [])]
+        if config.get("biome"):
+            map_ids.append(wilderness_map_id(location.id))
+        return map_ids
+
+    def generate_location(self, world, location) -> None:
+        """Build and register (frozen) every map belonging to one location."""
+        if location.type == "settlement":
+            scenario_path = f"assets/data/scenarios/{location.scenario}.json"
+            self.create_scenario(world, scenario_path, map_id=location.id)
+        elif location.type == "poi":
+            self.create_dungeon(
+                world,
+                map_id=location.id,
+                seed=self._map_seed(location.id),
+                monsters=location.monsters or None,
+                cache=location.cache or None,
+                resources=location.resources or None,
+            )
+
+    def defer_locations(self, world_graph) -> None:
+        """Register a generator thunk per location whose maps neither exist
+        nor are already pending.
+
+        Each thunk builds its location inside an isolated ECS world (freeze()
+        sweeps every live MapBound entity, which must not include the active
+        map's population) and leaves the result frozen, exactly like eager
+        generation. Layouts derive from ``_map_seed`` so a location comes out
+        the same whenever — and in whatever order — it is first entered. The
+        economy and chronicle work on world-graph ids, not maps, and carry on
+        regardless.
+        """
+        for location in world_graph.locations.values():
+            map_ids = self.location_map_ids(location)
+            if not map_ids or any(
+                self.map_service.is_generated(mid) or mid in self.map_service.pending for mid in map_ids
+            ):
+                continue
+            self.map_service.register_deferred(map_ids, partial(self._generate_isolated, location))
+
+    def _generate_isolated(self, location) -> None:
+        with isolated_world():
+            self.generate_location(_esper, location)
+
+    def generate_parallel(self, world_graph, workers: int) -> None:
+        """Build every location in a process pool and register the results.
+
+        Each worker generates one location in an isolated world from the
+        same per-map seeds as serial generation and ships back its frozen
+        MapContainers (tile layers plus entity component lists — the spawn
+        manifest). They are registered here in world-graph order, so the
+        result is identical to the serial path. Wall time approaches that of
+        the slowest location.
+        """
+        locations = [loc for loc in world_graph.locations.values() if loc.type in ("settlement", "poi")]
+        if not locations:
+            return
+        with ProcessPoolExecutor(max_workers=min(workers, len(locations)), initializer=_init_worldgen_worker) as pool:
+            for maps in pool.map(_generate_location_maps, [self.seed] * len(locations), locations):
+                for map_id, container in maps.items():
+                    if self.map_service.is_generated(map_id):
+                        raise ValueError(f"Map id '{map_id}' is already registered.")
+                    self.map_service.register_map(map_id, container)
+
     def create_village_scenario(self, world):
         """Creates the default village scenario and activates it (legacy entry point)."""
         container = self.create_scenario(world, "assets/data/scenarios/village.json")
@@ -422,23 +630,16 @@ class MapGenerator:
         Returns:
             The (frozen) exterior MapContainer.
         """
-        with open(scenario_path) as f:
-            config = json.load(f)
+        config = read_json(scenario_path)
 
         map_id = map_id or config["id"]
+        if self.seed is not None:
+            # Per-settlement stream: the layout must not depend on which
+            # settlements were generated before this one (on-demand worlds).
+            self._rng.seed(self._map_seed(map_id))
 
         def create_empty_layer(width, height, fill_type_id: str | None = None):
-            tiles = []
-            for y in range(height):
-                row = []
-                for x in range(width):
-                    if fill_type_id:
-                        tile = Tile(type_id=fill_type_id)
-                    else:
-                        tile = Tile(type_id="floor_stone")
-                    row.append(tile)
-                tiles.append(row)
-            return MapLayer(tiles)
+            return MapLayer.filled(width, height, fill_type_id or "floor_stone")
 
         v_width = config["dimensions"]["width"]
         v_height = config["dimensions"]["height"]
@@ -480,10 +681,10 @@ class MapGenerator:
 
             # Front door in the south wall, a window on either side
             door_vx, door_vy = vx + vw // 2, vy + vh - 1
-            village_layers[0].tiles[door_vy][door_vx].set_type("door_wood")
+            village_layers[0].set_tile_type(door_vx, door_vy, "door_wood")
             for wx in (door_vx - 2, door_vx + 2):
                 if vx < wx < vx + vw - 1:
-                    village_layers[0].tiles[door_vy][wx].set_type("wall_window")
+                    village_layers[0].set_tile_type(wx, door_vy, "wall_window")
 
             # Portal into the house sits on the doorstep
             world.create_entity(
@@ -508,7 +709,7 @@ class MapGenerator:
         # player bumps the (non-walkable) station tile to open its bench.
         for station in config.get("stations", []):
             sx, sy = get_nearest_walkable_tile(village_layers[0], station["pos"][0], station["pos"][1])
-            village_layers[0].tiles[sy][sx].set_type(STATION_TILES.get(station["type"], "station_forge"))
+            village_layers[0].set_tile_type(sx, sy, STATION_TILES.get(station["type"], "station_forge"))
 
         # Open-shelter workshops: roofed but wall-less workspaces wrapping a
         # station, with the roof drawn as a cutaway overlay (multi-level reveal).
@@ -540,8 +741,9 @@ class MapGenerator:
         # Settlements are civilized ground: no random monster spawns here.
         # Wildlife and monsters live in the settlement's wilderness map.
         wild_portal_pos = None
+        wild_size = config.get("wilderness_size", WILDERNESS_SIZE)
         if config.get("biome"):
-            wild_portal_pos = self._add_wilderness_portal(world, village_container, map_id)
+            wild_portal_pos = self._add_wilderness_portal(world, village_container, map_id, wild_size)
 
         village_container.freeze(world)
 
@@ -571,7 +773,7 @@ class MapGenerator:
             if h.get("station"):
                 station_tile = STATION_TILES.get(h["station"], "station_forge")
                 stx, sty = get_nearest_walkable_tile(h_container.layers[0], hi // 2, 2)
-                h_container.layers[0].tiles[sty][stx].set_type(station_tile)
+                h_container.layers[0].set_tile_type(stx, sty, station_tile)
 
             # --- SPAWN HOUSE NPCS ---
             for npc in h.get("npcs", []):
@@ -599,23 +801,29 @@ class MapGenerator:
             h_container.freeze(world)
 
         # 3. The surrounding wilderness, flavored by the settlement's biome
+        # (a scenario's "wilderness_size" of WILDERNESS_STREAM_SIZE or more
+        # gets a streamed, chunked region instead of a whole map).
         if config.get("biome") and wild_portal_pos is not None:
-            self.create_wilderness(
+            create = self.create_streamed_wilderness if wild_size >= WILDERNESS_STREAM_SIZE else self.create_wilderness
+            create(
                 world,
                 settlement_id=map_id,
                 biome_id=config["biome"],
                 return_pos=wild_portal_pos,
                 seed=self._map_seed(wilderness_map_id(map_id)),
+                size=wild_size,
             )
 
         return village_container
 
-    def _add_wilderness_portal(self, world, container: MapContainer, settlement_id: str) -> tuple[int, int]:
+    def _add_wilderness_portal(
+        self, world, container: MapContainer, settlement_id: str, size: int = WILDERNESS_SIZE
+    ) -> tuple[int, int]:
         """Place the 'into the wilds' portal near the settlement's arrival
         spot and return its position (the wilderness return target)."""
         ax, ay = container.arrival_pos or (1, 1)
         px, py = get_nearest_walkable_tile(container.layers[0], ax + 2, ay)
-        wx, wy = wilderness_arrival_pos()
+        wx, wy = wilderness_arrival_pos(size)
         world.create_entity(
             MapBound(),
             Position(px, py, 0),
@@ -632,6 +840,7 @@ class MapGenerator:
         biome_id: str,
         return_pos: tuple[int, int],
         seed: int | None = None,
+        size: int = WILDERNESS_SIZE,
     ) -> MapContainer:
         """Generate the biome-flavored wilderness surrounding a settlement.
 
@@ -640,42 +849,40 @@ class MapGenerator:
         come from assets/data/biomes.json. A clearing around the arrival
         spot stays free so the return portal is always reachable.
 
+        Terrain comes from two seeded value-noise fields (core.noise): the
+        biome's features (trees, water) take the highest cells of one, its
+        patches (dirt, grass) the highest remaining cells of the other, each
+        covering its table share of the map — so they grow in clumps rather
+        than as scattered single tiles. ``size`` may exceed the default;
+        big trees, wildlife and resources scale with the map's area.
+
         Must be called AFTER the settlement maps are frozen — freeze()
         collects every live MapBound entity.
         """
-        with open("assets/data/biomes.json") as f:
-            biome = json.load(f)[biome_id]
+        biome = read_json("assets/data/biomes.json")[biome_id]
         rng = random.Random(seed)
-        size = WILDERNESS_SIZE
-        ax, ay = wilderness_arrival_pos()
-
-        tiles = [[Tile(type_id=biome["base"]) for _ in range(size)] for _ in range(size)]
-        layer = MapLayer(tiles)
-        for y in range(size):
-            for x in range(size):
-                # Keep a clearing around the arrival/return spot
-                if abs(x - ax) <= 2 and abs(y - ay) <= 2:
-                    continue
-                roll = rng.random()
-                threshold = 0.0
-                placed = False
-                for type_id, chance in biome.get("features", []):
-                    threshold += chance
-                    if roll < threshold:
-                        tiles[y][x].set_type(type_id)
-                        placed = True
-                        break
-                if placed:
-                    continue
-                for type_id, chance in biome.get("patches", []):
-                    threshold += chance
-                    if roll < threshold:
-                        tiles[y][x].set_type(type_id)
-                        break
+        ax, ay = wilderness_arrival_pos(size)
+        area_scale = size * size / (WILDERNESS_SIZE * WILDERNESS_SIZE)
+
+        # The layout is built as palette indices and turned into tiles in one
+        # pass: index 0 is the biome's base, then features and patches in
+        # table order, then the two big-tree tiles.
+        features = biome.get("features", [])
+        patches = biome.get("patches", [])
+        palette = [biome["base"], *(type_id for type_id, _ in features + patches), "tree_canopy", "tree_trunk"]
+        feature_noise = value_noise(size, size, rng.getrandbits(32), scale=WILDERNESS_NOISE_SCALE)
+        patch_noise = value_noise(size, size, rng.getrandbits(32), scale=WILDERNESS_NOISE_SCALE)
+        feature_cuts = quantile_cutoffs(feature_noise, [chance for _, chance in features])
+        patch_cuts = quantile_cutoffs(patch_noise, [chance for _, chance in patches])
+        grid = _classify_terrain(feature_noise, patch_noise, feature_cuts, patch_cuts, len(features), len(patches))
+        _clear_arrival(grid, (ax, ay), (0, 0))
 
         # Big trees: 3x3 stamps with a blocking trunk and a walkable,
         # view-blocking canopy ring (count comes from the biome data).
-        self._stamp_big_trees(tiles, biome.get("big_trees", 0), rng, (ax, ay))
+        walkable = [resolve_tile_type(type_id).walkable for type_id in palette]
+        big_trees = round(biome.get("big_trees", 0) * area_scale)
+        self._stamp_big_trees(grid, walkable, big_trees, rng, (ax, ay))
+        layer = MapLayer.from_type_array(grid, palette)
 
         container = MapContainer([layer], arrival_pos=(ax, ay))
         map_id = wilderness_map_id(settlement_id)
@@ -696,16 +903,12 @@ class MapGenerator:
         self.place_light(world, "campfire", ax - 2, ay - 1)
 
         # Wildlife per the biome's spawn table
-        walkable = [
-            (x, y)
-            for y in range(size)
-            for x in range(size)
-            if tiles[y][x].walkable and not (abs(x - ax) <= 2 and abs(y - ay) <= 2)
-        ]
+        clearing = {(x, y) for x in range(ax - 2, ax + 3) for y in range(ay - 2, ay + 3)}
+        walkable = layer.walkable_index.positions(exclude=clearing)
         rng.shuffle(walkable)
         cursor = 0
         for template_id, count in biome.get("spawns", []):
-            for _ in range(count):
+            for _ in range(round(count * area_scale)):
                 if cursor >= len(walkable):
                     break
                 x, y = walkable[cursor]
@@ -714,7 +917,7 @@ class MapGenerator:
 
         # Harvestable resource nodes scattered per the biome's resource table.
         for kind, count in biome.get("resources", []):
-            for _ in range(count):
+            for _ in range(round(count * area_scale)):
                 if cursor >= len(walkable):
                     break
                 x, y = walkable[cursor]
@@ -724,32 +927,95 @@ class MapGenerator:
         container.freeze(world)
         return container
 
-    @staticmethod
-    def _stamp_big_trees(tiles: list, count: int, rng: random.Random, clearing: tuple[int, int]) -> None:
-        """Stamp up to `count` 3x3 trees onto a wilderness tile grid.
+    def create_streamed_wilderness(
+        self,
+        world,
+        settlement_id: str,
+        biome_id: str,
+        return_pos: tuple[int, int],
+        seed: int | None = None,
+        size: int = WILDERNESS_STREAM_SIZE,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> ChunkedMapContainer:
+        """A large wilderness streamed in chunks (see ChunkedMapContainer).
+
+        Only the chunks around the arrival spot are generated now; the rest
+        are generated from the seed as the player approaches them
+        (ChunkStreamingSystem) and evicted again once they are left behind.
+        Same biome recipe, return portal and campfire as create_wilderness.
+
+        Must be called AFTER the settlement maps are frozen — freeze()
+        collects every live MapBound entity.
+        """
+        if seed is None:
+            seed = random.getrandbits(32)
+        source = WildernessChunkSource(biome_id, seed, size)
+        ax, ay = wilderness_arrival_pos(size)
+        container = ChunkedMapContainer(size, size, source, chunk_size=chunk_size, arrival_pos=(ax, ay))
+        map_id = wilderness_map_id(settlement_id)
+        if self.map_service.get_map(map_id) is not None:
+            raise ValueError(f"Map id '{map_id}' is already registered.")
+        self.map_service.register_map(map_id, container)
+
+        container.stream(world, ax, ay)
+        world.create_entity(
+            MapBound(),
+            Position(ax, ay + 1, 0),
+            Portal(settlement_id, return_pos[0], return_pos[1], 0, f"Back to {settlement_id}", travel_ticks=10),
+            Renderable("&", SpriteLayer.DECOR_BOTTOM.value, (200, 180, 80)),
+            Name(f"Path back to {settlement_id}"),
+        )
+        self.place_light(world, "campfire", ax - 2, ay - 1)
 
-        Each tree is a blocking tree_trunk surrounded by eight tree_canopy
-        tiles (walkable, but they block line of sight — forests cast real
-        view shadows). Stamps only go onto fully walkable ground, never
-        into the arrival clearing, and never overlap each other.
+        container.freeze(world)
+        return container
+
+    @staticmethod
+    def _stamp_big_trees(
+        grid: list[list[int]], walkable: list[bool], count: int, rng: random.Random, clearing: tuple[int, int]
+    ) -> None:
+        """Stamp up to `count` 3x3 trees onto a wilderness palette grid.
+
+        `grid` holds indices into a palette whose last two entries are
+        tree_canopy and tree_trunk; `walkable` is the palette's walkable
+        flags. Each tree is a blocking tree_trunk surrounded by eight
+        tree_canopy tiles (walkable, but they block line of sight — forests
+        cast real view shadows). Stamps only go onto fully walkable ground,
+        never into the arrival clearing, and never overlap each other.
+
+        Candidate centres (3x3 fully walkable) are found in one pass over
+        the grid and shuffled, so placement never burns random retries on
+        large or crowded maps.
         """
-        size = len(tiles)
+        canopy, trunk = len(walkable) - 2, len(walkable) - 1
+        height, width = len(grid), len(grid[0]) if grid else 0
         ax, ay = clearing
-        placed = 0
-        attempts = count * 20
-        while placed < count and attempts > 0:
-            attempts -= 1
-            cx = rng.randint(1, size - 2)
-            cy = rng.randint(1, size - 2)
+        # run[y][x]: cells x-1..x+1 of row y are all walkable
+        run = []
+        for row in grid:
+            ok = [walkable[index] for index in row]
+            run.append([False] + [a and b and c for a, b, c in zip(ok, ok[1:], ok[2:], strict=False)] + [False])
+        candidates = [
+            (cx, cy)
+            for cy in range(1, height - 1)
+            for cx in range(1, width - 1)
+            if run[cy - 1][cx]
+            and run[cy][cx]
+            and run[cy + 1][cx]
             # Keep the arrival/return clearing (and one tile of margin) open
-            if abs(cx - ax) <= 3 and abs(cy - ay) <= 3:
-                continue
+            and not (abs(cx - ax) <= 3 and abs(cy - ay) <= 3)
+        ]
+        rng.shuffle(candidates)
+        placed = 0
+        for cx, cy in candidates:
+            if placed >= count:
+                break
             area = [(cx + dx, cy + dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
-            if not all(tiles[y][x].walkable and tiles[y][x]._type_id != "tree_canopy" for x, y in area):
+            if any(grid[y][x] >= canopy for x, y in area):
                 continue
             for x, y in area:
-                tiles[y][x].set_type("tree_canopy")
-            tiles[cy][cx].set_type("tree_trunk")
+                grid[y][x] = canopy
+            grid[cy][cx] = trunk
             placed += 1
 
     def create_dungeon(
@@ -785,8 +1051,9 @@ class MapGenerator:
         cache = cache or ["steel_sword", "health_potion"]
 
         rng = random.Random(seed)
-        tiles = [[Tile(type_id="wall_stone") for _ in range(width)] for _ in range(height)]
-        layer = MapLayer(tiles)
+        # Carved as a wall/floor grid (palette below), then built in one pass.
+        wall, floor = 0, 1
+        grid = [[wall] * width for _ in range(height)]
 
         # 1. Carve rooms
         rooms: list[tuple[int, int, int, int]] = []  # (x, y, w, h)
@@ -802,8 +1069,7 @@ class MapGenerator:
                 continue
             rooms.append((rx, ry, rw, rh))
             for y in range(ry, ry + rh):
-                for x in range(rx, rx + rw):
-                    tiles[y][x].set_type("floor_stone")
+                grid[y][rx : rx + rw] = [floor] * rw
 
         # 2. Connect consecutive rooms with L-corridors
         def center(room):
@@ -813,18 +1079,18 @@ class MapGenerator:
         for a, b in zip(rooms, rooms[1:], strict=False):
             ax, ay = center(a)
             bx, by = center(b)
-            for x in range(min(ax, bx), max(ax, bx) + 1):
-                tiles[ay][x].set_type("floor_stone")
+            grid[ay][min(ax, bx) : max(ax, bx) + 1] = [floor] * (abs(ax - bx) + 1)
             for y in range(min(ay, by), max(ay, by) + 1):
-                tiles[y][bx].set_type("floor_stone")
+                grid[y][bx] = floor
 
+        layer = MapLayer.from_type_array(grid, ["wall_stone", "floor_stone"])
         container = MapContainer([layer], arrival_pos=center(rooms[0]))
         if self.map_service.get_map(map_id) is not None:
             raise ValueError(f"Map id '{map_id}' is already registered.")
         self.map_service.register_map(map_id, container)
 
         # 3. Monsters guard the place (themed pool when the POI defines one)
-        SpawnService.spawn_monsters(world, container, density=monster_density, monsters=monsters)
+        SpawnService.spawn_monsters(world, container, density=monster_density, monsters=monsters, rng=rng)
 
         # 3b. Resource nodes seeded through the middle rooms (themed POIs only,
         # e.g. ore/coal/gem veins in the Abandoned Mine). Each goes at a room
@@ -860,7 +1126,7 @@ class MapGenerator:
 
                 # Add some random decor (preserved as sprite override)
                 if x == 5 and y == 5:
-                    tile.sprites[SpriteLayer.DECOR_BOTTOM] = "T"
+                    tile.set_sprite(SpriteLayer.DECOR_BOTTOM, "T")
 
                 row.append(tile)
             tiles.append(row)
@@ -877,7 +1143,7 @@ class MapGenerator:
         """Stamp a prefab JSON file onto an existing MapLayer at an offset.
 
         The prefab defines a 2D tile grid plus optional entity spawn points.
-        Tiles are mutated in-place via set_type(), preserving per-instance
+        Tiles are mutated in-place via set_tile_type(), preserving per-instance
         state such as visibility_state.
 
         Args:
@@ -893,8 +1159,7 @@ class MapGenerator:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Prefab file not found: '{filepath}'")
 
-        with open(filepath) as f:
-            data = json.load(f)
+        data = read_json(filepath)
 
         tiles_grid = data["tiles"]
         for row_idx, row in enumerate(tiles_grid):
@@ -902,8 +1167,29 @@ class MapGenerator:
                 tx = ox + col_idx
                 ty = oy + row_idx
                 if 0 <= ty < layer.height and 0 <= tx < layer.width:
-                    layer.tiles[ty][tx].set_type(type_id)
+                    layer.set_tile_type(tx, ty, type_id)
 
         for spawn in data.get("entities", []):
             nx, ny = get_nearest_walkable_tile(layer, ox + spawn["x"], oy + spawn["y"])
             EntityFactory.create(world, spawn["template_id"], nx, ny)
+
+
+def _init_worldgen_worker() -> None:
+    """Process-pool initializer: make sure the content registries are loaded.
+
+    Forked workers inherit the parent's registries; spawned ones (macOS,
+    Windows) start empty and load the game's content themselves.
+    """
+    from game.map.tile_registry import tile_registry
+
+    if not tile_registry.all_ids():
+        from game.content.content_database import default_content
+
+        default_content.load("assets/data")
+
+
+def _generate_location_maps(seed: int | None, location) -> dict[str, MapContainer]:
+    """Process-pool task: generate one location, return its frozen maps."""
+    map_service = MapService()
+    MapGenerator(map_service, seed=seed)._generate_isolated(location)
+    return map_service.maps
@@ -1,3 +1,5 @@
+from collections.abc import Callable, Iterable
+
 from game.map.map_container import MapContainer
 
 
@@ -5,13 +7,44 @@ class MapService:
     def __init__(self):
         self.maps: dict[str, MapContainer] = {}
         self.active_map_id: str | None = None
+        # On-demand world generation: map id -> generator thunk that builds
+        # and registers that map (plus its siblings — a settlement's
+        # interiors and wilderness share one thunk) on first access.
+        self.pending: dict[str, Callable[[], None]] = {}
 
     def register_map(self, map_id: str, container: MapContainer):
         """Registers a map container under a unique ID."""
         self.maps[map_id] = container
 
+    def register_deferred(self, map_ids: Iterable[str], generate: Callable[[], None]) -> None:
+        """Defer generation of map_ids until one of them is first requested.
+
+        ``generate`` must register every id in ``map_ids`` via register_map.
+        """
+        for map_id in map_ids:
+            self.pending[map_id] = generate
+
+    def is_generated(self, map_id: str) -> bool:
+        """True if the map exists in memory (False while still deferred)."""
+        return map_id in self.maps
+
+    def materialize(self, map_id: str) -> None:
+        """Run the pending generator for map_id (no-op if none is pending).
+
+        The thunk is unregistered from all of its ids first, so the
+        generator's own duplicate-id checks never re-enter it.
+        """
+        generate = self.pending.get(map_id)
+        if generate is None:
+            return
+        for sibling in [mid for mid, thunk in self.pending.items() if thunk is generate]:
+            del self.pending[sibling]
+        generate()
+
     def get_map(self, map_id: str) -> MapContainer | None:
-        """Retrieves a map container by its ID."""
+        """Retrieves a map container by its ID, generating it on first access."""
+        if map_id not in self.maps and map_id in self.pending:
+            self.materialize(map_id)
         return self.maps.get(map_id)
 
     def get_active_map(self) -> MapContainer | None:
@@ -22,7 +55,7 @@ class MapService:
 
     def set_active_map(self, map_id: str):
         """Sets the active map ID."""
-        if map_id in self.maps:
+        if self.get_map(map_id) is not None:
             self.active_map_id = map_id
         else:
             raise ValueError(f"Map ID '{map_id}' not found in registry.")
@@ -3,6 +3,7 @@ import logging
 import esper
 
 from game.components import Position, Stats
+from game.map.layer_partition import layer_changed
 from game.services.map_generator import MapGenerator
 from game.services.party_service import get_entity_closure
 from game.services.world_simulation_service import WorldSimulationService
@@ -84,6 +85,7 @@ class MapTransitionService:
                 player_pos.x = target_x
                 player_pos.y = target_y
                 player_pos.layer = target_layer
+                layer_changed()
             except KeyError:
                 pass
 
@@ -91,6 +93,11 @@ class MapTransitionService:
         for system in ctx.systems.map_aware():
             system.set_map(new_map)
 
+        # Streamed maps: bring in the chunks around the arrival spot now,
+        # before anything looks at the tiles there.
+        if ctx.systems.chunk_streaming_system is not None:
+            ctx.systems.chunk_streaming_system.process()
+
         # Travel encounters: spawn the staged scene when entering a road
         # map; one-shot road maps are dropped once the player moved on.
         if ctx.travel_encounters is not None:
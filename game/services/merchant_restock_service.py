@@ -6,7 +6,10 @@ merchant's stock back toward its ``base_stock`` menu — one unit per good per
 hour — but only for goods the settlement still has in abstract stock, so a
 shortage (or a struggling economy) genuinely keeps the shelves bare.
 
-Subscribed to ``clock_tick`` in the bootstrap. Only live merchants (the current
+Subscribed to ``clock_tick`` in the bootstrap, and not coalescible: each hour
+is judged against the economy as it stands at that hour, so the service first
+brings the economy and then the chronicle (whose events and escalations shift
+stocks, at the current settlement too) up to that hour. Only live merchants (the current
 settlement) are touched; frozen ones catch up the next time they are active,
 using the elapsed-hour delta, which reads as "the shop recovered while you were
 away".
@@ -31,11 +34,18 @@ class MerchantRestockService:
     economy: object = None
     world_graph: object = None
     last_hour: int = 0
+    chronicle: object = None
 
     def on_clock_tick(self, clock_state: dict) -> None:
         hour = clock_state["total_ticks"] // TICKS_PER_HOUR
         if hour <= self.last_hour:
             return
+        # Their own clock_tick may not have run yet this hour (handler order
+        # is not fixed) or may be held back for a whole rest (coalesced).
+        if self.economy is not None:
+            self.economy.advance_to_hour(hour)
+        if self.chronicle is not None:
+            self.chronicle.advance_to_hour(hour)
         steps = hour - self.last_hour
         self.last_hour = hour
         location_id = getattr(self.world_graph, "current_location_id", None)
@@ -1,4 +1,3 @@
-import json
 import os
 
 import esper
@@ -20,13 +19,13 @@ from game.components import (
     Stats,
     TurnOrder,
 )
+from game.content.content_cache import read_json
 
 _DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "data", "player.json")
 
 
 def _load_player_data():
-    with open(_DATA_PATH) as f:
-        return json.load(f)
+    return read_json(_DATA_PATH)
 
 
 def _build_action(data: dict) -> Action:
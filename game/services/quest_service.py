@@ -20,7 +20,6 @@ gold; deliveries melt the items back into the local economy's stock, so
 fulfilling the request actually fixes the shortage that created it.
 """
 
-import json
 import logging
 import random
 from dataclasses import asdict, dataclass, field
@@ -29,6 +28,7 @@ import esper
 
 from config import PROSPERITY_QUEST_GAIN, LogCategory
 from game.components import Equipment, Inventory, PlayerTag, Position, Purse, TemplateId
+from game.content.content_cache import read_json
 from game.content.item_registry import item_registry
 
 logger = logging.getLogger(__name__)
@@ -87,8 +87,7 @@ class QuestService:
     # --- Loading ------------------------------------------------------------
 
     def load_authored(self, filepath: str) -> None:
-        with open(filepath) as f:
-            data = json.load(f)
+        data = read_json(filepath)
         known = {q.id for q in self.quests}
         for entry in data:
             if entry["id"] in known:
@@ -318,11 +317,9 @@ class QuestService:
         chronicle = self.ctx.world_chronicle
         clock = self.ctx.world_clock
         if chronicle is not None and clock is not None:
-            recent = [
-                e
-                for e in chronicle.events_for(location_id, since_tick=clock.total_ticks - GEN_EVENT_MAX_AGE_TICKS)
-                if e.event_id == GEN_WOLF_EVENT_ID
-            ]
+            recent = chronicle.events_for(
+                location_id, since_tick=clock.total_ticks - GEN_EVENT_MAX_AGE_TICKS, event_id=GEN_WOLF_EVENT_ID
+            )
             quest_id = f"gen_wolves_{location_id}"
             if recent and not any(q.id == quest_id and q.state != "turned_in" for q in self.quests):
                 self.quests = [q for q in self.quests if q.id != quest_id]
@@ -430,8 +427,7 @@ class QuestService:
         container = self.ctx.map_service.get_active_map()
         layer = container.layers[0]
         for _ in range(missing):
-            x = self.rng.randint(2, container.width - 3)
-            y = self.rng.randint(2, container.height - 3)
+            x, y = container.sample_position(self.rng)
             nx, ny = get_nearest_walkable_tile(layer, x, y)
             EntityFactory.create(esper, template, nx, ny)
         logger.info("Spawned %d %s(s) for quest '%s'.", missing, template, quest.id)
@@ -105,8 +105,8 @@ class RumorService:
         clock = self.ctx.world_clock
         if chronicle is not None and clock is not None:
             since = clock.total_ticks - RUMOR_EVENT_MAX_AGE_TICKS
-            for event in chronicle.events:
-                if event.location_id != here and event.tick > since:
+            for event in chronicle.events_for(None, since_tick=since):
+                if event.location_id != here:
                     rumors.append(f"I heard from a traveler: {event.text}")
 
         # Open quest offers at other settlements
@@ -11,6 +11,7 @@ SaveService after the entities have been recreated. Transient combat/UI
 components are skipped entirely.
 """
 
+import base64
 import dataclasses
 import types
 import typing
@@ -25,6 +26,8 @@ from game.components import (
     PathData,
     Targeting,
 )
+from game.map.chunked_map_container import CHUNK_SOURCES, ChunkedMapContainer, ChunkRecord
+from game.map.frozen_entities import FrozenEntities
 from game.map.map_container import MapContainer
 from game.map.map_layer import MapLayer
 from game.map.tile import Tile, VisibilityState
@@ -128,13 +131,13 @@ def encode_components_of(world, entity: int) -> list[dict]:
     return encoded
 
 
-def encode_frozen_entities(frozen: list[list]) -> list[list[dict]]:
+def encode_frozen_entities(frozen: FrozenEntities) -> list[list[dict]]:
     """Encode a MapContainer.frozen_entities structure."""
     return [[encode_dataclass(c) for c in comps if not isinstance(c, TRANSIENT_COMPONENT_TYPES)] for comps in frozen]
 
 
-def decode_frozen_entities(encoded: list[list[dict]]) -> list[list]:
-    return [[decode_dataclass(c) for c in comps] for comps in encoded]
+def decode_frozen_entities(encoded: list[list[dict]]) -> FrozenEntities:
+    return FrozenEntities.from_lists([decode_dataclass(c) for c in comps] for comps in encoded)
 
 
 # --- Map helpers --------------------------------------------------------------
@@ -142,6 +145,8 @@ def decode_frozen_entities(encoded: list[list[dict]]) -> list[list]:
 
 def encode_map(container: MapContainer) -> dict:
     """Encode a MapContainer (tile grids + frozen entities + metadata)."""
+    if isinstance(container, ChunkedMapContainer):
+        return encode_chunked_map(container)
     layers = []
     for layer in container.layers:
         layers.append(
@@ -160,6 +165,8 @@ def encode_map(container: MapContainer) -> dict:
 
 
 def decode_map(encoded: dict) -> MapContainer:
+    if "chunked" in encoded:
+        return decode_chunked_map(encoded)
     layers = []
     for layer_data in encoded["layers"]:
         tiles = []
@@ -178,3 +185,75 @@ def decode_map(encoded: dict) -> MapContainer:
     container.frozen_entities = decode_frozen_entities(encoded["frozen_entities"])
     container.last_visited_turn = encoded.get("last_visited_turn", 0)
     return container
+
+
+def _encode_chunk(cx: int, cy: int, record: ChunkRecord, loaded: bool) -> dict:
+    return {
+        "pos": [cx, cy],
+        "loaded": loaded,
+        "types": base64.b64encode(record.types).decode("ascii"),
+        "visibility": base64.b64encode(record.visibility).decode("ascii"),
+        "rounds": [[index, rounds] for index, rounds in record.rounds.items()],
+        "entities": encode_frozen_entities(record.entities),
+        "evicted_round": record.evicted_round,
+    }
+
+
+def encode_chunked_map(container: ChunkedMapContainer) -> dict:
+    """Encode a streamed map: its generated chunks only, plus how to make the rest.
+
+    Loaded chunks are snapshotted (their entities are in frozen_entities,
+    the map being frozen while it saves); evicted chunks carry their own.
+    Chunks never generated are left to the chunk source.
+    """
+    chunks = [_encode_chunk(cx, cy, container.snapshot_chunk(cx, cy), True) for cx, cy in sorted(container.loaded)]
+    chunks += [_encode_chunk(cx, cy, record, False) for (cx, cy), record in sorted(container.evicted.items())]
+    return {
+        "chunked": {
+            "width": container.width,
+            "height": container.height,
+            "layer_count": len(container.layers),
+            "chunk_size": container.chunk_size,
+            "load_radius": container.load_radius,
+            "source": {"kind": container.source.kind, **container.source.to_dict()},
+            "palette": list(container.palette),
+            "chunks": chunks,
+        },
+        "frozen_entities": encode_frozen_entities(container.frozen_entities),
+        "last_visited_turn": container.last_visited_turn,
+        "arrival_pos": list(container.arrival_pos) if container.arrival_pos else None,
+    }
+
+
+def decode_chunked_map(encoded: dict) -> ChunkedMapContainer:
+    data = encoded["chunked"]
+    source_data = dict(data["source"])
+    source = CHUNK_SOURCES[source_data.pop("kind")].from_dict(source_data)
+    arrival = encoded.get("arrival_pos")
+    container = ChunkedMapContainer(
+        data["width"],
+        data["height"],
+        source,
+        chunk_size=data["chunk_size"],
+        load_radius=data["load_radius"],
+        layer_count=data["layer_count"],
+        arrival_pos=tuple(arrival) if arrival else None,
+    )
+    for type_id in data["palette"][len(container.palette) :]:
+        container.palette_slot(type_id)
+    for chunk in data["chunks"]:
+        record = ChunkRecord(
+            types=base64.b64decode(chunk["types"]),
+            visibility=base64.b64decode(chunk["visibility"]),
+            rounds={index: rounds for index, rounds in chunk["rounds"]},
+            entities=decode_frozen_entities(chunk["entities"]),
+            evicted_round=chunk["evicted_round"],
+        )
+        cx, cy = chunk["pos"]
+        if chunk["loaded"]:
+            container.restore_chunk(cx, cy, record)
+        else:
+            container.evicted[(cx, cy)] = record
+    container.frozen_entities = decode_frozen_entities(encoded["frozen_entities"])
+    container.last_visited_turn = encoded.get("last_visited_turn", 0)
+    return container
@@ -1,8 +1,9 @@
 """Save/Load of a full game session to a single JSON snapshot (Phase A4).
 
 What gets saved: world clock, world graph state (current location +
-discovered flags), all map containers (tiles, visibility, frozen
-entities), the active map id and the live player party. ECS systems,
+discovered flags), all generated map containers (tiles, visibility, frozen
+entities), the active map id and the live player party. Locations still
+awaiting on-demand generation are re-deferred from the saved world seed. ECS systems,
 registries and the world graph topology are NOT saved — they are rebuilt
 from code/JSON on every boot; the save only carries mutable state.
 
@@ -18,7 +19,9 @@ import os
 import esper
 
 from config import SAVE_FILE, LogCategory
+from core.rng import derive_seed
 from game.components import Equipment, Inventory, Position
+from game.services.map_generator import MapGenerator
 from game.services.party_service import get_entity_closure
 from game.services.save_serialization import (
     decode_dataclass,
@@ -120,6 +123,13 @@ class SaveService:
         # World seed (older saves predate it — keep the session's seed)
         ctx.world_seed = data.get("world_seed", ctx.world_seed)
 
+        # On-demand world: locations never entered in the saved session are
+        # not in the save. Re-defer them from the *save's* seed so they come
+        # out as they would have in that session.
+        ctx.map_service.pending.clear()
+        if ctx.world_graph is not None:
+            MapGenerator(ctx.map_service, seed=derive_seed(ctx.world_seed, "maps")).defer_locations(ctx.world_graph)
+
         # Clock & turn flow
         ctx.world_clock.total_ticks = data["clock_ticks"]
         ctx.systems.turn_system.round_counter = data.get("round_counter", data["clock_ticks"] + 1)
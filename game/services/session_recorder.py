@@ -0,0 +1,211 @@
+"""Input recording and a state fingerprint for deterministic replays.
+
+A session is reproducible from its world seed plus the player's input:
+world generation draws from seed-derived streams, and so does every
+runtime subsystem that rolls dice (AI wandering, combat, loot, dialogue,
+gossip, rumors, chronicle, economy, travel, crafting; see bootstrap).
+SessionRecorder captures that input where it enters the game: every
+InputCommand the InputManager hands out for a key press, whether to a
+game state or to the UI window on top of the stack (dialogue choices,
+trades, quest accepts, rest and craft pickers). ``state_hash``
+fingerprints the simulation, so a headless replay (``headless.py
+--replay``) can prove it arrived at the same world.
+
+Entries are grouped by frame and key press: one press can be translated
+more than once (by the top window, then by the state behind it), and a
+replay feeds each press back through the active state's ``get_event``
+with the InputManager answering from the recording (PressPlayback), so
+windows and states route it exactly as they did live. The replayer runs
+one logic update between frames, as the main loop does.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass, field
+
+import esper
+
+from config import GameStates
+from core.input_manager import InputCommand
+from game.components import AIBehaviorState, Inventory, Name, Position, Stats
+
+logger = logging.getLogger(__name__)
+
+RECORDING_VERSION = 2
+
+# States whose input is recorded; the title and game-over screens only
+# start or end a run.
+RECORDED_STATES = ("GAME", "WORLD_MAP")
+
+
+@dataclass
+class RecordedInput:
+    """One command the InputManager handed out, for which key press."""
+
+    frame: int
+    press: int  # key presses are numbered through the session
+    state: str  # "GAME" or "WORLD_MAP"
+    context: str | None  # GameStates name the key was translated in
+    command: str | None  # InputCommand name, None for an unmapped key
+
+    def to_list(self) -> list:
+        return [self.frame, self.press, self.state, self.context, self.command]
+
+    @classmethod
+    def from_list(cls, data: list) -> "RecordedInput":
+        return cls(*data)
+
+
+@dataclass
+class SessionRecording:
+    """A world seed, the input played on it and the resulting state hash."""
+
+    seed: int
+    entries: list[RecordedInput] = field(default_factory=list)
+    final_hash: str | None = None
+    version: int = RECORDING_VERSION
+
+    def save(self, filepath: str) -> None:
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "version": self.version,
+            "seed": self.seed,
+            "final_hash": self.final_hash,
+            "entries": [entry.to_list() for entry in self.entries],
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, filepath: str) -> "SessionRecording":
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version {data.get('version')!r} in {filepath}")
+        return cls(
+            seed=data["seed"],
+            entries=[RecordedInput.from_list(entry) for entry in data["entries"]],
+            final_hash=data.get("final_hash"),
+        )
+
+
+class SessionRecorder:
+    """Collects the input of one session (GameContext.session_recorder).
+
+    Installed as ``InputManager.recorder``; the main loop reports each frame
+    and the state that handles its events.
+    """
+
+    def __init__(self, seed: int):
+        self.recording = SessionRecording(seed=seed)
+        self.frame = 0
+        self.state: str | None = None
+        self.press = 0
+        self._event = None
+
+    def next_frame(self, state: str) -> None:
+        """Called once per main-loop frame, before its events are handled."""
+        self.frame += 1
+        self.state = state
+
+    def record(self, event, context: GameStates | None, command: InputCommand | None) -> None:
+        """InputManager hook: `command` was handed out for key press `event`."""
+        if self.state not in RECORDED_STATES:
+            return
+        if event is not self._event:
+            self._event = event
+            self.press += 1
+        self.recording.entries.append(
+            RecordedInput(
+                self.frame,
+                self.press,
+                self.state,
+                context.name if context is not None else None,
+                command.name if command is not None else None,
+            )
+        )
+
+    def finish(self, ctx, filepath: str) -> SessionRecording:
+        """Stamp the current state hash on the recording and write it."""
+        self.recording.final_hash = state_hash(ctx)
+        self.recording.save(filepath)
+        logger.info(
+            "Recorded %d inputs to %s (state %s)", len(self.recording.entries), filepath, self.recording.final_hash[:12]
+        )
+        return self.recording
+
+
+class PressPlayback:
+    """Installed as ``InputManager.playback`` to replay one recorded key press.
+
+    Hands out the press's commands in recorded order; asking in another
+    context than the recording did means the replay has diverged.
+    """
+
+    def __init__(self, entries: list[RecordedInput]):
+        self.entries = deque(entries)
+
+    def next_command(self, context: GameStates | None) -> InputCommand | None:
+        if not self.entries:
+            raise ValueError("Replay asked for more commands than the key press recorded")
+        entry = self.entries.popleft()
+        name = context.name if context is not None else None
+        if entry.context != name:
+            raise ValueError(
+                f"Frame {entry.frame}: command recorded in context {entry.context}, replay asked in {name}"
+            )
+        return InputCommand[entry.command] if entry.command is not None else None
+
+
+def state_snapshot(ctx) -> dict:
+    """The parts of a session a replay must reproduce, as plain JSON data.
+
+    Covers the clock, where the player is, every named entity on the active
+    map (position, hit points, AI state), the player's inventory and the
+    chronicle / economy state. Entity ids are left out; cosmetic entities
+    (floating combat text) have no Name and are skipped.
+    """
+    entities = []
+    for ent, (name, pos) in esper.get_components(Name, Position):
+        stats = esper.try_component(ent, Stats)
+        behavior = esper.try_component(ent, AIBehaviorState)
+        entities.append(
+            [
+                name.name,
+                pos.x,
+                pos.y,
+                pos.layer,
+                stats.hp if stats else None,
+                behavior.state.name if behavior else None,
+            ]
+        )
+    entities.sort(key=lambda row: [("" if v is None else str(v)) for v in row])
+
+    inventory = []
+    if ctx.player_entity is not None and esper.entity_exists(ctx.player_entity):
+        items = esper.try_component(ctx.player_entity, Inventory)
+        if items is not None:
+            inventory = sorted(esper.component_for_entity(item, Name).name for item in items.items)
+
+    graph = ctx.world_graph
+    return {
+        "ticks": ctx.world_clock.total_ticks,
+        "round": ctx.systems.turn_system.round_counter,
+        "map": ctx.map_service.active_map_id,
+        "location": graph.current_location_id if graph else None,
+        "entities": entities,
+        "inventory": inventory,
+        "chronicle": ctx.world_chronicle.to_dict() if ctx.world_chronicle else None,
+        "economy": ctx.economy.to_dict() if ctx.economy else None,
+    }
+
+
+def state_hash(ctx) -> str:
+    """SHA-256 over ``state_snapshot(ctx)`` in canonical JSON."""
+    payload = json.dumps(state_snapshot(ctx), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -20,11 +20,11 @@ The assignment is deterministic for a given world seed, so a run always
 produces the same cast and the same feuds.
 """
 
-import json
 import logging
 import random
 
 from game.components import Name, Position, Relationships, Schedule, TemplateId
+from game.content.content_cache import read_json
 
 logger = logging.getLogger(__name__)
 
@@ -45,8 +45,7 @@ _name_pool: list[str] = []
 def _load_name_pool() -> list[str]:
     global _name_pool
     if not _name_pool:
-        with open(_NAMES_FILE, encoding="utf-8") as f:
-            _name_pool = list(json.load(f).get("given_names", []))
+        _name_pool = list(read_json(_NAMES_FILE).get("given_names", []))
     return _name_pool
 
 
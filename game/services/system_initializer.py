@@ -13,6 +13,7 @@ from core.world_clock_service import WorldClockService
 from game.map.map_container import MapContainer
 from game.systems.action_system import ActionSystem
 from game.systems.ai_system import AISystem
+from game.systems.chunk_streaming_system import ChunkStreamingSystem
 from game.systems.combat_system import CombatSystem
 from game.systems.death_system import DeathSystem
 from game.systems.equipment_system import EquipmentSystem
@@ -48,6 +49,7 @@ def build_systems(world_clock: WorldClockService, map_container: MapContainer) -
         schedule_system=ScheduleSystem(),
         needs_system=NeedsSystem(),
         status_effect_system=StatusEffectSystem(),
+        chunk_streaming_system=ChunkStreamingSystem(turn_system),
     )
 
     for system in systems.map_aware():
@@ -62,14 +64,7 @@ def register_processors(systems: Systems) -> None:
     Removes existing registrations first so repeated calls (e.g. in tests)
     never produce duplicates.
     """
-    ordered = [
-        systems.turn_system,
-        systems.equipment_system,
-        systems.visibility_system,
-        systems.movement_system,
-        systems.combat_system,
-        systems.fct_system,
-    ]
+    ordered = systems.frame_processors()
 
     for processor in ordered:
         with contextlib.suppress(KeyError):
@@ -18,7 +18,6 @@ by MapTransitionService after the transition) spawns portals and NPCs
 live; ``on_map_left()`` drops the one-shot map once the player moved on.
 """
 
-import json
 import logging
 import random
 from dataclasses import dataclass, field
@@ -39,11 +38,11 @@ from config import (
     SpriteLayer,
 )
 from game.components import AI, MapBound, Name, Portal, Position, Renderable, Skirmisher, TemplateId
+from game.content.content_cache import read_json
 from game.content.entity_factory import EntityFactory
 from game.map.map_container import MapContainer
 from game.map.map_generator_utils import get_nearest_walkable_tile
 from game.map.map_layer import MapLayer
-from game.map.tile import Tile
 
 logger = logging.getLogger(__name__)
 
@@ -97,8 +96,7 @@ class TravelEncounterService:
 
     def load_templates(self, filepath: str) -> None:
         """Load the encounter pool from a JSON file."""
-        with open(filepath) as f:
-            data = json.load(f)
+        data = read_json(filepath)
         self.templates = [
             EncounterTemplate(
                 id=t["id"],
@@ -203,21 +201,24 @@ class TravelEncounterService:
         if chronicle is None or clock is None:
             return False
         since = clock.total_ticks - max_age_ticks
-        return any(e.event_id == event_id for e in chronicle.events_for(location_id, since_tick=since))
+        return bool(chronicle.events_for(location_id, since_tick=since, event_id=event_id))
 
     # --- Road map -------------------------------------------------------------
 
     def _build_road_map(self) -> MapContainer:
         """A dirt road running west -> east through tree-dotted grassland."""
         cy = ROAD_HEIGHT // 2
-        tiles = [[Tile(type_id="floor_grass") for _ in range(ROAD_WIDTH)] for _ in range(ROAD_HEIGHT)]
+        # Palette indices, turned into tiles in one pass; one draw per
+        # off-road cell, in row order.
+        grass, dirt, tree = range(3)
+        grid = []
         for y in range(ROAD_HEIGHT):
-            for x in range(ROAD_WIDTH):
-                if abs(y - cy) <= 1:
-                    tiles[y][x].set_type("floor_dirt")
-                elif self.rng.random() < ROAD_TREE_CHANCE:
-                    tiles[y][x].set_type("tree")
-        return MapContainer([MapLayer(tiles)], arrival_pos=(2, cy))
+            if abs(y - cy) <= 1:
+                grid.append([dirt] * ROAD_WIDTH)
+            else:
+                grid.append([tree if self.rng.random() < ROAD_TREE_CHANCE else grass for _ in range(ROAD_WIDTH)])
+        layer = MapLayer.from_type_array(grid, ["floor_grass", "floor_dirt", "tree"])
+        return MapContainer([layer], arrival_pos=(2, cy))
 
     # --- Map transition hooks (called by MapTransitionService) -----------------
 
@@ -21,14 +21,29 @@ Templates with ``weight: 0`` are never rolled directly — they exist only
 as escalation targets. The service listens to the ``clock_tick`` event
 and catches up over multi-hour jumps (travel advances the clock by
 hundreds of ticks at once).
+
+Events live in a ChronicleLog, indexed by location, type and tick, and are
+compacted once per in-game day: anything older than
+CHRONICLE_RETENTION_TICKS goes, except each location's newest
+CHRONICLE_KEEP_PER_LOCATION entries.
 """
 
-import json
+import heapq
+import itertools
 import logging
+import math
 import random
 from dataclasses import dataclass, field
 
-from config import SIM_EVENT_CHANCE_PER_HOUR, TICKS_PER_HOUR
+from config import (
+    CHRONICLE_KEEP_PER_LOCATION,
+    CHRONICLE_RETENTION_TICKS,
+    SIM_EVENT_CHANCE_PER_HOUR,
+    TICKS_PER_HOUR,
+)
+from core.event_bus import coalescible
+from game.content.content_cache import read_json
+from game.services.chronicle_log import ChronicleLog
 
 logger = logging.getLogger(__name__)
 
@@ -50,14 +65,19 @@ class EventTemplate:
     escalation: dict | None = None  # {"event_id": str, "delay_hours": int}
 
 
-@dataclass
+@dataclass(order=True)
 class PendingEscalation:
-    """A scheduled follow-up event (G2). Cancelled by quest resolution."""
+    """A scheduled follow-up event (G2). Cancelled by quest resolution.
 
-    location_id: str
+    Ordered by (due_hour, seq) so the pending list can be kept as a heap;
+    seq is the scheduling order and breaks ties between same-hour follow-ups.
+    """
+
+    location_id: str = field(compare=False)
     due_hour: int
-    event_id: str
-    source_event_id: str
+    event_id: str = field(compare=False)
+    source_event_id: str = field(compare=False)
+    seq: int = 0
 
 
 # eq=False keeps identity hashing — esper stores event handlers in a set of
@@ -67,15 +87,20 @@ class WorldChronicleService:
     """Records and generates per-location world events."""
 
     ctx: object = None
-    events: list[ChronicleEvent] = field(default_factory=list)
+    events: ChronicleLog = field(default_factory=ChronicleLog)
     templates: list[EventTemplate] = field(default_factory=list)
     last_processed_hour: int = 0
     rng: random.Random = field(default_factory=random.Random)
+    # Min-heap on (due_hour, seq) — see PendingEscalation.
     pending_escalations: list[PendingEscalation] = field(default_factory=list)
+    # Next rolled event per settlement: heap of (hour, graph order, location id).
+    # Built lazily from last_processed_hour; not saved (the draws are memoryless).
+    _next_rolls: list[tuple[int, int, str]] = field(default_factory=list, repr=False)
+    _rolled_settlements: tuple[str, ...] = field(default=(), repr=False)
+    _escalation_seq: itertools.count = field(default_factory=itertools.count, repr=False)
 
     def load_templates(self, filepath: str) -> None:
-        with open(filepath) as f:
-            data = json.load(f)
+        data = read_json(filepath)
         self.templates = [
             EventTemplate(
                 id=t["id"],
@@ -96,37 +121,89 @@ class WorldChronicleService:
     def record(self, location_id: str, tick: int, text: str, event_id: str = "custom") -> None:
         self.events.append(ChronicleEvent(tick=tick, location_id=location_id, text=text, event_id=event_id))
 
-    def events_for(self, location_id: str, since_tick: int = 0) -> list[ChronicleEvent]:
-        return [e for e in self.events if e.location_id == location_id and e.tick > since_tick]
+    def events_for(
+        self, location_id: str | None, since_tick: int = 0, event_id: str | None = None
+    ) -> list[ChronicleEvent]:
+        """Events after `since_tick` at a location (None: anywhere), optionally of one type."""
+        return self.events.since(since_tick, location_id, event_id)
 
     # --- Generation -------------------------------------------------------------
 
-    def on_clock_tick(self, clock_state: dict) -> None:
-        """esper handler: roll events for every full hour that has passed."""
-        absolute_hour = clock_state["total_ticks"] // TICKS_PER_HOUR
+    @coalescible
+    def on_clock_tick(self, clock_state: dict, coalesced: int = 1) -> None:
+        """esper handler: roll events for every full hour that has passed.
+
+        Each settlement's hourly event chance is a Bernoulli trial, so the
+        gap to its next event is geometric. Instead of rolling every
+        settlement every hour, the service keeps each settlement's next
+        event hour in a heap and only visits the hours where something
+        happens — a week on the road costs a handful of draws, not
+        thousands. Draws are taken in event order (hour, then world-graph
+        order), so a seed gives the same chronicle however the clock is
+        chunked.
+        """
+        self.advance_to_hour(clock_state["total_ticks"] // TICKS_PER_HOUR)
+
+    def advance_to_hour(self, absolute_hour: int) -> None:
+        """Fire every event and escalation due up to `absolute_hour`; a no-op if already there.
+
+        Merchant restock calls this each hour before judging the shelves:
+        while a rest coalesces this service's clock_tick, an escalation's
+        stock_delta at the current settlement would otherwise only land when
+        the rest ends.
+        """
         if absolute_hour <= self.last_processed_hour:
             return
-        for hour_index in range(self.last_processed_hour + 1, absolute_hour + 1):
-            self._roll_hour(hour_index)
-            self._fire_due_escalations(hour_index)
+        first_hour = self.last_processed_hour + 1
+        rollable = [t for t in self.templates if t.weight > 0]
+        cum_weights = list(itertools.accumulate(t.weight for t in rollable))
+        if rollable:
+            self._schedule_settlements()
+        graph = self.ctx.world_graph if self.ctx else None
+
+        while True:
+            hour = self._next_rolls[0][0] if rollable and self._next_rolls else math.inf
+            if self.pending_escalations:
+                hour = min(hour, max(first_hour, self.pending_escalations[0].due_hour))
+            if hour > absolute_hour:
+                break
+            while rollable and self._next_rolls and self._next_rolls[0][0] == hour:
+                _, order, location_id = self._next_rolls[0]
+                heapq.heapreplace(self._next_rolls, (hour + self._hours_to_next_event(), order, location_id))
+                # Events happen where the player is NOT — what happens in front
+                # of the player's eyes needs no chronicle.
+                if location_id == graph.current_location_id:
+                    continue
+                template = self.rng.choices(rollable, cum_weights=cum_weights)[0]
+                self._fire(template, graph.get_location(location_id), hour)
+            self._fire_due_escalations(hour)
+
+        if absolute_hour // 24 != self.last_processed_hour // 24:
+            self.events.compact(absolute_hour * TICKS_PER_HOUR, CHRONICLE_RETENTION_TICKS, CHRONICLE_KEEP_PER_LOCATION)
         self.last_processed_hour = absolute_hour
 
-    def _roll_hour(self, hour_index: int) -> None:
-        rollable = [t for t in self.templates if t.weight > 0]
-        if not rollable or self.ctx is None or self.ctx.world_graph is None:
+    def _schedule_settlements(self) -> None:
+        """(Re)build the next-event heap when the set of settlements changes."""
+        graph = self.ctx.world_graph if self.ctx else None
+        if graph is None or SIM_EVENT_CHANCE_PER_HOUR <= 0:
+            self._next_rolls = []  # a zero chance turns rolled events off
             return
-        graph = self.ctx.world_graph
-        for location in graph.locations.values():
-            if location.type != "settlement":
-                continue
-            # Events happen where the player is NOT — what happens in front
-            # of the player's eyes needs no chronicle.
-            if location.id == graph.current_location_id:
-                continue
-            if self.rng.random() >= SIM_EVENT_CHANCE_PER_HOUR:
-                continue
-            template = self.rng.choices(rollable, weights=[t.weight for t in rollable])[0]
-            self._fire(template, location, hour_index)
+        settlements = tuple(loc.id for loc in graph.locations.values() if loc.type == "settlement")
+        if settlements == self._rolled_settlements:
+            return
+        self._rolled_settlements = settlements
+        self._next_rolls = [
+            (self.last_processed_hour + self._hours_to_next_event(), order, location_id)
+            for order, location_id in enumerate(settlements)
+        ]
+        heapq.heapify(self._next_rolls)
+
+    def _hours_to_next_event(self) -> int:
+        """Geometric draw: hours until a settlement's next event (>= 1)."""
+        if SIM_EVENT_CHANCE_PER_HOUR >= 1.0:
+            return 1
+        miss = 1.0 - self.rng.random()  # (0, 1]
+        return int(math.log(miss) / math.log1p(-SIM_EVENT_CHANCE_PER_HOUR)) + 1
 
     def _fire(self, template: EventTemplate, location, hour_index: int) -> None:
         """Record the event, apply its effects, schedule its escalation."""
@@ -138,13 +215,15 @@ class WorldChronicleService:
         )
         self._apply_effects(template, location.id)
         if template.escalation:
-            self.pending_escalations.append(
+            heapq.heappush(
+                self.pending_escalations,
                 PendingEscalation(
                     location_id=location.id,
                     due_hour=hour_index + int(template.escalation.get("delay_hours", 24)),
                     event_id=template.escalation["event_id"],
                     source_event_id=template.id,
-                )
+                    seq=next(self._escalation_seq),
+                ),
             )
         logger.info("Chronicle: [%s] %s", location.id, template.id)
 
@@ -162,10 +241,11 @@ class WorldChronicleService:
             economy.adjust_prosperity(location_id, float(prosperity_delta))
 
     def _fire_due_escalations(self, hour_index: int) -> None:
-        due = [p for p in self.pending_escalations if p.due_hour <= hour_index]
+        due = []
+        while self.pending_escalations and self.pending_escalations[0].due_hour <= hour_index:
+            due.append(heapq.heappop(self.pending_escalations))
         if not due:
             return
-        self.pending_escalations = [p for p in self.pending_escalations if p.due_hour > hour_index]
         graph = self.ctx.world_graph if self.ctx else None
         for pending in due:
             template = self.template_by_id(pending.event_id)
@@ -186,6 +266,7 @@ class WorldChronicleService:
             for p in self.pending_escalations
             if not (p.location_id == location_id and p.source_event_id == source_event_id)
         ]
+        heapq.heapify(self.pending_escalations)
         removed = before - len(self.pending_escalations)
         if removed:
             logger.info("Cancelled %d escalation(s) of '%s' at %s.", removed, source_event_id, location_id)
@@ -207,14 +288,19 @@ class WorldChronicleService:
                     "event_id": p.event_id,
                     "source_event_id": p.source_event_id,
                 }
-                for p in self.pending_escalations
+                for p in sorted(self.pending_escalations)
             ],
         }
 
     def from_dict(self, data: dict) -> None:
         self.last_processed_hour = data.get("last_processed_hour", 0)
-        self.events = [
+        self.events = ChronicleLog(
             ChronicleEvent(tick=e["tick"], location_id=e["location_id"], text=e["text"], event_id=e["event_id"])
             for e in data.get("events", [])
+        )
+        self.pending_escalations = [
+            PendingEscalation(**p, seq=next(self._escalation_seq)) for p in data.get("pending_escalations", [])
         ]
-        self.pending_escalations = [PendingEscalation(**p) for p in data.get("pending_escalations", [])]
+        heapq.heapify(self.pending_escalations)
+        self._next_rolls = []
+        self._rolled_settlements = ()
@@ -6,10 +6,11 @@ knows nothing about maps or ECS. MapGenerator builds a map per settlement
 location, MapTransitionService keeps ``current_location_id`` in sync.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 
+from game.content.content_cache import read_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,8 +64,7 @@ class WorldGraphService:
     @classmethod
     def from_file(cls, filepath: str) -> "WorldGraphService":
         """Load the world graph from a JSON file (see assets/data/world.json)."""
-        with open(filepath) as f:
-            data = json.load(f)
+        data = read_json(filepath)
 
         graph = cls()
         for loc in data.get("locations", []):
@@ -11,6 +11,7 @@ MIN_TICKS): popping in and out of a door must not teleport NPCs around.
 """
 
 import logging
+from collections.abc import Collection, Iterable
 
 from config import SIM_RECONCILE_MIN_TICKS
 from game.components import (
@@ -84,7 +85,14 @@ class WorldSimulationService:
     """Reconciles off-screen time progression when the player arrives."""
 
     @staticmethod
-    def reconcile_arrivals(world, map_container, hour: int, elapsed_ticks: int) -> int:
+    def reconcile_arrivals(
+        world,
+        map_container,
+        hour: int,
+        elapsed_ticks: int,
+        entities: Collection[int] | None = None,
+        occupied: Iterable[tuple[int, int]] = (),
+    ) -> int:
         """Snap schedule-bound NPCs on the (just thawed) map to their
         scheduled position for the given hour.
 
@@ -93,6 +101,9 @@ class WorldSimulationService:
             map_container: The map being entered (for walkability snapping).
             hour: Current world-clock hour (0-23).
             elapsed_ticks: Ticks since this map was last visited.
+            entities: Only reconcile these NPCs (TurnOrchestrator's fast-forward
+                passes the distant ones it did not step); None means all.
+            occupied: Positions already taken by entities that stay put.
 
         Returns:
             Number of NPCs that were repositioned.
@@ -102,10 +113,12 @@ class WorldSimulationService:
 
         moved = 0
         # Tracks positions already assigned this pass to prevent NPC stacking (SIM-NOCOL).
-        claimed: set[tuple[int, int]] = set()
+        claimed: set[tuple[int, int]] = set(occupied)
         for _ent, (sched, ai_state, activity, pos) in world.get_components(
             Schedule, AIBehaviorState, Activity, Position
         ):
+            if entities is not None and _ent not in entities:
+                continue
             template = schedule_registry.get(sched.schedule_id)
             if template is None:
                 continue
@@ -0,0 +1,84 @@
+"""World template snapshots: clone a freshly built world instead of rebuilding it.
+
+Starting a new run with a fixed seed used to redo everything: reload all
+content registries, regenerate every map and rerun the economy's load and
+per-run variation, only to land on exactly the same pre-play world as last
+time. A WorldTemplate captures that world once, right after
+``bootstrap.build_game_context`` and before any play has touched it, and
+``restore()`` hands out an independent deep copy for each later run.
+
+Captured (the state that play mutates): every generated map with its frozen
+entities, the active map id, the live start-map population, the world graph
+(discovered/heard flags, current location) and the economy. Everything
+else is either immutable content (registries — left loaded) or cheap,
+stateless wiring (systems, services, event handlers) that bootstrap
+rebuilds as usual. Locations still awaiting on-demand generation are not
+part of the snapshot; bootstrap re-defers them from the seed.
+
+Each map is pickled separately. ``restore()`` only unpickles the active
+map; the others are registered as pending maps on the MapService (the same
+mechanism as on-demand generation) and cloned from the template the first
+time they are entered. Tiles pickle in a compact form (see
+``Tile.__getstate__``), so even a fully pregenerated world restores in a
+fraction of its generation time.
+"""
+
+import logging
+import pickle
+from dataclasses import dataclass, field
+from functools import partial
+
+import esper
+
+from game.services.map_service import MapService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorldTemplate:
+    """Pre-play world state for one seed, restorable any number of times."""
+
+    seed: int
+    # map id -> pickled MapContainer (tiles + frozen entities)
+    maps: dict[str, bytes] = field(default_factory=dict)
+    # pickled dict: active map id, live population, world graph, economy
+    state: bytes = b""
+
+    @classmethod
+    def capture(cls, ctx) -> "WorldTemplate":
+        """Snapshot a freshly built GameContext (call before the player exists)."""
+        maps = {
+            map_id: pickle.dumps(container, protocol=pickle.HIGHEST_PROTOCOL)
+            for map_id, container in ctx.map_service.maps.items()
+        }
+        state = {
+            "active_map_id": ctx.map_service.active_map_id,
+            "live": [list(components.values()) for components in esper._entities.values()],
+            "world_graph": ctx.world_graph,
+            "economy": ctx.economy,
+        }
+        template = cls(seed=ctx.world_seed, maps=maps, state=pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        size = len(template.state) + sum(len(blob) for blob in maps.values())
+        logger.info("Captured world template for seed %d (%d maps, %d bytes).", ctx.world_seed, len(maps), size)
+        return template
+
+    def restore(self, world):
+        """Recreate the captured world in ``world`` and return its services.
+
+        Returns:
+            (map_service, world_graph, economy) — fresh, independent copies.
+            The start map's population is already live in ``world``; every
+            other captured map is cloned on first access.
+        """
+        state = pickle.loads(self.state)
+        map_service = MapService()
+        for map_id in self.maps:
+            map_service.register_deferred([map_id], partial(self._clone_map, map_service, map_id))
+        map_service.set_active_map(state["active_map_id"])
+        for components in state["live"]:
+            world.create_entity(*components)
+        return map_service, state["world_graph"], state["economy"]
+
+    def _clone_map(self, map_service: MapService, map_id: str) -> None:
+        map_service.register_map(map_id, pickle.loads(self.maps[map_id]))
@@ -279,6 +279,7 @@ class ActionSystem(esper.Processor, MapAwareSystem):
         # Consume resources from base stats
         stats = esper.component_for_entity(entity, Stats)
         stats.mana -= targeting.action.cost_mana
+        esper.dispatch_event("stats_changed", entity)
 
         # Dispatch inspection output for inspect mode
         if targeting.action.targeting_mode == "inspect":
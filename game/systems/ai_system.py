@@ -22,6 +22,7 @@ from game.components import (
     Skirmisher,
     Stats,
 )
+from game.map.layer_partition import on_layer
 from game.services.pathfinding_service import PathfindingService
 
 CARDINAL_DIRS = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # N S W E
@@ -36,10 +37,12 @@ class AISystem(esper.Processor):
     behavior, and closes the enemy turn exactly once.
     """
 
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
         super().__init__()
+        # Wander/loiter steps; seeded per world in bootstrap (record/replay).
+        self.rng = rng or random.Random()
 
-    def process(self, turn_system, map_container, player_layer, player_entity=None):
+    def process(self, turn_system, map_container, player_layer, player_entity=None, dormant=frozenset()):
         """Run AI for all eligible entities and end the enemy turn.
 
         Guards:
@@ -48,6 +51,8 @@ class AISystem(esper.Processor):
         Entity filtering:
           - Skips entities on a different map layer than the player (SAFE-02).
           - Skips entities that carry a Corpse component (AISYS-05).
+          - Skips ``dormant`` entities (fast-forward: distant NPCs are
+            reconciled analytically by TurnOrchestrator instead).
 
         Post-loop:
           - Calls turn_system.end_enemy_turn() exactly once (AISYS-04).
@@ -61,10 +66,10 @@ class AISystem(esper.Processor):
 
         claimed_tiles = set()  # Per-turn tile reservation (WNDR-04)
 
+        # Only entities on the player's current map layer act (SAFE-02).
         # Use list() to avoid modification-during-iteration (matches movement_system.py pattern)
-        for ent, (ai, behavior, pos) in list(esper.get_components(AI, AIBehaviorState, Position)):
-            # Skip entities not on the player's current map layer (SAFE-02)
-            if pos.layer != player_layer:
+        for ent, (ai, behavior, pos) in list(on_layer(player_layer, AI, AIBehaviorState, Position)):
+            if ent in dormant:
                 continue
 
             # Skip dead entities (AISYS-05)
@@ -148,7 +153,7 @@ class AISystem(esper.Processor):
         WNDR-04: claimed_tiles prevents two NPCs targeting same destination.
         """
         dirs = CARDINAL_DIRS[:]
-        random.shuffle(dirs)
+        self.rng.shuffle(dirs)
         for dx, dy in dirs:
             nx, ny = pos.x + dx, pos.y + dy
             if (nx, ny) in claimed_tiles:
@@ -184,10 +189,10 @@ class AISystem(esper.Processor):
             return
 
         # In range: usually linger, occasionally shuffle a tile.
-        if random.random() > AI_LOITER_MOVE_CHANCE:
+        if self.rng.random() > AI_LOITER_MOVE_CHANCE:
             return
         dirs = CARDINAL_DIRS[:]
-        random.shuffle(dirs)
+        self.rng.shuffle(dirs)
         for dx, dy in dirs:
             nx, ny = pos.x + dx, pos.y + dy
             if abs(nx - ax) + abs(ny - ay) > AI_LOITER_RADIUS:
@@ -376,12 +381,18 @@ class AISystem(esper.Processor):
 
     def _can_see_player(self, pos, stats, player_pos, map_container, ent=None):
         """Returns True if NPC at pos can see player_pos using FOV computation."""
-        is_transparent = self._make_transparency_func(pos.layer, map_container)
-
         radius = stats.perception
         if ent is not None and esper.has_component(ent, EffectiveStats):
             radius = esper.component_for_entity(ent, EffectiveStats).perception
 
+        # Shadowcasting never lights a tile beyond the radius circle, so a
+        # player out of range needs no FOV pass at all.
+        dx, dy = player_pos.x - pos.x, player_pos.y - pos.y
+        if dx * dx + dy * dy > radius * radius:
+            return False
+
+        is_transparent = self._make_transparency_func(pos.layer, map_container)
+
         visible = VisibilityService.compute_visibility((pos.x, pos.y), radius, is_transparent)
         return (player_pos.x, player_pos.y) in visible
 
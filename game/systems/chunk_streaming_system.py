@@ -0,0 +1,35 @@
+import esper
+
+from game.components import PlayerTag, Position
+from game.map.chunked_map_container import ChunkedMapContainer
+from game.services.party_service import get_entity_closure
+from game.systems.map_aware_system import MapAwareSystem
+
+
+class ChunkStreamingSystem(esper.Processor, MapAwareSystem):
+    """Keeps the chunks around the player loaded on a streamed map.
+
+    Runs before VisibilitySystem each frame: on a ChunkedMapContainer it
+    generates or restores the chunks within reach of the player and evicts
+    the ones left far behind (with their entities, but never the player's
+    party). On an ordinary map it does nothing.
+    """
+
+    def __init__(self, turn_system):
+        esper.Processor.__init__(self)
+        MapAwareSystem.__init__(self)
+        self.turn_system = turn_system
+
+    def process(self, *args, **kwargs):
+        container = self._map_container
+        if not isinstance(container, ChunkedMapContainer):
+            return
+        for ent, (pos, _tag) in esper.get_components(Position, PlayerTag):
+            container.stream(
+                esper,
+                pos.x,
+                pos.y,
+                self.turn_system.round_counter,
+                exclude_entities=get_entity_closure(esper, ent),
+            )
+            return
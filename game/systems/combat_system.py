@@ -29,8 +29,11 @@ class CombatSystem(esper.Processor):
     def __init__(self, action_system=None, rng: random.Random | None = None):
         super().__init__()
         self.action_system = action_system
-        # Injectable for deterministic tests; bootstrap leaves the default.
+        # Injectable for deterministic tests; seeded per world in bootstrap.
         self.rng = rng or random.Random()
+        # Floating-text drift is cosmetic: a fixed stream of its own keeps it
+        # reproducible without consuming combat rolls.
+        self._fct_rng = random.Random(0)
 
     def process(self, *args, **kwargs):
         for attacker, intent in list(esper.get_component(AttackIntent)):
@@ -69,6 +72,7 @@ class CombatSystem(esper.Processor):
                 # Update effective HP to avoid stale death check if it's a separate component
                 if target_eff is not target_stats:
                     target_eff.hp -= damage
+                esper.dispatch_event("stats_changed", target)
 
                 # Wake up target if sleeping
                 if self.action_system and esper.has_component(target, AIBehaviorState):
@@ -120,7 +124,7 @@ class CombatSystem(esper.Processor):
             esper.create_entity(
                 MapBound(),
                 Position(pos.x, pos.y, pos.layer),
-                FCT(text=text, color=color, vx=random.uniform(-0.5, 0.5), vy=-1.5, ttl=1.0, max_ttl=1.0),
+                FCT(text=text, color=color, vx=self._fct_rng.uniform(-0.5, 0.5), vy=-1.5, ttl=1.0, max_ttl=1.0),
             )
 
     def _get_name(self, entity):
@@ -30,10 +30,15 @@ from game.systems.map_aware_system import MapAwareSystem
 
 logger = logging.getLogger(__name__)
 
+# Loot with no open neighbor lands on the nearest open tile this close.
+DROP_SEARCH_RADIUS = 3
+
 
 class DeathSystem(MapAwareSystem):
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
         super().__init__()
+        # Loot rolls and drop scatter; seeded per world in bootstrap.
+        self.rng = rng or random.Random()
         # Register the event handler for entity death
         esper.set_handler("entity_died", self.on_entity_died)
 
@@ -108,15 +113,23 @@ class DeathSystem(MapAwareSystem):
         """Roll for loot and spawn items, scattering if needed."""
         world = esper
         for template_id, chance in loot_table.entries:
-            if random.random() < chance:
+            if self.rng.random() < chance:
                 # Find a valid position for the loot
-                drop_x, drop_y = self._find_drop_position(pos.x, pos.y)
+                drop_x, drop_y = self._find_drop_position(pos.x, pos.y, pos.layer)
                 ItemFactory.create_on_ground(world, template_id, drop_x, drop_y, pos.layer)
                 esper.dispatch_event("log_message", f"The {template_id} drops to the ground.", None, LogCategory.LOOT)
 
-    def _find_drop_position(self, x, y):
-        """Return (x, y) if walkable, else search 8 neighbors."""
-        if self._map_container and self._map_container.is_walkable(x, y):
+    def _find_drop_position(self, x, y, layer=0):
+        """Return (x, y) if walkable, else a random walkable neighbor, else the
+        nearest walkable tile a little further out (the layer's WalkableIndex)."""
+        container = self._map_container
+        index = walkable = None
+        if hasattr(container, "layers") and 0 <= layer < len(container.layers):
+            index = container.layers[layer].walkable_index
+            walkable = index.is_walkable
+        elif container is not None:
+            walkable = container.is_walkable
+        if walkable and walkable(x, y):
             return x, y
 
         # Search neighbors if center is blocked
@@ -130,11 +143,12 @@ class DeathSystem(MapAwareSystem):
             (x, y + 1),
             (x + 1, y + 1),
         ]
-        random.shuffle(neighbors)
+        self.rng.shuffle(neighbors)
 
         for nx, ny in neighbors:
-            if self._map_container and self._map_container.is_walkable(nx, ny):
+            if walkable and walkable(nx, ny):
                 return nx, ny
 
-        # Fallback to original position if all neighbors are blocked
-        return x, y
+        # All neighbors blocked: the nearest open ground, else the original position
+        nearest = index.nearest(x, y, max_radius=DROP_SEARCH_RADIUS) if index else None
+        return nearest if nearest is not None else (x, y)
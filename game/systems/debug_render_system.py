@@ -7,6 +7,8 @@ from config import (
     DEBUG_FOV_COLOR,
     DEBUG_LABEL_COLOR,
     DEBUG_NPC_FOV_COLOR,
+    DEBUG_PROFILER_ROWS,
+    DEBUG_TEXT_BG_COLOR,
     TILE_SIZE,
 )
 from core.visibility_service import VisibilityService
@@ -36,11 +38,12 @@ class DebugRenderSystem(MapAwareSystem):
 
         return tile.is_transparent
 
-    def process(self, surface, flags, player_layer):
+    def process(self, surface, flags, player_layer, profiler=None):
         """Render the enabled debug overlays.
 
         Args:
             flags: A DebugFlags instance from the GameContext.
+            profiler: The context's SystemProfiler (for the timing table).
         """
         # 1. Clear the overlay
         self.overlay.fill((0, 0, 0, 0))
@@ -54,6 +57,8 @@ class DebugRenderSystem(MapAwareSystem):
             self._render_chase_targets(player_layer)
         if flags.labels:
             self._render_ai_labels(player_layer)
+        if flags.profiler and profiler is not None:
+            self._render_profiler(profiler)
 
         # 3. Blit overlay to the main surface at the camera's viewport position
         # The camera offset is applied when blitting the overlay to the screen
@@ -223,3 +228,18 @@ class DebugRenderSystem(MapAwareSystem):
                         ),
                         1,
                     )
+
+    def _render_profiler(self, profiler):
+        """Per-system timing table (ms over the profiler's recent calls), slowest first."""
+        rows = list(profiler.snapshot().items())[:DEBUG_PROFILER_ROWS]
+        lines = [f"{'system':<21}{'last':>7}{'mean':>7}{'max':>7}{'calls':>8}"]
+        for name, row in rows:
+            label = name.removesuffix("_system")
+            lines.append(f"{label:<21}{row['last_ms']:7.2f}{row['mean_ms']:7.2f}{row['max_ms']:7.2f}{row['calls']:8d}")
+        line_height = self.font.get_linesize()
+        surfaces = [self.font.render(line, True, DEBUG_LABEL_COLOR) for line in lines]
+        width = max(s.get_width() for s in surfaces) + 8
+        background = pygame.Rect(4, 4, width, line_height * len(surfaces) + 8)
+        self.overlay.fill(DEBUG_TEXT_BG_COLOR, background)
+        for i, text_surf in enumerate(surfaces):
+            self.overlay.blit(text_surf, (background.x + 4, background.y + 4 + i * line_height))
@@ -5,74 +5,137 @@ from game.components import EffectiveStats, Equipment, StatModifiers, Stats
 
 
 class EquipmentSystem(esper.Processor):
+    """Keeps EffectiveStats = base Stats + equipped StatModifiers, with the
+    time-of-day perception multiplier applied.
+
+    Only entities marked dirty are recomputed. An entity becomes dirty when
+    - a ``stats_changed`` event names it: whoever changes an entity's Stats
+      or Equipment (equip/unequip, damage, bleeding, potions, mana costs)
+      dispatches one;
+    - it newly appears in the Stats query or its Stats instance is replaced
+      (spawns, thawed maps, loaded saves);
+    - the day phase changes (perception depends on it), which dirties all;
+    - it wears an item and the world's StatModifiers change (an equipped
+      item was created, destroyed or given new modifiers).
+    esper keeps query results cached until a component of that type is
+    added or removed (core.ecs), so the last three checks are an identity
+    comparison per frame while nothing happens.
+    """
+
     def __init__(self, world_clock):
         super().__init__()
         self.world_clock = world_clock
+        self._dirty: set[int] = set()
+        self._phase = None
+        self._stats_view = None
+        self._stats_seen: dict[int, Stats] = {}
+        self._modifiers_view = None
+        # Entities whose EffectiveStats include at least one item's modifiers
+        self._wearers: set[int] = set()
+        esper.set_handler("stats_changed", self.mark_dirty)
+
+    def mark_dirty(self, entity: int) -> None:
+        """Recompute `entity`'s EffectiveStats on the next process()."""
+        self._dirty.add(entity)
 
     def process(self, *args, **kwargs):
-        # Fetch current phase and perception multiplier
+        dirty = self._dirty
+        stats_view = esper.get_component(Stats)
+        if stats_view is not self._stats_view:
+            self._stats_view = stats_view
+            seen = self._stats_seen
+            current = {}
+            for ent, stats in stats_view:
+                if seen.get(ent) is not stats:
+                    dirty.add(ent)
+                current[ent] = stats
+            self._stats_seen = current
+
         phase = self.world_clock.phase
-        multiplier = DN_SETTINGS.get(phase, {}).get("perception", 1.0)
+        if phase != self._phase:
+            self._phase = phase
+            dirty.update(self._stats_seen)
+
+        modifiers_view = esper.get_component(StatModifiers)
+        if modifiers_view is not self._modifiers_view:
+            self._modifiers_view = modifiers_view
+            dirty |= self._wearers
 
-        for ent, stats in esper.get_component(Stats):
-            # 1. Start with base values
-            max_hp = stats.base_max_hp
-            power = stats.base_power
-            defense = stats.base_defense
-            max_mana = stats.base_max_mana
-            perception = stats.base_perception
-            intelligence = stats.base_intelligence
-
-            hp_bonus = 0
-            mana_bonus = 0
-
-            # 2. Iterate over equipped items if Equipment component exists
-            if esper.has_component(ent, Equipment):
-                equipment = esper.component_for_entity(ent, Equipment)
-                for slot, item_id in equipment.slots.items():
-                    if (
-                        item_id is not None
-                        and esper.entity_exists(item_id)
-                        and esper.has_component(item_id, StatModifiers)
-                    ):
-                        mods = esper.component_for_entity(item_id, StatModifiers)
-                        hp_bonus += mods.hp
-                        max_hp += mods.hp
-                        power += mods.power
-                        defense += mods.defense
-                        mana_bonus += mods.mana
-                        max_mana += mods.mana
-                        perception += mods.perception
-                        intelligence += mods.intelligence
-
-            # 3. Apply time-of-day multiplier to perception
-            perception = max(1, int(perception * multiplier))
-
-            # 4. Calculate current effective values
-            # StatModifiers.hp applies to both max_hp and current hp.
-            current_hp = stats.hp + hp_bonus
-            current_mana = stats.mana + mana_bonus
-
-            # 5. Update or create the EffectiveStats component
-            if esper.has_component(ent, EffectiveStats):
-                eff = esper.component_for_entity(ent, EffectiveStats)
-                eff.hp = current_hp
-                eff.max_hp = max_hp
-                eff.power = power
-                eff.defense = defense
-                eff.mana = current_mana
-                eff.max_mana = max_mana
-                eff.perception = perception
-                eff.intelligence = intelligence
+        if not dirty:
+            return
+        multiplier = DN_SETTINGS.get(phase, {}).get("perception", 1.0)
+        self._dirty = set()
+        for ent in dirty:
+            stats = self._stats_seen.get(ent)
+            if stats is None:
+                self._wearers.discard(ent)
             else:
-                eff = EffectiveStats(
-                    hp=current_hp,
-                    max_hp=max_hp,
-                    power=power,
-                    defense=defense,
-                    mana=current_mana,
-                    max_mana=max_mana,
-                    perception=perception,
-                    intelligence=intelligence,
-                )
-                esper.add_component(ent, eff)
+                self._recompute(ent, stats, multiplier)
+
+    def _recompute(self, ent: int, stats: Stats, multiplier: float) -> None:
+        # 1. Start with base values
+        max_hp = stats.base_max_hp
+        power = stats.base_power
+        defense = stats.base_defense
+        max_mana = stats.base_max_mana
+        perception = stats.base_perception
+        intelligence = stats.base_intelligence
+
+        hp_bonus = 0
+        mana_bonus = 0
+        wearing = False
+
+        # 2. Iterate over equipped items if Equipment component exists
+        equipment = esper.try_component(ent, Equipment)
+        if equipment is not None:
+            for item_id in equipment.slots.values():
+                if item_id is None or not esper.entity_exists(item_id):
+                    continue
+                mods = esper.try_component(item_id, StatModifiers)
+                if mods is None:
+                    continue
+                wearing = True
+                hp_bonus += mods.hp
+                max_hp += mods.hp
+                power += mods.power
+                defense += mods.defense
+                mana_bonus += mods.mana
+                max_mana += mods.mana
+                perception += mods.perception
+                intelligence += mods.intelligence
+        if wearing:
+            self._wearers.add(ent)
+        else:
+            self._wearers.discard(ent)
+
+        # 3. Apply time-of-day multiplier to perception
+        perception = max(1, int(perception * multiplier))
+
+        # 4. Calculate current effective values
+        # StatModifiers.hp applies to both max_hp and current hp.
+        current_hp = stats.hp + hp_bonus
+        current_mana = stats.mana + mana_bonus
+
+        # 5. Update or create the EffectiveStats component
+        eff = esper.try_component(ent, EffectiveStats)
+        if eff is not None:
+            eff.hp = current_hp
+            eff.max_hp = max_hp
+            eff.power = power
+            eff.defense = defense
+            eff.mana = current_mana
+            eff.max_mana = max_mana
+            eff.perception = perception
+            eff.intelligence = intelligence
+        else:
+            eff = EffectiveStats(
+                hp=current_hp,
+                max_hp=max_hp,
+                power=power,
+                defense=defense,
+                mana=current_mana,
+                max_mana=max_mana,
+                perception=perception,
+                intelligence=intelligence,
+            )
+            esper.add_component(ent, eff)
@@ -27,6 +27,7 @@ from config import (
 )
 from game.components import AIBehaviorState, AIState, Alignment, Corpse, Name, PlayerTag, Position, Relationships
 from game.content.dialogue_service import dialogue_service
+from game.map.layer_partition import on_layer
 
 # States whose NPCs are idle enough to chatter.
 _CHATTY_STATES = (AIState.SOCIALIZE, AIState.WORK, AIState.IDLE)
@@ -66,8 +67,8 @@ class GossipSystem:
         # gossip subjects (the villager being talked about).
         candidates: list[tuple[int, str, Position]] = []
         subjects: list[str] = []
-        for ent, (behavior, pos, name) in esper.get_components(AIBehaviorState, Position, Name):
-            if pos.layer != player_layer or esper.has_component(ent, Corpse):
+        for ent, (behavior, pos, name) in on_layer(player_layer, AIBehaviorState, Position, Name):
+            if esper.has_component(ent, Corpse):
                 continue
             if esper.has_component(ent, PlayerTag) or behavior.alignment == Alignment.HOSTILE:
                 continue
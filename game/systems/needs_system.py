@@ -33,10 +33,14 @@ logger = logging.getLogger(__name__)
 class NeedsSystem:
     """Drives need accumulation and schedule overrides for live NPCs."""
 
-    def process(self, map_container) -> None:
+    def process(self, map_container, dormant=frozenset()) -> None:
+        """Accumulate hunger and start/finish meals; ``dormant`` entities are skipped."""
         for ent, (needs, activity, behavior, pos) in list(
             esper.get_components(Needs, Activity, AIBehaviorState, Position)
         ):
+            if ent in dormant:
+                continue
+
             # NEED-01: combat and sleep outrank any need
             if behavior.state in (AIState.CHASE, AIState.SLEEP):
                 continue
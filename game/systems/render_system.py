@@ -1,3 +1,4 @@
+import itertools
 import math
 
 import esper
@@ -5,6 +6,7 @@ import pygame
 
 from config import TILE_SIZE, SpriteLayer
 from game.components import FCT, AIBehaviorState, AIState, Hidden, Position, Renderable, Targeting
+from game.map.layer_partition import partition
 from game.map.tile import VisibilityState
 from game.systems.map_aware_system import MapAwareSystem
 
@@ -24,15 +26,15 @@ class RenderSystem(esper.Processor, MapAwareSystem):
         for ent, targeting in esper.get_component(Targeting):
             self.draw_targeting_ui(surface, targeting)
 
-        # 2. Get all entities with Position and Renderable components
+        # 2. Get the entities with Position and Renderable components at or
+        # below the player's layer
         renderables = []
-        for ent, (pos, rend) in esper.get_components(Position, Renderable):
+        by_layer = partition(Position, Renderable)
+        rows = itertools.chain.from_iterable(by_layer[i] for i in sorted(by_layer) if i <= player_layer)
+        for ent, (pos, rend) in rows:
             # Concealed entities stay invisible until revealed (Phase F)
             if esper.has_component(ent, Hidden):
                 continue
-            # Only render if entity is at or below player layer
-            if pos.layer > player_layer:
-                continue
 
             # Ground Occlusion Check for entities below player layer
             occluded = False
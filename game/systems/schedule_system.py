@@ -26,13 +26,15 @@ class ScheduleSystem(esper.Processor):
     # in game.components next to AIState.
     ACTIVITY_TO_STATE = ACTIVITY_TO_STATE
 
-    def process(self, world_clock_service, map_container):
+    def process(self, world_clock_service, map_container, dormant=frozenset()):
         """
         Updates entities with schedules based on the current hour.
 
         Args:
             world_clock_service: WorldClockService instance providing the current hour.
             map_container: Current map container for pathfinding.
+            dormant: Entities to leave untouched (fast-forward reconciles
+                NPCs far from the player analytically afterwards).
         """
         current_hour = world_clock_service.hour
 
@@ -40,6 +42,9 @@ class ScheduleSystem(esper.Processor):
         for ent, (sched, ai_state, activity, pos) in esper.get_components(
             Schedule, AIBehaviorState, Activity, Position
         ):
+            if ent in dormant:
+                continue
+
             # A need (e.g. EAT) is preempting the schedule — leave the
             # entity alone until NeedsSystem clears the override.
             if activity.need_override:
@@ -25,6 +25,7 @@ class StatusEffectSystem:
             eff = esper.try_component(ent, EffectiveStats)
             if eff is not None:
                 eff.hp -= damage
+            esper.dispatch_event("stats_changed", ent)
 
             name = esper.try_component(ent, Name)
             display = name.name if name else f"Entity {ent}"
@@ -14,12 +14,21 @@ class VisibilitySystem(esper.Processor, MapAwareSystem):
         self.world_clock = world_clock
         self.last_round = turn_system.round_counter
 
-    def process(self, *args, **kwargs):
+    def process(self, *args, catch_up=False, **kwargs):
+        """Refresh the player's field of view and age remembered tiles.
+
+        Args:
+            catch_up: Age memory by every round since the last pass instead of
+                one. TurnOrchestrator.advance_turns skips this processor while
+                fast-forwarding and runs it once afterwards with catch_up=True.
+        """
         # 0. Check if a new round has started for aging memory
-        aging_trigger = False
-        if self.turn_system.round_counter > self.last_round:
-            aging_trigger = True
+        rounds_passed = self.turn_system.round_counter - self.last_round
+        aging_trigger = rounds_passed > 0
+        if aging_trigger:
             self.last_round = self.turn_system.round_counter
+            if not catch_up:
+                rounds_passed = 1
 
         # 0.1 Calculate intelligence-based memory threshold
         max_intel = 0
@@ -36,19 +45,18 @@ class VisibilitySystem(esper.Processor, MapAwareSystem):
         memory_threshold = max_intel * 5
 
         # 1. Update rounds_since_seen and transition SHROUDED -> FORGOTTEN
-        for layer in self._map_container.layers:
-            for row in layer.tiles:
-                for tile in row:
-                    if tile.visibility_state == VisibilityState.VISIBLE:
-                        tile.visibility_state = VisibilityState.SHROUDED
-                        tile.rounds_since_seen = 0
-                    elif aging_trigger:
-                        if tile.visibility_state == VisibilityState.SHROUDED:
-                            tile.rounds_since_seen += 1
-                            if tile.rounds_since_seen > memory_threshold:
-                                tile.visibility_state = VisibilityState.FORGOTTEN
-                        elif tile.visibility_state == VisibilityState.FORGOTTEN:
-                            tile.rounds_since_seen += 1
+        for row in self._map_container.iter_tile_rows():
+            for tile in row:
+                if tile.visibility_state == VisibilityState.VISIBLE:
+                    tile.visibility_state = VisibilityState.SHROUDED
+                    tile.rounds_since_seen = 0
+                elif aging_trigger:
+                    if tile.visibility_state == VisibilityState.SHROUDED:
+                        tile.rounds_since_seen += rounds_passed
+                        if tile.rounds_since_seen > memory_threshold:
+                            tile.visibility_state = VisibilityState.FORGOTTEN
+                    elif tile.visibility_state == VisibilityState.FORGOTTEN:
+                        tile.rounds_since_seen += rounds_passed
 
         # 2. Find all entities that provide vision (Position + Stats/LightSource)
         visible_coords = set()
@@ -51,14 +51,13 @@ class PickupWindow(UIWindow):
     # --- Input ------------------------------------------------------------
 
     def handle_event(self, event):
-        # "Pick up all" — read the raw key so it works regardless of the
-        # INVENTORY context mapping (where 'a' would mean move-left).
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+        # The PICKUP context is the inventory mapping with 'a' for "pick up
+        # all" (where the inventory would read it as move-left).
+        command = self.input_manager.handle_event(event, GameStates.PICKUP)
+
+        if command == InputCommand.PICKUP_ALL:
             self._pickup_all()
             return True
-
-        command = self.input_manager.handle_event(event, GameStates.INVENTORY)
-
         if command == InputCommand.CANCEL:
             self.wants_to_close = True
             return True
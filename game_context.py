@@ -7,8 +7,10 @@ GameState via ``startup(ctx)``.
 
 from dataclasses import dataclass, field
 
+from config import PROFILER_HISTORY
 from core.camera import Camera
 from core.input_manager import InputManager
+from core.profiling import SystemProfiler
 from core.ui.message_log import MessageLog
 from core.ui.stack_manager import UIStack
 from core.world_clock_service import WorldClockService
@@ -21,11 +23,13 @@ from game.services.quest_service import QuestService
 from game.services.render_service import RenderService
 from game.services.reputation_service import ReputationService
 from game.services.rumor_service import RumorService
+from game.services.session_recorder import SessionRecorder
 from game.services.travel_encounter_service import TravelEncounterService
 from game.services.world_chronicle_service import WorldChronicleService
 from game.services.world_graph_service import WorldGraphService
 from game.systems.action_system import ActionSystem
 from game.systems.ai_system import AISystem
+from game.systems.chunk_streaming_system import ChunkStreamingSystem
 from game.systems.combat_system import CombatSystem
 from game.systems.death_system import DeathSystem
 from game.systems.equipment_system import EquipmentSystem
@@ -41,13 +45,14 @@ from game.systems.visibility_system import VisibilitySystem
 
 @dataclass
 class DebugFlags:
-    """Runtime-toggleable debug overlays (F3-F7)."""
+    """Runtime-toggleable debug overlays (F3-F8)."""
 
     master: bool = False
     player_fov: bool = True
     npc_fov: bool = False
     chase: bool = True
     labels: bool = True
+    profiler: bool = False  # per-system timings; the profiler is attached only while on
 
 
 @dataclass
@@ -71,6 +76,7 @@ class Systems:
     needs_system: NeedsSystem = field(default_factory=NeedsSystem)
     status_effect_system: StatusEffectSystem = field(default_factory=StatusEffectSystem)
     gossip_system: GossipSystem = field(default_factory=GossipSystem)
+    chunk_streaming_system: ChunkStreamingSystem | None = None
     render_system: object | None = None
     debug_render_system: object | None = None
     ui_system: object | None = None
@@ -78,6 +84,7 @@ class Systems:
     def map_aware(self) -> list:
         """All systems that need set_map() on map transitions."""
         candidates = [
+            self.chunk_streaming_system,
             self.movement_system,
             self.visibility_system,
             self.action_system,
@@ -87,6 +94,43 @@ class Systems:
         ]
         return [s for s in candidates if s is not None and hasattr(s, "set_map")]
 
+    def frame_processors(self) -> list:
+        """esper processors, in their run order (see register_processors)."""
+        processors = [
+            self.turn_system,
+            self.equipment_system,
+            self.chunk_streaming_system,
+            self.visibility_system,
+            self.movement_system,
+            self.combat_system,
+            self.fct_system,
+        ]
+        return [p for p in processors if p is not None]
+
+    def phase_systems(self) -> list:
+        """Enemy-phase systems TurnOrchestrator calls directly, in call order."""
+        return [
+            self.status_effect_system,
+            self.schedule_system,
+            self.needs_system,
+            self.ai_system,
+            self.gossip_system,
+        ]
+
+    def profiled(self) -> dict[str, object]:
+        """``{field name: system}`` for every system SystemProfiler times."""
+        systems = self.frame_processors() + self.phase_systems()
+        names = {id(value): name for name, value in vars(self).items()}
+        return {names[id(system)]: system for system in systems}
+
+    def fast_forward_processors(self) -> list:
+        """Frame processors that still run per tick while resting/waiting.
+
+        Leaves out the no-op turn processor, the player's FOV (caught up once
+        when the fast-forward ends) and floating combat text (render only).
+        """
+        return [self.equipment_system, self.movement_system, self.combat_system]
+
 
 @dataclass
 class GameContext:
@@ -115,6 +159,10 @@ class GameContext:
     # returning from the world map) so its history is never reset. UISystem
     # reuses this instance instead of creating a fresh, empty one.
     message_log: MessageLog | None = None
+    # Per-system timings (F8 overlay / F11 dump); attached only while enabled.
+    profiler: SystemProfiler = field(default_factory=lambda: SystemProfiler(PROFILER_HISTORY))
+    # Input capture for deterministic replays (main.py --record); None = off.
+    session_recorder: SessionRecorder | None = None
 
     @property
     def map_container(self) -> MapContainer | None:
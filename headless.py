@@ -0,0 +1,360 @@
+"""Headless entry point: run the game loop without a window.
+
+    python headless.py [--seeds 1 2 3] [--turns 1000] [--policy random|scripted]
+                       [--script move_up,move_up,wait] [--trace-memory] [--json out.json]
+                       [--ecs-backend esper|archetype]
+    python headless.py --replay recording.json
+
+A HeadlessSession builds a GameContext through ``bootstrap.build_game_context``
+and runs the real GameplayState — InputController, TurnOrchestrator and all
+systems — but never calls ``draw()``, so no display is needed. A policy
+picks the player's InputCommand each turn; modal windows a command opens
+(dialogue, trade, ...) are closed again, as there is nobody to answer them.
+
+Every logic system's ``process`` (core.profiling) and every event handler
+(core.event_bus) is timed during a run, so the command line doubles as a
+benchmark: per seed it reports turns/sec, per-system wall time, event
+dispatch counts and memory (peak RSS; peak traced Python allocations with
+--trace-memory, which slows the run down considerably).
+
+``--replay`` plays back a recording made with ``main.py --record`` on the
+recording's seed and checks that the run ends in the recorded state hash
+(game.services.session_recorder); the exit status is 1 on a mismatch.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+
+# No window is ever opened, but SDL must not try to find a display either.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+import tracemalloc
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import esper
+import pygame
+
+from bootstrap import build_game_context
+from config import ECS_BACKEND
+from core.ecs import reset_world
+from core.event_bus import event_bus
+from core.input_manager import InputCommand
+from core.profiling import SystemProfiler
+from game.services.session_recorder import PressPlayback, SessionRecording, state_hash
+from game.states.gameplay import GameplayState
+from game.states.world_map import WorldMapState
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# What a replay hands to get_event for each recorded key press; the
+# InputManager answers it from the recording, never from the key.
+REPLAYED_KEY_PRESS = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UNKNOWN)
+
+MOVE_COMMANDS = (
+    InputCommand.MOVE_UP,
+    InputCommand.MOVE_DOWN,
+    InputCommand.MOVE_LEFT,
+    InputCommand.MOVE_RIGHT,
+)
+
+
+class RandomPolicy:
+    """Random walk: keeps a heading for a few steps, sometimes waits or interacts."""
+
+    name = "random"
+
+    def __init__(self, seed: int = 0, wait_chance: float = 0.1, interact_chance: float = 0.05):
+        self.rng = random.Random(seed)
+        self.wait_chance = wait_chance
+        self.interact_chance = interact_chance
+        self._heading = None
+        self._steps_left = 0
+
+    def next_command(self, session: "HeadlessSession") -> InputCommand:
+        roll = self.rng.random()
+        if roll < self.wait_chance:
+            return InputCommand.WAIT
+        if roll < self.wait_chance + self.interact_chance:
+            return InputCommand.INTERACT
+        if self._steps_left <= 0:
+            self._heading = self.rng.choice(MOVE_COMMANDS)
+            self._steps_left = self.rng.randint(1, 8)
+        self._steps_left -= 1
+        return self._heading
+
+
+class ScriptedPolicy:
+    """Replays a fixed command sequence, looping when it runs out."""
+
+    name = "scripted"
+
+    def __init__(self, commands: Sequence[InputCommand]):
+        if not commands:
+            raise ValueError("ScriptedPolicy needs at least one command")
+        self.commands = list(commands)
+        self._index = 0
+
+    @classmethod
+    def parse(cls, script: str) -> "ScriptedPolicy":
+        """Build from a comma-separated list of InputCommand names (``"move_up,wait"``)."""
+        try:
+            return cls([InputCommand[name.strip().upper()] for name in script.split(",") if name.strip()])
+        except KeyError as exc:
+            raise ValueError(f"Unknown input command: {exc.args[0]}") from None
+
+    def next_command(self, session: "HeadlessSession") -> InputCommand:
+        command = self.commands[self._index % len(self.commands)]
+        self._index += 1
+        return command
+
+
+@dataclass
+class RunReport:
+    """What one headless run did and what it cost."""
+
+    seed: int
+    policy: str
+    turns: int = 0
+    seconds: float = 0.0
+    died: bool = False
+    entities: int = 0
+    system_seconds: dict[str, float] = field(default_factory=dict)
+    system_calls: dict[str, int] = field(default_factory=dict)
+    peak_rss_kb: int | None = None
+    traced_peak_bytes: int | None = None
+    events: dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "policy": self.policy,
+            "turns": self.turns,
+            "seconds": self.seconds,
+            "turns_per_second": self.turns_per_second,
+            "died": self.died,
+            "entities": self.entities,
+            "system_seconds": self.system_seconds,
+            "system_calls": self.system_calls,
+            "peak_rss_kb": self.peak_rss_kb,
+            "traced_peak_bytes": self.traced_peak_bytes,
+            "events": self.events,
+        }
+
+
+class HeadlessSession:
+    """One game run driven without a display."""
+
+    def __init__(self, seed: int, template=None, ecs_backend: str = ECS_BACKEND):
+        """Args:
+        seed: World seed (see build_game_context).
+        template: Optional WorldTemplate for the same seed.
+        ecs_backend: Entity storage behind esper's API.
+        """
+        # Sessions share esper's module-global world; start from a clean one.
+        reset_world()
+        self.seed = seed
+        self.ctx = build_game_context(seed=seed, template=template, ecs_backend=ecs_backend)
+        self.state = GameplayState()
+        self.state.startup(self.ctx)
+        # A profiler of its own: the run's totals must not mix with (or
+        # reset) the in-game debug overlay's.
+        self.profiler = SystemProfiler()
+
+    @property
+    def finished(self) -> bool:
+        """True once the gameplay state wants to leave (player death)."""
+        return self.state.done
+
+    def step(self, command: InputCommand) -> bool:
+        """Play one player turn with `command`, then the enemy phase.
+
+        A command that does not spend the turn (picking up nothing with
+        INTERACT, cycling the action list) is followed by a WAIT, so a step
+        advances the world by one round. Returns False once the run is over.
+        """
+        if self.finished:
+            return False
+        self._dispatch(command)
+        if self.ctx.systems.turn_system.is_player_turn():
+            self._dispatch(InputCommand.WAIT)
+        self.state.update(0.0)
+        return not self.finished
+
+    def _dispatch(self, command: InputCommand) -> None:
+        self.state.input_controller.handle_event(command, self.state)
+        # Nobody is there to answer a window the command opened.
+        self.ctx.ui_stack.clear()
+
+    def run(self, policy, turns: int, trace_memory: bool = False) -> RunReport:
+        """Play up to `turns` turns with `policy` and report timings."""
+        report = RunReport(seed=self.seed, policy=getattr(policy, "name", type(policy).__name__))
+        if trace_memory:
+            tracemalloc.start()
+        self.profiler.reset()
+        self.profiler.attach(self.ctx.systems.profiled())
+        event_bus.reset()
+        event_bus.timing = True
+        start = time.perf_counter()
+        try:
+            for _ in range(turns):
+                if not self.step(policy.next_command(self)):
+                    break
+                report.turns += 1
+        finally:
+            report.seconds = time.perf_counter() - start
+            self.profiler.detach()
+            event_bus.timing = False
+            if trace_memory:
+                report.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        report.died = self.finished
+        report.entities = len(esper._entities)
+        report.system_seconds = {name: stats.total for name, stats in self.profiler.stats.items()}
+        report.system_calls = {name: stats.calls for name, stats in self.profiler.stats.items()}
+        report.events = event_bus.snapshot()
+        if resource is not None:
+            report.peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return report
+
+    def replay(self, recording: SessionRecording) -> str:
+        """Play back a recording made on this session's seed; returns the final state hash.
+
+        Mirrors the main loop: each recorded key press goes through the
+        active state's ``get_event``, so open windows receive their commands
+        as they did live, with the InputManager handing out the recorded
+        commands. The presses of one frame are handled back to back,
+        followed by a single logic update (idle frames in between change
+        nothing but cosmetics). Leaving the gameplay state for the world map
+        and back goes through the same states the game uses; the run ends at
+        the last entry or when the player dies.
+        """
+        if recording.seed != self.seed:
+            raise ValueError(f"Recording was made on seed {recording.seed}, session has seed {self.seed}")
+        states = {"GAME": self.state, "WORLD_MAP": WorldMapState()}
+        state_name = "GAME"
+        frame = None
+        input_manager = self.ctx.input_manager
+        self.state.update(0.0)
+        try:
+            for (press_frame, _press), entries in itertools.groupby(
+                recording.entries, key=lambda entry: (entry.frame, entry.press)
+            ):
+                entries = list(entries)
+                if frame is not None and press_frame != frame:
+                    state_name = self._replay_update(states, state_name)
+                    if state_name is None:
+                        break
+                frame = press_frame
+                if entries[0].state != state_name:
+                    raise ValueError(f"Frame {frame}: recorded for state {entries[0].state}, replay is in {state_name}")
+                input_manager.playback = playback = PressPlayback(entries)
+                states[state_name].get_event(REPLAYED_KEY_PRESS)
+                if playback.entries:
+                    raise ValueError(f"Frame {frame}: replay left {len(playback.entries)} recorded commands unused")
+            else:
+                if frame is not None:
+                    self._replay_update(states, state_name)
+        finally:
+            input_manager.playback = None
+        return state_hash(self.ctx)
+
+    def _replay_update(self, states: dict, state_name: str) -> str | None:
+        """One frame's update and state flip; returns the next state (None once the run is over)."""
+        state = states[state_name]
+        state.update(0.0)
+        if not state.done:
+            return state_name
+        state.done = False
+        next_state = state.next_state
+        if next_state not in states:
+            return None
+        states[next_state].startup(self.ctx)
+        return next_state
+
+
+def _print_report(report: RunReport) -> None:
+    status = "died" if report.died else "alive"
+    memory = f"peak RSS {report.peak_rss_kb / 1024:.1f} MiB" if report.peak_rss_kb else "peak RSS n/a"
+    if report.traced_peak_bytes is not None:
+        memory += f", traced peak {report.traced_peak_bytes / 2**20:.1f} MiB"
+    print(
+        f"seed {report.seed}: {report.turns} turns in {report.seconds:.2f}s "
+        f"({report.turns_per_second:.1f} turns/s, {status}, {report.entities} entities, {memory})"
+    )
+    total = sum(report.system_seconds.values()) or 1.0
+    for name, seconds in sorted(report.system_seconds.items(), key=lambda item: -item[1]):
+        calls = report.system_calls[name]
+        per_call = seconds / calls * 1e6 if calls else 0.0
+        print(
+            f"    {name:<22}{seconds * 1000:10.1f} ms {seconds / total:6.1%} {calls:7d} calls {per_call:9.1f} us/call"
+        )
+    for name, event in report.events.items():
+        handler_ms = sum(h["total_ms"] for h in event["handlers"].values())
+        print(f"    event {name:<16}{event['dispatches']:7d} dispatches {handler_ms:10.1f} ms in handlers")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1234], help="World seeds, one run each")
+    parser.add_argument("--turns", type=int, default=1000, help="Player turns per run")
+    parser.add_argument("--policy", choices=("random", "scripted"), default="random")
+    parser.add_argument("--script", default="move_up,move_right,move_down,move_left,wait", help="Scripted commands")
+    parser.add_argument("--trace-memory", action="store_true", help="Track peak Python allocations (slow)")
+    parser.add_argument("--json", help="Write the reports to this file")
+    parser.add_argument("--replay", metavar="PATH", help="Replay a recording and verify its final state hash")
+    parser.add_argument("--ecs-backend", choices=("esper", "archetype"), default=ECS_BACKEND, help="Entity storage")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.replay:
+        sys.exit(_replay(args.replay, args.ecs_backend))
+    reports = []
+    for seed in args.seeds:
+        session = HeadlessSession(seed, ecs_backend=args.ecs_backend)
+        policy = RandomPolicy(seed) if args.policy == "random" else ScriptedPolicy.parse(args.script)
+        report = session.run(policy, args.turns, trace_memory=args.trace_memory)
+        _print_report(report)
+        reports.append(report)
+
+    turns = sum(r.turns for r in reports)
+    seconds = sum(r.seconds for r in reports)
+    if len(reports) > 1 and seconds > 0:
+        print(f"total: {turns} turns in {seconds:.2f}s ({turns / seconds:.1f} turns/s)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([r.to_dict() for r in reports], f, indent=2)
+
+
+def _replay(filepath: str, ecs_backend: str = ECS_BACKEND) -> int:
+    recording = SessionRecording.load(filepath)
+    session = HeadlessSession(recording.seed, ecs_backend=ecs_backend)
+    start = time.perf_counter()
+    final_hash = session.replay(recording)
+    seconds = time.perf_counter() - start
+    print(f"replayed {len(recording.entries)} inputs on seed {recording.seed} in {seconds:.2f}s: {final_hash}")
+    if recording.final_hash is None:
+        print("recording has no final hash to compare against")
+        return 0
+    if final_hash != recording.final_hash:
+        print(f"MISMATCH: recording ended in {recording.final_hash}")
+        return 1
+    print("state hash matches the recording")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
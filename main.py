@@ -5,25 +5,60 @@ import sys
 import pygame
 
 from bootstrap import build_game_context
-from config import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
+from config import (
+    ECS_BACKEND,
+    HITCH_DIR,
+    HITCH_SAMPLE_INTERVAL,
+    HITCH_THRESHOLD_MS,
+    SCREEN_HEIGHT,
+    SCREEN_TITLE,
+    SCREEN_WIDTH,
+)
 from core.ecs import reset_world
+from core.frame_recorder import FrameRecorder
+from game.services.session_recorder import SessionRecorder
+from game.services.world_template import WorldTemplate
 from game.states import GameOver, GameplayState, TitleScreen, WorldMapState
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
 
 class GameController:
-    def __init__(self, seed: int | None = None):
+    def __init__(
+        self,
+        seed: int | None = None,
+        pregenerate: bool = False,
+        workers: int = 1,
+        hitch_ms: float | None = None,
+        record_path: str | None = None,
+        ecs_backend: str = ECS_BACKEND,
+    ):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(SCREEN_TITLE)
         self.clock = pygame.time.Clock()
+        # Opt-in hitch recorder: frames slower than hitch_ms are dumped as
+        # flamegraph data. Disabled (None) it is a no-op.
+        self.frame_recorder = FrameRecorder(hitch_ms, HITCH_DIR, sample_interval=HITCH_SAMPLE_INTERVAL)
 
         # Original seed request (None = random per run); preserved so a fixed
         # --seed stays reproducible across new games while a random run gets a
         # fresh world each time.
         self._seed = seed
-        self.ctx = build_game_context(seed=seed)
+        self._pregenerate = pregenerate
+        self._workers = workers
+        self._ecs_backend = ecs_backend
+        self.ctx = build_game_context(seed=seed, pregenerate=pregenerate, workers=workers, ecs_backend=ecs_backend)
         logging.getLogger(__name__).info("World seed: %d", self.ctx.world_seed)
+        # A fixed seed rebuilds the very same world on every new run: snapshot
+        # it now, before any play, and clone it instead of regenerating.
+        self._template = WorldTemplate.capture(self.ctx) if seed is not None else None
+        # Opt-in input recording of the first run, written on quit or when
+        # the run ends; replay it with ``headless.py --replay``. The
+        # InputManager reports every command it hands out to the recorder.
+        self.record_path = record_path
+        if record_path:
+            self.ctx.session_recorder = SessionRecorder(self.ctx.world_seed)
+            self.ctx.input_manager.recorder = self.ctx.session_recorder
 
         self.states = {
             "TITLE": TitleScreen(),
@@ -36,20 +71,37 @@ class GameController:
         self.state.startup(self.ctx)
 
     def run(self):
+        recorder = self.frame_recorder
         while True:
+            # Frame time excludes the frame-rate cap's sleep.
             dt = self.clock.tick(60) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                self.state.get_event(event)
-
-            self.state.update(dt)
-            if self.state.done:
-                self.flip_state()
-
-            self.state.draw(self.screen)
-            pygame.display.flip()
+            if self.ctx.session_recorder is not None:
+                self.ctx.session_recorder.next_frame(self.state_name)
+            with recorder.frame():
+                with recorder.stage("events"):
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            self._quit()
+                        self.state.get_event(event)
+
+                with recorder.stage("update"):
+                    self.state.update(dt)
+                if self.state.done:
+                    with recorder.stage("flip_state"):
+                        self.flip_state()
+
+                with recorder.stage("draw"):
+                    self.state.draw(self.screen)
+                with recorder.stage("display_flip"):
+                    pygame.display.flip()
+
+    def _quit(self):
+        self._finish_recording()
+        if self.frame_recorder.enabled:
+            self.frame_recorder.stop()
+            logging.getLogger(__name__).info("Frame times: %s", self.frame_recorder.summary())
+        pygame.quit()
+        sys.exit()
 
     def flip_state(self):
         next_state = self.state.next_state
@@ -64,19 +116,55 @@ class GameController:
         self.state.startup(self.ctx)
 
     def _start_new_run(self):
-        """Discard the current run's world and build a fresh GameContext."""
+        """Discard the current run's world and build a fresh GameContext
+        (cloned from the world template when the seed is fixed)."""
+        self._finish_recording()
         reset_world()
-        self.ctx = build_game_context(seed=self._seed)
+        self.ctx = build_game_context(
+            seed=self._seed,
+            pregenerate=self._pregenerate,
+            workers=self._workers,
+            template=self._template,
+            ecs_backend=self._ecs_backend,
+        )
         logging.getLogger(__name__).info("World seed: %d", self.ctx.world_seed)
 
+    def _finish_recording(self):
+        if self.ctx.session_recorder is not None:
+            self.ctx.session_recorder.finish(self.ctx, self.record_path)
+            self.ctx.session_recorder = None
+            self.ctx.input_manager.recorder = None
+
 
 def main():
     parser = argparse.ArgumentParser(description=SCREEN_TITLE)
     parser.add_argument("--seed", type=int, default=None, help="World seed for a reproducible run")
+    parser.add_argument(
+        "--pregenerate", action="store_true", help="Build every location at start instead of on first visit"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Processes for --pregenerate (default: serial)")
+    parser.add_argument(
+        "--hitch-ms",
+        type=float,
+        nargs="?",
+        const=HITCH_THRESHOLD_MS,
+        default=None,
+        help=f"Record frame times; dump a flamegraph of frames slower than this (default {HITCH_THRESHOLD_MS:g} ms)"
+        f" to {HITCH_DIR}/",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Record the run's input for headless.py --replay")
+    parser.add_argument("--ecs-backend", choices=("esper", "archetype"), default=ECS_BACKEND, help="Entity storage")
     args = parser.parse_args()
 
     pygame.init()
-    game = GameController(seed=args.seed)
+    game = GameController(
+        seed=args.seed,
+        pregenerate=args.pregenerate,
+        workers=args.workers,
+        hitch_ms=args.hitch_ms,
+        record_path=args.record,
+        ecs_backend=args.ecs_backend,
+    )
     game.run()
 
 
@@ -167,7 +167,6 @@ def test_work_npc_loiters_near_anchor():
     from config import AI_LOITER_RADIUS
     from game.components import Activity
 
-    random.seed(1234)
     reset_world()
     container = _open_container()
     anchor = (10, 10)
@@ -178,7 +177,7 @@ def test_work_npc_loiters_near_anchor():
         Activity(current_activity="WORK", target_pos=anchor),
     )
 
-    ai_sys = AISystem()
+    ai_sys = AISystem(rng=random.Random(1234))
     visited = set()
     for _ in range(40):
         turn = TurnSystem()
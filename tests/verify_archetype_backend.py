@@ -0,0 +1,124 @@
+"""Tests for the archetype storage backend behind esper's API (core.ecs)."""
+
+import pickle
+import random
+from dataclasses import dataclass
+
+import esper
+import pytest
+
+from core.archetype_storage import ArchetypeStorage
+from core.ecs import create_entities, extract_entities, isolated_world, use_ecs_backend
+from core.input_manager import InputCommand
+
+
+@dataclass
+class _A:
+    v: int = 0
+
+
+@dataclass
+class _B:
+    v: int = 0
+
+
+@dataclass
+class _C:
+    v: int = 0
+
+
+TYPES = (_A, _B, _C)
+QUERIES = ((_A,), (_B,), (_A, _B), (_B, _C), (_C, _A, _B))
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    yield
+    use_ecs_backend("esper")
+
+
+def _snapshot():
+    """Every query's result, order-independent, plus the entity table."""
+    results = {}
+    for query in QUERIES:
+        rows = esper.get_components(*query)
+        results[query] = sorted((ent, tuple(c.v for c in comps)) for ent, comps in rows)
+    results["single"] = sorted((ent, c.v) for ent, c in esper.get_component(_C))
+    results["entities"] = sorted((ent, sorted(t.__name__ for t in comps)) for ent, comps in esper._entities.items())
+    return results
+
+
+def _churn(seed):
+    """A seeded mix of every write esper offers, with queries in between."""
+    rng = random.Random(seed)
+    snapshots = []
+    live = [esper.create_entity(*(t(rng.randrange(9)) for t in TYPES if rng.random() < 0.6)) for _ in range(40)]
+    for step in range(300):
+        ent = rng.choice(live)
+        roll = rng.random()
+        kind = rng.choice(TYPES)
+        if roll < 0.35:
+            esper.add_component(ent, kind(step))
+        elif roll < 0.6:
+            esper.try_remove_component(ent, kind)
+        elif roll < 0.7 and esper.has_component(ent, kind):
+            esper.remove_component(ent, kind)
+        elif roll < 0.78:
+            esper.delete_entity(ent, immediate=rng.random() < 0.5)
+            live.remove(ent)
+            live.append(esper.create_entity(kind(step)))
+        elif roll < 0.82:
+            batch = rng.sample(live, 3)
+            comps = extract_entities(batch)
+            live = [e for e in live if e not in batch] + create_entities(comps)
+        if step % 25 == 0:
+            esper.process()
+            snapshots.append(_snapshot())
+    esper.process()
+    snapshots.append(_snapshot())
+    return snapshots
+
+
+def test_backends_answer_every_query_alike():
+    esper_run = _churn(seed=5)
+    esper.clear_database()
+    use_ecs_backend("archetype")
+    assert isinstance(esper._entities, ArchetypeStorage)
+    assert _churn(seed=5) == esper_run
+
+
+def test_switching_carries_entities_and_worlds_over():
+    a = esper.create_entity(_A(1), _B(2))
+    b = esper.create_entity(_B(3))
+    use_ecs_backend("archetype")
+    storage = esper._entities
+    assert isinstance(storage, ArchetypeStorage) and not esper._components
+    assert [e for e, _ in esper.get_components(_A, _B)] == [a]
+    assert len(storage.archetypes) == 2
+
+    with isolated_world():
+        assert isinstance(esper._entities, ArchetypeStorage) and not esper._entities
+        esper.create_entity(_A())
+    assert esper._entities is storage and sorted(storage) == [a, b]
+
+    clone = pickle.loads(pickle.dumps(storage))
+    assert isinstance(clone, ArchetypeStorage)
+    assert sorted(e for e, _ in clone.query((_B,))) == [a, b]
+
+    esper.add_component(b, _A(4))
+    use_ecs_backend("esper")
+    assert type(esper._entities) is dict
+    assert esper._components[_A] == {a, b}
+    assert sorted(e for e, _ in esper.get_components(_A, _B)) == [a, b]
+
+    with pytest.raises(ValueError):
+        use_ecs_backend("sparse_set")
+
+
+def test_headless_turns_run_on_the_archetype_backend():
+    from headless import HeadlessSession
+
+    session = HeadlessSession(7, ecs_backend="archetype")
+    assert isinstance(esper._entities, ArchetypeStorage)
+    for command in [InputCommand.MOVE_UP, InputCommand.MOVE_LEFT, InputCommand.WAIT] * 10:
+        assert session.step(command)
@@ -0,0 +1,65 @@
+"""Tests for the benchmark harness and the hot-path suite's baseline check."""
+
+import json
+
+from benchmarks import bench_hot_paths
+from benchmarks.harness import (
+    Benchmark,
+    BenchResult,
+    compare,
+    format_report,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+
+def test_run_benchmark_times_every_round():
+    calls = []
+    bench = Benchmark("noop", lambda: lambda: calls.append(1), number=4, repeat=3)
+    result = run_benchmark(bench)
+    assert len(calls) == 12
+    assert len(result.rounds) == 3
+    assert result.best <= result.median
+
+    quick = run_benchmark(bench, scale=0.25)
+    assert quick.number == 1 and len(quick.rounds) == 1
+
+
+def test_baseline_round_trip_and_regression_flag(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    save_baseline([BenchResult("fast", 1, [0.010, 0.012]), BenchResult("slow", 1, [0.5])], path)
+    baseline = load_baseline(path)
+    assert baseline == {"fast": 0.010, "slow": 0.5}
+
+    current = [BenchResult("fast", 1, [0.013]), BenchResult("slow", 1, [0.45]), BenchResult("new", 1, [0.1])]
+    by_name = {c.name: c for c in compare(current, baseline)}
+    assert by_name["fast"].is_regression(0.15)
+    assert not by_name["fast"].is_regression(0.5)
+    assert not by_name["slow"].is_regression(0.15)
+    assert not by_name["new"].is_regression(0.15)
+
+    report = format_report(list(by_name.values()), 0.15)
+    assert "REGRESSION" in report.splitlines()[1]
+    assert "new" in report.splitlines()[3]
+
+
+def test_cli_saves_a_baseline_and_flags_a_slowdown(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    args = ["--filter", "visibility[r=5]", "--quick", "--baseline", str(path)]
+    assert bench_hot_paths.main([*args, "--save-baseline"]) == 0
+    data = json.loads(path.read_text())
+    assert list(data["results"]) == ["visibility[r=5]"]
+
+    # Pretend the baseline was a hundred times faster.
+    data["results"]["visibility[r=5]"]["best_s"] /= 100
+    path.write_text(json.dumps(data))
+    assert bench_hot_paths.main(args) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_save_and_load_cases_leave_no_files_behind(tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    args = ["--filter", "explored world", "--quick", "--baseline", str(tmp_path / "none.json")]
+    assert bench_hot_paths.main(args) == 0
+    assert list(tmp_path.iterdir()) == []
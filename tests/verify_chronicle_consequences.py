@@ -25,12 +25,14 @@ EVENTS_FILE = "assets/data/world_events.json"
 
 class _NoRollRng:
     """Stub rng: random() always misses the event chance, so the only
-    chronicle activity comes from scheduled escalations."""
+    chronicle activity comes from scheduled escalations. (Settlements draw
+    their gap to the next event geometrically; this value puts it ~670
+    hours out, past anything these tests tick.)"""
 
     def random(self):
-        return 0.99
+        return 1.0 - 1e-12
 
-    def choices(self, population, weights=None):
+    def choices(self, population, weights=None, cum_weights=None):
         return [population[0]]
 
 
@@ -0,0 +1,122 @@
+"""Tests for the streamed, chunked wilderness (ChunkedMapContainer)."""
+
+import random
+
+import esper
+
+from core.noise import value_noise
+from game.components import MapBound, Position
+from game.content.resource_loader import ResourceLoader
+from game.map.chunked_map_container import ChunkedMapContainer
+from game.map.tile import VisibilityState
+from game.services.map_generator import MapGenerator, WildernessChunkSource
+from game.services.map_service import MapService
+from game.services.save_serialization import decode_map, encode_map
+
+SIZE = 256
+
+
+def _load_content():
+    ResourceLoader.load_tiles("assets/data/tile_types.json")
+    ResourceLoader.load_entities("assets/data/entities.json")
+    ResourceLoader.load_items("assets/data/items.json")
+
+
+def _streamed(seed=5):
+    wild = MapGenerator(MapService()).create_streamed_wilderness(esper, "Far", "forest", (1, 1), seed=seed, size=SIZE)
+    wild.thaw(esper)
+    return wild
+
+
+def _chunk_types(container, cx, cy):
+    x0, y0, w, h = container.chunk_bounds(cx, cy)
+    return [[t.type_id for t in row[x0 : x0 + w]] for row in container.layers[0].tiles[y0 : y0 + h]]
+
+
+def _live_positions():
+    return sorted((p.x, p.y) for _, (_b, p) in esper.get_components(MapBound, Position))
+
+
+def test_noise_regions_line_up():
+    whole = value_noise(48, 48, seed=9)
+    part = value_noise(16, 16, seed=9, origin=(32, 16))
+    assert all(part[y][x] == whole[16 + y][32 + x] for y in range(16) for x in range(16))
+
+
+def test_only_chunks_near_the_player_are_loaded():
+    _load_content()
+    wild = _streamed()
+    ax, ay = wild.arrival_pos
+    assert wild.width == wild.height == SIZE
+    assert wild.is_walkable(ax, ay)
+    assert len(wild.loaded) <= (2 * wild.load_radius + 1) ** 2
+    assert not wild.is_walkable(5, 5), "an unloaded chunk is void"
+    assert sum(len(row) for row in wild.iter_tile_rows()) == len(wild.loaded) * wild.chunk_size**2
+
+    wild.stream(esper, 8, 8, current_round=10)
+    assert wild.is_generated(0, 0) and (0, 0) in wild.loaded
+    assert wild.chunk_of(ax, ay) in wild.evicted, "the arrival chunk is left far behind"
+
+
+def test_evicted_chunks_come_back_with_memory_and_entities():
+    _load_content()
+    wild = _streamed()
+    ax, ay = wild.arrival_pos
+    home = wild.chunk_of(ax, ay)
+    types_before = _chunk_types(wild, *home)
+    entities_before = _live_positions()
+    wild.get_tile(ax, ay).visibility_state = VisibilityState.VISIBLE
+
+    wild.stream(esper, 8, 8, current_round=10)
+    assert not any(wild.chunk_of(x, y) == home for x, y in _live_positions())
+    assert wild.get_tile(ax, ay) is wild.void_tile
+    assert wild.get_tile(ax, ay).visibility_state == VisibilityState.UNEXPLORED
+
+    wild.stream(esper, ax, ay, current_round=25)
+    assert _chunk_types(wild, *home) == types_before
+    home_entities = [p for p in _live_positions() if wild.chunk_of(*p) == home]
+    assert home_entities == [p for p in entities_before if wild.chunk_of(*p) == home]
+    tile = wild.get_tile(ax, ay)
+    assert tile.visibility_state == VisibilityState.SHROUDED
+    assert tile.rounds_since_seen == 15
+
+
+def test_chunks_generate_the_same_in_any_order():
+    _load_content()
+    source = WildernessChunkSource("forest", seed=3, size=SIZE)
+    a = ChunkedMapContainer(SIZE, SIZE, source)
+    b = ChunkedMapContainer(SIZE, SIZE, WildernessChunkSource("forest", seed=3, size=SIZE))
+    a.load_chunk(esper, 4, 7)
+    for cx, cy in [(0, 0), (9, 2), (4, 6)]:
+        b.load_chunk(esper, cx, cy)
+    b.load_chunk(esper, 4, 7)
+    assert _chunk_types(a, 4, 7) == _chunk_types(b, 4, 7)
+    rng = random.Random(1)
+    x, y = a.sample_position(rng)
+    assert a.chunk_of(x, y) == (4, 7)
+
+
+def test_save_keeps_generated_chunks_only():
+    _load_content()
+    wild = _streamed()
+    ax, ay = wild.arrival_pos
+    wild.stream(esper, ax, ay - 80, current_round=5)
+    wild.get_tile(ax, ay - 80).visibility_state = VisibilityState.VISIBLE
+    wild.freeze(esper)
+
+    encoded = encode_map(wild)
+    generated = len(wild.loaded) + len(wild.evicted)
+    assert len(encoded["chunked"]["chunks"]) == generated < wild.chunk_columns * wild.chunk_rows
+
+    restored = decode_map(encoded)
+    assert isinstance(restored, ChunkedMapContainer)
+    assert restored.loaded == wild.loaded and restored.evicted.keys() == wild.evicted.keys()
+    assert len(restored.frozen_entities) == len(wild.frozen_entities)
+    assert restored.get_tile(ax, ay - 80).visibility_state == VisibilityState.SHROUDED
+    for chunk in wild.loaded:
+        assert _chunk_types(restored, *chunk) == _chunk_types(wild, *chunk)
+
+    # A chunk evicted before the save comes back with its entities.
+    home = restored.chunk_of(ax, ay)
+    restored.load_chunk(esper, *home)
+    assert any(restored.chunk_of(*p) == home for p in _live_positions())
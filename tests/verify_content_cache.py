@@ -0,0 +1,98 @@
+"""Tests for the compiled, memory-mapped content cache."""
+
+import json
+import os
+
+import pytest
+
+from game.content.content_cache import ContentCache, content_cache, read_json
+from game.content.content_database import default_content
+
+
+def _write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    (root / "scenarios").mkdir(parents=True)
+    _write(root / "items.json", [{"id": "apple"}])
+    _write(root / "scenarios" / "village.json", {"name": "Village"})
+    return root
+
+
+@pytest.fixture(autouse=True)
+def _close_default_cache():
+    yield
+    content_cache.close()
+
+
+def test_cached_document_matches_json(data_dir, tmp_path):
+    cache = ContentCache().open(str(data_dir), str(tmp_path / "cache.bin"))
+    assert cache.is_open
+    assert cache.get(str(data_dir / "items.json")) == [{"id": "apple"}]
+    assert cache.get(str(data_dir / "scenarios" / "village.json")) == {"name": "Village"}
+    assert cache.get(str(tmp_path / "elsewhere.json")) is None
+    cache.close()
+
+
+def test_reads_return_fresh_objects(data_dir, tmp_path):
+    cache = ContentCache().open(str(data_dir), str(tmp_path / "cache.bin"))
+    first = cache.get(str(data_dir / "items.json"))
+    first.append("mutated")
+    assert cache.get(str(data_dir / "items.json")) == [{"id": "apple"}]
+    cache.close()
+
+
+def test_second_open_reuses_blob_without_rewrite(data_dir, tmp_path):
+    cache_path = tmp_path / "cache.bin"
+    ContentCache().open(str(data_dir), str(cache_path)).close()
+    stamp = os.stat(cache_path).st_mtime_ns
+
+    cache = ContentCache().open(str(data_dir), str(cache_path))
+    assert os.stat(cache_path).st_mtime_ns == stamp
+    assert cache.get(str(data_dir / "items.json")) == [{"id": "apple"}]
+    cache.close()
+
+
+def test_changed_source_is_recompiled(data_dir, tmp_path):
+    cache_path = str(tmp_path / "cache.bin")
+    ContentCache().open(str(data_dir), cache_path).close()
+
+    _write(data_dir / "items.json", [{"id": "pear"}, {"id": "plum"}])
+    cache = ContentCache().open(str(data_dir), cache_path)
+    assert cache.get(str(data_dir / "items.json")) == [{"id": "pear"}, {"id": "plum"}]
+    # Untouched documents survive the rebuild.
+    assert cache.get(str(data_dir / "scenarios" / "village.json")) == {"name": "Village"}
+    cache.close()
+
+
+def test_edit_after_open_bypasses_stale_record(data_dir, tmp_path):
+    cache = ContentCache().open(str(data_dir), str(tmp_path / "cache.bin"))
+    _write(data_dir / "items.json", [{"id": "a much longer replacement id"}])
+    assert cache.get(str(data_dir / "items.json")) is None
+    cache.close()
+
+
+def test_malformed_json_still_raises_through_read_json(data_dir, tmp_path):
+    (data_dir / "broken.json").write_text("{not json", encoding="utf-8")
+    content_cache.open(str(data_dir), str(tmp_path / "cache.bin"))
+    with pytest.raises(json.JSONDecodeError):
+        read_json(str(data_dir / "broken.json"))
+
+
+def test_corrupt_cache_file_is_rebuilt(data_dir, tmp_path):
+    cache_path = tmp_path / "cache.bin"
+    cache_path.write_bytes(b"garbage")
+    cache = ContentCache().open(str(data_dir), str(cache_path))
+    assert cache.get(str(data_dir / "items.json")) == [{"id": "apple"}]
+    cache.close()
+
+
+def test_content_database_loads_through_cache(tmp_path):
+    content_cache.open("assets/data", str(tmp_path / "cache.bin"))
+    db = default_content.load("assets/data")
+    assert len(db.tiles.all_ids()) > 0
+    assert db.entities.get("villager") is not None
@@ -0,0 +1,137 @@
+"""Tests for on-demand (deferred) world generation."""
+
+import esper
+import pytest
+
+from core.ecs import isolated_world
+from core.rng import derive_seed
+from game.components import Name, Position
+from game.content.resource_loader import ResourceLoader
+from game.services.map_generator import MapGenerator, wilderness_map_id
+from game.services.map_service import MapService
+from game.services.world_graph_service import WorldGraphService
+
+WORLD_FILE = "assets/data/world.json"
+SEED = derive_seed(1234, "maps")
+
+
+@pytest.fixture(autouse=True)
+def _load_content():
+    ResourceLoader.load_schedules("assets/data/schedules.json")
+    ResourceLoader.load_tiles("assets/data/tile_types.json")
+    ResourceLoader.load_entities("assets/data/entities.json")
+    ResourceLoader.load_items("assets/data/items.json")
+
+
+def _build(on_demand: bool):
+    map_service = MapService()
+    graph = WorldGraphService.from_file(WORLD_FILE)
+    MapGenerator(map_service, seed=SEED).create_world(esper, graph, on_demand=on_demand)
+    return map_service, graph
+
+
+def _tile_grid(container):
+    return [[[tile._type_id for tile in row] for row in layer.tiles] for layer in container.layers]
+
+
+def _frozen_summary(container):
+    return sorted(
+        (
+            next((c.name for c in comps if isinstance(c, Name)), ""),
+            repr(next(c for c in comps if isinstance(c, Position))),
+        )
+        for comps in container.frozen_entities
+    )
+
+
+def test_only_start_location_is_built_up_front():
+    map_service, graph = _build(on_demand=True)
+    start = graph.start_location_id
+    assert map_service.active_map_id == start
+    for location in graph.locations.values():
+        if location.id != start and location.type in ("settlement", "poi"):
+            assert not map_service.is_generated(location.id)
+            assert location.id in map_service.pending
+
+
+def test_first_access_materializes_whole_settlement():
+    map_service, graph = _build(on_demand=True)
+    other = next(
+        loc for loc in graph.locations.values() if loc.type == "settlement" and loc.id != graph.start_location_id
+    )
+    container = map_service.get_map(other.id)
+    assert container is not None
+    assert len(container.frozen_entities) >= 1
+    # Siblings (wilderness, interiors) were built by the same thunk.
+    assert map_service.is_generated(wilderness_map_id(other.id))
+    assert not any(mid in map_service.pending for mid in MapGenerator(map_service).location_map_ids(other))
+
+
+def test_materializing_leaves_the_live_world_untouched():
+    map_service, graph = _build(on_demand=True)
+    live_before = sorted(esper._entities)
+    for location in graph.locations.values():
+        map_service.get_map(location.id)
+    assert sorted(esper._entities) == live_before
+    assert not map_service.pending
+
+
+def test_deferred_layout_matches_eager_generation():
+    eager, graph = _build(on_demand=False)
+    esper.clear_database()
+    deferred, _ = _build(on_demand=True)
+    for location in graph.locations.values():
+        if location.type != "settlement":
+            continue
+        for map_id in MapGenerator(eager).location_map_ids(location):
+            assert _tile_grid(deferred.get_map(map_id)) == _tile_grid(eager.get_map(map_id)), map_id
+
+
+def test_generation_order_does_not_change_a_location():
+    first, graph = _build(on_demand=True)
+    ids = [loc.id for loc in graph.locations.values() if loc.type == "settlement"]
+    for map_id in ids:
+        first.get_map(map_id)
+
+    esper.clear_database()
+    second, _ = _build(on_demand=True)
+    for map_id in reversed(ids):
+        second.get_map(map_id)
+
+    for map_id in ids:
+        if map_id == graph.start_location_id:
+            continue
+        assert _tile_grid(first.get_map(map_id)) == _tile_grid(second.get_map(map_id))
+        assert _frozen_summary(first.get_map(map_id)) == _frozen_summary(second.get_map(map_id))
+
+
+def test_isolated_world_restores_entity_ids():
+    kept = esper.create_entity(Name("kept"))
+    with isolated_world():
+        assert not esper._entities
+        esper.create_entity(Name("scratch"))
+    assert list(esper._entities) == [kept]
+    assert esper.create_entity() == kept + 1
+
+
+def _snapshot(map_service):
+    return {
+        map_id: (_tile_grid(container), container.arrival_pos, container.frozen_entities)
+        for map_id, container in map_service.maps.items()
+    }
+
+
+def test_parallel_pregeneration_is_identical_to_serial():
+    graph = WorldGraphService.from_file(WORLD_FILE)
+    serial = MapService()
+    MapGenerator(serial, seed=SEED).create_world(esper, graph)
+    serial_live = sorted(repr(comps) for comps in esper._entities.values())
+
+    esper.clear_database()
+    parallel = MapService()
+    MapGenerator(parallel, seed=SEED).create_world(esper, graph, workers=2)
+    parallel_live = sorted(repr(comps) for comps in esper._entities.values())
+
+    assert list(parallel.maps) == list(serial.maps)
+    assert _snapshot(parallel) == _snapshot(serial)
+    assert parallel_live == serial_live
@@ -0,0 +1,101 @@
+"""Batched economy kernel: multi-hour advances equal hour-by-hour ticking."""
+
+import copy
+import random
+
+import pytest
+
+from config import ECON_MAX_STOCK, PROSPERITY_START, TICKS_PER_HOUR
+from game.services.economy_kernel import SettlementPlan
+from game.services.economy_service import EconomyService
+from game.services.world_graph_service import WorldGraphService
+
+
+def _hourly(plan, levels, prosperity, hours):
+    for _ in range(hours):
+        prosperity, _, _ = plan.step(levels, prosperity)
+    return prosperity
+
+
+def test_real_economy_year_matches_hourly_ticks():
+    graph = WorldGraphService.from_file("assets/data/world.json")
+    hourly = EconomyService()
+    hourly.load_from_world(graph, "assets/data/scenarios")
+    hourly.apply_variation(random.Random(7))
+    batched = copy.deepcopy(hourly)
+
+    for hour in range(1, 24 * 365 + 1):
+        hourly.on_clock_tick({"total_ticks": hour * TICKS_PER_HOUR})
+    batched.on_clock_tick({"total_ticks": 24 * 365 * TICKS_PER_HOUR})
+
+    assert batched.last_processed_hour == hourly.last_processed_hour
+    for loc, stock in hourly.stocks.items():
+        assert batched.stocks[loc] == pytest.approx(stock, abs=1e-9), loc
+    assert batched.prosperity == pytest.approx(hourly.prosperity, abs=1e-9)
+
+
+def test_random_plans_match_hourly_stepping():
+    rng = random.Random(3)
+    for _ in range(400):
+        goods = [f"g{i}" for i in range(rng.randint(1, 5))]
+        rates = {g: rng.uniform(-6, 6) for g in goods}
+        inputs = {}
+        # Several inputs per good, drawn from any good: chains and cycles too
+        for g in goods:
+            others = [h for h in goods if h != g]
+            if rates[g] > 0 and others and rng.random() < 0.7:
+                picked = rng.sample(others, rng.randint(1, min(3, len(others))))
+                inputs[g] = {h: rng.choice([0.5, 1.0, 2.0]) for h in picked}
+        plan = SettlementPlan(rates, inputs)
+        start = [rng.uniform(0, ECON_MAX_STOCK) * (rng.random() < 0.8) for _ in plan.goods]
+        hours = rng.randint(1, 24 * 30)
+
+        batched, hourly, nudged = list(start), list(start), [level * (1 + 1e-15) for level in start]
+        prosperity = plan.advance(batched, PROSPERITY_START, hours)
+        expected = _hourly(plan, hourly, PROSPERITY_START, hours)
+        # Some cycles amplify the last bit of rounding: hourly stepping from a
+        # start one part in 1e15 off is as far from itself as that.
+        _hourly(plan, nudged, PROSPERITY_START, hours)
+        noise = 1e-9 + 10 * max(abs(a - b) for a, b in zip(nudged, hourly, strict=True))
+        assert prosperity == pytest.approx(expected, abs=noise)
+        assert batched == pytest.approx(hourly, abs=noise)
+
+
+def test_input_cycle_is_not_extrapolated():
+    # Ale is brewed from malt, malt from ale and a grain trickle: each is
+    # limited by what the other left, an amount that changes every hour.
+    rates = {"ale": 24.0, "malt": 24.0, "grain": 1.2}
+    inputs = {"ale": {"malt": 1.0}, "malt": {"ale": 2.0, "grain": 1.0}}
+    plan = SettlementPlan(rates, inputs)
+    batched = plan.read({"ale": 1.0, "malt": 2.0, "grain": 3.0})
+    hourly = list(batched)
+
+    prosperity = plan.advance(batched, PROSPERITY_START, 24 * 10)
+    assert prosperity == pytest.approx(_hourly(plan, hourly, PROSPERITY_START, 24 * 10), abs=1e-9)
+    assert batched == pytest.approx(hourly, abs=1e-9)
+
+
+def test_bounds_hit_mid_span_are_respected():
+    # Consumption empties the store after 2 days; production caps at the max.
+    plan = SettlementPlan({"bread": -12.0, "ale": 24.0}, {})
+    levels = [1.0, 1.0]
+    prosperity = plan.advance(levels, PROSPERITY_START, 24 * 10)
+    assert levels == [0.0, ECON_MAX_STOCK]
+    assert prosperity < PROSPERITY_START, "a long bread shortage hurts"
+
+
+def test_jump_takes_few_exact_steps(monkeypatch):
+    plan = SettlementPlan({"iron_sword": 4.0}, {"iron_sword": {"iron_ore": 1.0}})
+    levels = plan.read({"iron_sword": 0.0, "iron_ore": 6.0})
+    steps = 0
+    exact_step = SettlementPlan.step
+
+    def counting_step(self, levels, prosperity):
+        nonlocal steps
+        steps += 1
+        return exact_step(self, levels, prosperity)
+
+    monkeypatch.setattr(SettlementPlan, "step", counting_step)
+    plan.advance(levels, None, 24 * 365)
+    assert levels == pytest.approx([6.0, 0.0])
+    assert steps < 20, "a year of a stalled forge is a handful of exact hours"
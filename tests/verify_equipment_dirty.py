@@ -0,0 +1,81 @@
+"""Tests for EquipmentSystem recomputing EffectiveStats only when something changed."""
+
+from unittest.mock import MagicMock
+
+import esper
+
+from game.components import EffectiveStats, Equipment, Equippable, SlotType, StatModifiers, Stats
+from game.services.equipment_service import equip_item
+from game.systems.equipment_system import EquipmentSystem
+
+
+def _stats(hp=10, mana=5):
+    return Stats(
+        hp, 10, 2, 1, mana, 5, 5, 5, base_max_hp=10, base_power=2, base_defense=1, base_max_mana=5, base_perception=5
+    )
+
+
+def _setup():
+    clock = MagicMock()
+    clock.phase = "day"
+    system = EquipmentSystem(clock)
+    esper.add_processor(system)
+    player = esper.create_entity(_stats(), Equipment())
+    ring = esper.create_entity(Equippable(slot=SlotType.ACCESSORY), StatModifiers(hp=3, power=4))
+    return system, clock, player, ring
+
+
+def test_only_changed_entities_are_recomputed(monkeypatch):
+    system, clock, player, ring = _setup()
+    bystander = esper.create_entity(_stats())
+    esper.process()
+    assert esper.component_for_entity(bystander, EffectiveStats).power == 2
+
+    recomputed = []
+    original = system._recompute
+    monkeypatch.setattr(system, "_recompute", lambda ent, *a: (recomputed.append(ent), original(ent, *a)))
+
+    esper.process()
+    assert recomputed == []
+
+    equip_item(esper, player, ring)
+    esper.process()
+    assert recomputed == [player]
+    eff = esper.component_for_entity(player, EffectiveStats)
+    assert (eff.power, eff.max_hp, eff.hp) == (6, 13, 13)
+
+    # Destroying the worn item drops its bonus without any event
+    recomputed.clear()
+    esper.delete_entity(ring)
+    esper.process()
+    assert recomputed == [player] and eff.power == 2
+
+    # A new Stats-bearing entity is picked up; a day phase change redoes everyone
+    recomputed.clear()
+    newcomer = esper.create_entity(_stats())
+    esper.process()
+    assert recomputed == [newcomer]
+    clock.phase = "night"
+    esper.process()
+    assert sorted(recomputed[1:]) == sorted([player, bystander, newcomer])
+
+
+def test_stat_writers_mark_their_entity(monkeypatch):
+    system, _clock, player, ring = _setup()
+    equip_item(esper, player, ring)
+    esper.process()
+    stats = esper.component_for_entity(player, Stats)
+    eff = esper.component_for_entity(player, EffectiveStats)
+
+    stats.hp -= 4
+    esper.process()
+    assert eff.hp == 13  # unannounced writes are not picked up
+
+    esper.dispatch_event("stats_changed", player)
+    esper.process()
+    assert eff.hp == 9
+
+    # Replacing the Stats component counts as a change as well
+    esper.add_component(player, _stats(hp=1))
+    esper.process()
+    assert eff.hp == 4
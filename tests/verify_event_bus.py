@@ -0,0 +1,82 @@
+"""Tests for the instrumented, coalescing event bus (core.event_bus)."""
+
+import esper
+
+from core.event_bus import coalescible, event_bus
+
+
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def on_event(self, value):
+        self.calls.append(value)
+
+    @coalescible
+    def on_event_coalesced(self, value, coalesced=1):
+        self.calls.append((value, coalesced))
+
+
+def test_dispatch_goes_through_the_bus_and_is_counted():
+    event_bus.reset()
+    recorder = _Recorder()
+    esper.set_handler("ping", recorder.on_event)
+
+    esper.dispatch_event("ping", 1)
+    esper.dispatch_event("ping", 2)
+    esper.dispatch_event("nobody_listens")
+
+    assert recorder.calls == [1, 2]
+    assert event_bus.dispatches["ping"] == 2
+    assert event_bus.dispatches["nobody_listens"] == 1
+
+
+def test_timing_records_calls_per_handler():
+    event_bus.reset()
+    event_bus.timing = True
+    try:
+        recorder = _Recorder()
+        esper.set_handler("ping", recorder.on_event)
+        for i in range(3):
+            esper.dispatch_event("ping", i)
+    finally:
+        event_bus.timing = False
+
+    handlers = event_bus.snapshot()["ping"]["handlers"]
+    assert handlers["_Recorder.on_event"]["calls"] == 3
+
+
+def test_coalescing_delivers_latest_payload_once_to_opted_in_handlers():
+    plain, coalesced = _Recorder(), _Recorder()
+    esper.set_handler("tick", plain.on_event)
+    esper.set_handler("tick", coalesced.on_event_coalesced)
+
+    with event_bus.coalescing("tick"):
+        for i in range(5):
+            esper.dispatch_event("tick", i)
+        assert coalesced.calls == []
+
+    assert plain.calls == [0, 1, 2, 3, 4], "handlers that did not opt in see every dispatch"
+    assert coalesced.calls == [(4, 5)]
+
+    esper.dispatch_event("tick", 9)
+    assert coalesced.calls[-1] == (9, 1), "normal delivery resumes after the block"
+
+
+def test_nested_coalescing_flushes_at_the_outermost_block():
+    recorder = _Recorder()
+    esper.set_handler("tick", recorder.on_event_coalesced)
+    with event_bus.coalescing("tick"):
+        with event_bus.coalescing("tick"):
+            esper.dispatch_event("tick", 1)
+        assert recorder.calls == []
+        esper.dispatch_event("tick", 2)
+    assert recorder.calls == [(2, 2)]
+
+
+def test_coalesced_block_without_dispatches_delivers_nothing():
+    recorder = _Recorder()
+    esper.set_handler("tick", recorder.on_event_coalesced)
+    with event_bus.coalescing("tick"):
+        pass
+    assert recorder.calls == []
@@ -0,0 +1,76 @@
+"""Tests for the frame-time / hitch recorder (core.frame_recorder)."""
+
+import json
+import time
+
+from core.frame_recorder import FrameRecorder
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _slow_update():
+    _busy(0.06)
+
+
+def test_disabled_recorder_is_a_no_op(tmp_path):
+    recorder = FrameRecorder(None, str(tmp_path))
+    with recorder.frame(), recorder.stage("update"):
+        _busy(0.01)
+    assert recorder.frame_count == 0
+    assert recorder._sampler is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_fast_frames_write_nothing(tmp_path):
+    recorder = FrameRecorder(1000.0, str(tmp_path))
+    try:
+        for _ in range(3):
+            with recorder.frame(), recorder.stage("update"):
+                pass
+    finally:
+        recorder.stop()
+    assert recorder.frame_count == 3
+    assert recorder.hitch_count == 0
+    assert not list(tmp_path.iterdir())
+    assert recorder.summary()["frames"] == 3
+
+
+def test_hitch_dumps_collapsed_stacks_and_stage_times(tmp_path):
+    recorder = FrameRecorder(20.0, str(tmp_path), sample_interval=0.001)
+    try:
+        with recorder.frame():
+            with recorder.stage("events"):
+                pass
+            with recorder.stage("update"):
+                _slow_update()
+    finally:
+        recorder.stop()
+
+    assert recorder.hitch_count == 1
+    [entry] = [json.loads(line) for line in (tmp_path / "hitches.jsonl").read_text().splitlines()]
+    assert entry["ms"] >= 60
+    assert entry["stages_ms"]["update"] >= 60
+    assert entry["stages_ms"]["events"] < 20
+    assert entry["samples"] > 0
+
+    lines = (tmp_path / entry["file"]).read_text().splitlines()
+    stacks = {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in lines}
+    assert sum(stacks.values()) == entry["samples"]
+    assert all(stack.startswith("frame") for stack in stacks)
+    assert any(stack.startswith("frame;update;") and "_slow_update" in stack for stack in stacks)
+
+
+def test_dumps_are_capped(tmp_path):
+    recorder = FrameRecorder(0.0, str(tmp_path), max_dumps=2)
+    try:
+        for _ in range(4):
+            with recorder.frame():
+                _busy(0.002)
+    finally:
+        recorder.stop()
+    assert recorder.hitch_count == 4
+    assert len((tmp_path / "hitches.jsonl").read_text().splitlines()) == 2
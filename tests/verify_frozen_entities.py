@@ -0,0 +1,78 @@
+"""Tests for the column-oriented frozen entity store."""
+
+import pickle
+
+import esper
+
+from game.components import AI, MapBound, Name, Position, Stats
+from game.map.frozen_entities import FrozenEntities
+from game.map.map_container import MapContainer
+from game.services.save_serialization import decode_frozen_entities, encode_frozen_entities
+
+
+class _Unknown:
+    """Not a game component — freeze() drops it, as it always has."""
+
+
+def test_freeze_groups_components_by_type():
+    esper.create_entity(MapBound(), Position(1, 1), Name("a"), AI())
+    esper.create_entity(MapBound(), Position(2, 2), Name("b"))
+    container = MapContainer(layers=[])
+    container.freeze(esper)
+
+    frozen = container.frozen_entities
+    assert len(frozen) == 2
+    assert sorted(n.name for n in frozen.column(Name)) == ["a", "b"]
+    assert len(frozen.column(AI)) == 1
+    assert frozen.column(Stats) == []
+    assert not esper._entities
+
+
+def test_thaw_restores_entities_in_order_with_shared_instances():
+    pos = Position(3, 4)
+    esper.create_entity(MapBound(), pos, Name("first"))
+    esper.create_entity(MapBound(), Position(5, 6), Name("second"))
+    container = MapContainer(layers=[])
+    container.freeze(esper)
+    container.thaw(esper)
+
+    names = [esper.component_for_entity(ent, Name).name for ent in sorted(esper._entities)]
+    assert names == ["first", "second"]
+    assert any(esper.component_for_entity(ent, Position) is pos for ent in esper._entities)
+    assert container.frozen_entities == []
+    # Queries see the thawed entities (cache was invalidated).
+    assert len(list(esper.get_components(MapBound, Name))) == 2
+
+
+def test_freeze_respects_exclusions_and_drops_unknown_types():
+    keep = esper.create_entity(MapBound(), Name("player"))
+    esper.create_entity(MapBound(), Name("npc"), _Unknown())
+    container = MapContainer(layers=[])
+    container.freeze(esper, exclude_entities=[keep])
+
+    assert list(esper._entities) == [keep]
+    [components] = list(container.frozen_entities)
+    assert not any(isinstance(c, _Unknown) for c in components)
+
+
+def test_pending_deletions_are_finalized():
+    doomed = esper.create_entity(MapBound(), Name("corpse"))
+    esper.delete_entity(doomed)
+    survivor = esper.create_entity(Name("unbound"))
+    MapContainer(layers=[]).freeze(esper)
+    assert list(esper._entities) == [survivor]
+
+
+def test_iterates_and_serializes_like_entity_lists():
+    entities = [[Position(1, 2), Name("a")], [Name("b")]]
+    frozen = FrozenEntities.from_lists(entities)
+    assert frozen == entities
+    assert decode_frozen_entities(encode_frozen_entities(frozen)) == entities
+    assert pickle.loads(pickle.dumps(frozen)) == entities
+
+
+def test_append_adds_a_row():
+    frozen = FrozenEntities()
+    frozen.append([Name("late")])
+    assert len(frozen) == 1
+    assert frozen.column(Name)[0].name == "late"
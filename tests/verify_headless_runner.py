@@ -0,0 +1,47 @@
+"""Tests for the headless game runner (no display, no draw calls)."""
+
+import pytest
+
+from core.input_manager import InputCommand
+from headless import HeadlessSession, RandomPolicy, ScriptedPolicy
+
+SEED = 1234
+
+
+def test_scripted_run_advances_one_round_per_turn():
+    session = HeadlessSession(SEED)
+    start_ticks = session.ctx.world_clock.total_ticks
+    report = session.run(ScriptedPolicy.parse("move_right, move_down, wait, interact"), 40)
+
+    assert report.turns == 40
+    assert session.ctx.world_clock.total_ticks == start_ticks + 40
+    assert session.ctx.systems.turn_system.is_player_turn()
+    assert report.turns_per_second > 0
+    assert report.system_calls["ai_system"] == 40
+    assert report.system_calls["visibility_system"] == 40
+    assert set(report.system_seconds) == set(session.ctx.systems.profiled())
+
+
+def test_instrumentation_is_removed_after_the_run():
+    session = HeadlessSession(SEED)
+    session.run(ScriptedPolicy([InputCommand.WAIT]), 3)
+    for system in session.ctx.systems.profiled().values():
+        assert "process" not in vars(system)
+
+
+def test_random_policy_is_reproducible_per_seed():
+    session = HeadlessSession(SEED)
+    a, b = RandomPolicy(7), RandomPolicy(7)
+    first = [a.next_command(session) for _ in range(50)]
+    assert [b.next_command(session) for _ in range(50)] == first
+    assert set(first) - {InputCommand.WAIT, InputCommand.INTERACT}, "the walk should move"
+
+    report = session.run(RandomPolicy(7), 30)
+    assert report.turns == 30 or report.died
+
+
+def test_script_parsing_rejects_unknown_commands():
+    with pytest.raises(ValueError):
+        ScriptedPolicy.parse("move_up,teleport")
+    with pytest.raises(ValueError):
+        ScriptedPolicy([])
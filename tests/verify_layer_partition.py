@@ -0,0 +1,45 @@
+"""Tests for partitioning entities by map layer (game.map.layer_partition)."""
+
+import esper
+
+from game.components import AI, AIBehaviorState, AIState, Alignment, Name, Position
+from game.map.layer_partition import layer_changed, on_layer, partition
+
+
+def _npc(x, layer):
+    return esper.create_entity(
+        AI(), AIBehaviorState(state=AIState.IDLE, alignment=Alignment.NEUTRAL), Position(x, 0, layer), Name(f"n{x}")
+    )
+
+
+def test_rows_per_layer_follow_the_query():
+    ground = [_npc(x, 0) for x in range(3)]
+    upstairs = [_npc(x, 1) for x in range(3, 5)]
+    esper.create_entity(Position(9, 9, 0))  # no AI: not in the query
+
+    rows = on_layer(0, AI, AIBehaviorState, Position)
+    query = esper.get_components(AI, AIBehaviorState, Position)
+    assert rows == [row for row in query if row[1][2].layer == 0]
+    assert sorted(ent for ent, _ in rows) == ground
+    assert sorted(ent for ent, _ in on_layer(1, AI, AIBehaviorState, Position)) == upstairs
+    assert on_layer(7, AI, AIBehaviorState, Position) == []
+
+    # Shared until something changes
+    assert on_layer(0, AI, AIBehaviorState, Position) is rows
+    assert partition(AIBehaviorState, Position, Name)[1][0][1][0].alignment == Alignment.NEUTRAL
+
+
+def test_partitions_follow_spawns_deaths_and_layer_changes():
+    a = _npc(0, 0)
+    b = _npc(1, 1)
+    assert [e for e, _ in on_layer(0, AI, AIBehaviorState, Position)] == [a]
+
+    c = _npc(2, 0)
+    esper.delete_entity(a, immediate=True)
+    assert [e for e, _ in on_layer(0, AI, AIBehaviorState, Position)] == [c]
+
+    # In-place layer edits are only seen once announced
+    esper.component_for_entity(b, Position).layer = 0
+    layer_changed()
+    assert sorted(e for e, _ in on_layer(0, AI, AIBehaviorState, Position)) == [b, c]
+    assert on_layer(1, AI, AIBehaviorState, Position) == []
@@ -0,0 +1,65 @@
+"""Tests for MapLayer's bulk tile painting API."""
+
+import pytest
+
+from game.content.resource_loader import ResourceLoader
+from game.map.map_layer import KEEP, MapLayer
+from game.map.tile import VisibilityState
+
+TILE_FILE = "assets/data/tile_types.json"
+
+
+@pytest.fixture(autouse=True)
+def _tiles():
+    ResourceLoader.load_tiles(TILE_FILE)
+
+
+def _types(layer):
+    return [[tile.type_id for tile in row] for row in layer.tiles]
+
+
+def test_filled_and_from_type_array():
+    layer = MapLayer.filled(3, 2, "floor_grass")
+    assert (layer.width, layer.height) == (3, 2)
+    assert _types(layer) == [["floor_grass"] * 3] * 2
+
+    layer = MapLayer.from_type_array([[0, 1], [1, 0]], ["wall_stone", "floor_stone"])
+    assert _types(layer) == [["wall_stone", "floor_stone"], ["floor_stone", "wall_stone"]]
+    assert not layer.tiles[0][0].walkable and layer.tiles[0][1].walkable
+
+
+def test_fill_rect_clips_and_can_paint_only_the_border():
+    layer = MapLayer.filled(5, 5, "floor_grass")
+    layer.fill_rect(3, 3, 4, 4, "floor_stone")
+    assert sum(row.count("floor_stone") for row in _types(layer)) == 4
+
+    layer = MapLayer.filled(5, 5, "floor_grass")
+    layer.fill_rect(0, 0, 5, 5, "wall_stone", border_only=True)
+    types = _types(layer)
+    assert types[0] == ["wall_stone"] * 5 and types[4] == ["wall_stone"] * 5
+    assert types[2] == ["wall_stone", "floor_grass", "floor_grass", "floor_grass", "wall_stone"]
+
+
+def test_paint_mask_respects_origin_bounds_and_only():
+    layer = MapLayer.filled(4, 4, "floor_grass")
+    layer.tiles[0][1].set_type("floor_stone")
+    mask = [[True, True, True], [False, True, False]]
+    layer.paint_mask(mask, "water_shallow", origin=(-1, 0), only={"floor_grass"})
+    types = _types(layer)
+    assert types[0][:2] == ["water_shallow", "floor_stone"], "off-layer cells skipped, non-grass kept"
+    assert types[1][:2] == ["water_shallow", "floor_grass"]
+
+
+def test_paint_array_keeps_instance_state():
+    layer = MapLayer.filled(2, 2, "floor_grass")
+    tile = layer.tiles[1][1]
+    tile.visibility_state = VisibilityState.SHROUDED
+    layer.paint_array([[KEEP, 0], [KEEP, 1]], ["water_shallow", "floor_stone"])
+    assert _types(layer) == [["floor_grass", "water_shallow"], ["floor_grass", "floor_stone"]]
+    assert layer.tiles[1][1] is tile
+    assert tile.visibility_state == VisibilityState.SHROUDED
+
+
+def test_unknown_type_id_raises():
+    with pytest.raises(ValueError):
+        MapLayer.filled(2, 2, "no_such_tile")
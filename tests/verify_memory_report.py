@@ -0,0 +1,46 @@
+"""Tests for the slotted components and the component memory report."""
+
+import copy
+import pickle
+import sys
+
+import esper
+
+from benchmarks.memory_report import collect, format_report, owned_bytes
+from game.components import KNOWN_COMPONENT_TYPES, Action, ActionList, Name, Position, Stats
+from game.map.map_container import MapContainer
+from game.services.map_service import MapService
+from game.services.save_serialization import decode_dataclass, encode_dataclass
+
+
+def test_components_have_no_instance_dict():
+    dataclasses = [cls for cls in KNOWN_COMPONENT_TYPES if hasattr(cls, "__dataclass_fields__")]
+    assert len(dataclasses) > 40
+    for cls in dataclasses:
+        assert "__slots__" in vars(cls), f"{cls.__name__} is not slotted"
+
+    stats = Stats(10, 10, 2, 1, 0, 0, 5, 5)
+    assert not hasattr(stats, "__dict__")
+    for clone in (copy.deepcopy(stats), pickle.loads(pickle.dumps(stats)), decode_dataclass(encode_dataclass(stats))):
+        assert clone == stats and clone is not stats
+
+
+def test_report_counts_live_and_frozen_components():
+    map_service = MapService()
+    frozen_map = MapContainer([])
+    map_service.register_map("elsewhere", frozen_map)
+    esper.create_entity(Position(1, 1), Name("here"))
+    frozen_map.frozen_entities.append([Position(2, 2), Name("there")])
+    frozen_map.frozen_entities.append([Position(3, 3)])
+
+    usage = collect(map_service)
+    assert (usage["Position"].live_count, usage["Position"].frozen_count) == (1, 2)
+    assert (usage["Name"].live_count, usage["Name"].frozen_count) == (1, 1)
+    assert usage["Position"].frozen_bytes == 2 * owned_bytes(Position(0, 0))
+    total = format_report(usage).splitlines()[-1].split()
+    assert (total[0], total[1], total[3]) == ("total", "2", "3")
+
+    # Owned containers and the dataclasses in them count; shared strings do not.
+    actions = ActionList([Action("Slash"), Action("Bash")])
+    owned = sys.getsizeof(actions) + sys.getsizeof(actions.actions) + 2 * owned_bytes(Action("x"))
+    assert owned_bytes(actions) == owned
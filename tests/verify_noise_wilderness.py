@@ -0,0 +1,64 @@
+"""Tests for seeded value noise and the noise-driven wilderness terrain."""
+
+import bisect
+
+import esper
+
+from core.noise import quantile_cutoffs, value_noise
+from game.content.resource_loader import ResourceLoader
+from game.services.map_generator import MapGenerator, wilderness_arrival_pos
+from game.services.map_service import MapService
+
+
+def _load_content():
+    ResourceLoader.load_tiles("assets/data/tile_types.json")
+    ResourceLoader.load_entities("assets/data/entities.json")
+    ResourceLoader.load_items("assets/data/items.json")
+
+
+def test_value_noise_is_seeded_smooth_and_in_range():
+    grid = value_noise(30, 20, seed=7)
+    assert len(grid) == 20 and len(grid[0]) == 30
+    assert grid == value_noise(30, 20, seed=7)
+    assert grid != value_noise(30, 20, seed=8)
+    values = [v for row in grid for v in row]
+    assert all(0.0 <= v < 1.0 for v in values)
+    # Coherent: horizontal neighbours differ far less than random pairs would.
+    steps = [abs(row[x + 1] - row[x]) for row in grid for x in range(29)]
+    assert sum(steps) / len(steps) < 0.1
+
+
+def test_quantile_cutoffs_cover_the_requested_shares():
+    grid = value_noise(50, 50, seed=3)
+    shares = [0.1, 0.05]
+    cuts = quantile_cutoffs(grid, shares)
+    bands = [0, 0, 0]
+    for row in grid:
+        for v in row:
+            bands[bisect.bisect_right(cuts, v)] += 1
+    # bands[2] is the first share, bands[1] the second, bands[0] the rest.
+    assert abs(bands[2] - 250) <= 2
+    assert abs(bands[1] - 125) <= 2
+    assert quantile_cutoffs(grid, []) == []
+
+
+def test_large_wilderness_is_deterministic_and_keeps_the_arrival_clear():
+    _load_content()
+    generator = MapGenerator(MapService())
+
+    def build(map_id, seed):
+        wild = generator.create_wilderness(esper, map_id, "forest", (1, 1), seed=seed, size=96)
+        return wild, [[t.type_id for t in row] for row in wild.layers[0].tiles]
+
+    wild, first = build("A", 11)
+    _, again = build("B", 11)
+    _, other = build("C", 12)
+    assert len(first) == 96 and len(first[0]) == 96
+    assert first == again and first != other
+
+    ax, ay = wilderness_arrival_pos(96)
+    assert wild.arrival_pos == (ax, ay)
+    assert all(wild.is_walkable(x, y, 0) for x in range(ax - 2, ax + 3) for y in range(ay - 2, ay + 3))
+    # Big trees scale with the area: a 96x96 forest holds far more than 40x40's handful.
+    trunks = sum(row.count("tree_trunk") for row in first)
+    assert trunks > 20
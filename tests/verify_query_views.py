@@ -0,0 +1,84 @@
+"""Tests for the incrementally invalidated esper query views (core/ecs.py)."""
+
+from dataclasses import dataclass
+
+import esper
+
+from core.ecs import isolated_world
+
+
+@dataclass
+class _Pos:
+    x: int = 0
+
+
+@dataclass
+class _Health:
+    hp: int = 1
+
+
+@dataclass
+class _Marker:
+    pass
+
+
+def _entities(result):
+    return sorted(ent for ent, _ in result)
+
+
+def test_unrelated_changes_keep_a_view():
+    a = esper.create_entity(_Pos(), _Health())
+    b = esper.create_entity(_Pos())
+    view = esper.get_components(_Pos, _Health)
+    single = esper.get_component(_Pos)
+    assert _entities(view) == [a]
+
+    esper.add_component(b, _Marker())
+    esper.remove_component(b, _Marker)
+    esper.create_entity(_Marker())
+    assert esper.get_components(_Pos, _Health) is view
+    assert esper.get_component(_Pos) is single
+
+    esper.add_component(b, _Health())
+    assert _entities(esper.get_components(_Pos, _Health)) == [a, b]
+    assert esper.get_component(_Pos) is single
+
+
+def test_changes_to_a_signature_type_refresh_the_view():
+    a = esper.create_entity(_Pos(), _Health(hp=1))
+    b = esper.create_entity(_Pos(), _Health())
+    esper.get_components(_Pos, _Health)
+
+    replacement = _Health(hp=7)
+    esper.add_component(a, replacement)
+    assert dict(esper.get_components(_Pos, _Health))[a][1] is replacement
+
+    assert esper.try_remove_component(b, _Marker) is None
+    esper.remove_component(b, _Health)
+    assert _entities(esper.get_components(_Pos, _Health)) == [a]
+
+    esper.delete_entity(a)
+    assert _entities(esper.get_components(_Pos, _Health)) == [a], "deletion is deferred"
+    esper.process()
+    assert esper.get_components(_Pos, _Health) == []
+    assert _entities(esper.get_component(_Pos)) == [b]
+
+    c = esper.create_entity(_Pos(), _Health())
+    esper.delete_entity(b, immediate=True)
+    assert _entities(esper.get_component(_Pos)) == [c]
+
+
+def test_full_cache_clears_and_world_switches_still_apply():
+    a = esper.create_entity(_Pos())
+    view = esper.get_component(_Pos)
+    esper._entities[a][_Pos] = _Pos(x=3)  # behind esper's back ...
+    esper.clear_cache()  # ... so the whole cache is reset
+    assert esper.get_component(_Pos) is not view
+    assert esper.get_component(_Pos)[0][1].x == 3
+
+    with isolated_world():
+        assert esper.get_component(_Pos) == []
+        esper.create_entity(_Pos(), _Health())
+        assert len(esper.get_components(_Pos, _Health)) == 1
+    assert _entities(esper.get_component(_Pos)) == [a]
+    assert esper.get_components(_Pos, _Health) == []
@@ -4,20 +4,29 @@ Covers the time-skip engine (TurnOrchestrator.advance_turns), its
 interruption rule, the bed-tile bump dispatch and the innkeeper interaction.
 """
 
+import copy
 import os
+from types import SimpleNamespace
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 import esper
 import pygame
 
+from config import FAST_FORWARD_NEAR_RADIUS, TICKS_PER_HOUR
+from core.event_bus import coalescible
+from core.world_clock_service import WorldClockService
 from game.components import (
+    AI,
     AIBehaviorState,
     AIState,
     Alignment,
+    Bleeding,
+    Merchant,
     MovementRequest,
     PlayerTag,
     Position,
+    Stats,
 )
 from game.content.entity_factory import EntityFactory
 from game.content.resource_loader import ResourceLoader
@@ -25,6 +34,8 @@ from game.map.map_container import MapContainer
 from game.map.map_layer import MapLayer
 from game.map.tile import Tile
 from game.services.interaction_resolver import InteractionResolver, InteractionType
+from game.services.merchant_restock_service import MerchantRestockService
+from game.services.world_chronicle_service import PendingEscalation, WorldChronicleService
 from game.systems.movement_system import MovementSystem
 
 
@@ -70,6 +81,162 @@ def test_advance_turns_interrupted_by_hunting_hostile():
     assert gc.ctx.world_clock.total_ticks == start, "no time passes while threatened"
 
 
+def test_advance_turns_interrupted_by_hp_loss():
+    gc, game = _boot_game()
+    esper.add_component(gc.ctx.player_entity, Bleeding(damage_per_turn=1, turns_left=5))
+
+    result = game.turn_orchestrator.advance_turns(120)
+
+    assert result == {"elapsed": 1, "interrupted": True}
+
+
+def test_fast_forward_leaves_distant_friendlies_dormant():
+    gc, game = _boot_game()
+    player_pos = esper.component_for_entity(gc.ctx.player_entity, Position)
+    near = esper.create_entity(
+        AI(),
+        Position(player_pos.x + 1, player_pos.y, player_pos.layer),
+        AIBehaviorState(AIState.IDLE, Alignment.NEUTRAL),
+    )
+    # A walkable spot well outside the near radius, so a stepped wanderer would move.
+    layer = gc.ctx.map_container.layers[player_pos.layer]
+    far_x, far_y = next(
+        (x, y)
+        for y, row in enumerate(layer.tiles)
+        for x, tile in enumerate(row)
+        if tile.walkable and max(abs(x - player_pos.x), abs(y - player_pos.y)) > FAST_FORWARD_NEAR_RADIUS + 2
+    )
+    far = esper.create_entity(
+        AI(), Position(far_x, far_y, player_pos.layer), AIBehaviorState(AIState.WANDER, Alignment.NEUTRAL)
+    )
+    far_hostile = esper.create_entity(
+        AI(),
+        Position(player_pos.x + 40, player_pos.y, player_pos.layer),
+        AIBehaviorState(AIState.IDLE, Alignment.HOSTILE),
+        Stats(hp=5, max_hp=5, power=1, defense=0, mana=0, max_mana=0, perception=5, intelligence=1),
+    )
+
+    dormant = game.turn_orchestrator._dormant_npcs(gc.ctx.player_entity)
+    assert far in dormant
+    assert near not in dormant
+    assert far_hostile not in dormant, "hostiles are always stepped"
+
+    far_pos = esper.component_for_entity(far, Position)
+    start = (far_pos.x, far_pos.y)
+    game.turn_orchestrator.advance_turns(10)
+    assert (far_pos.x, far_pos.y) == start
+
+
+def test_hourly_dispatch_coalesces_clock_ticks():
+    clock = WorldClockService(total_ticks=TICKS_PER_HOUR - 2)
+    seen = []
+
+    def on_tick(state):
+        seen.append(state["total_ticks"])
+
+    # esper keeps only a weak reference to handlers — hold a strong one.
+    esper.set_handler("clock_tick", on_tick)
+    with clock.hourly_dispatch():
+        for _ in range(5):
+            clock.advance(1)
+    assert seen == [TICKS_PER_HOUR, TICKS_PER_HOUR + 3], "hour boundary plus the final state"
+
+    clock.advance(1)
+    assert seen[-1] == TICKS_PER_HOUR + 4, "normal per-tick dispatch resumes"
+
+
+def test_rest_delivers_one_catch_up_tick_to_coalescible_handlers():
+    gc, game = _boot_game()
+    calls = []
+
+    @coalescible
+    def on_tick(state, coalesced=1):
+        calls.append((state["total_ticks"], coalesced))
+
+    esper.set_handler("clock_tick", on_tick)
+    start = gc.ctx.world_clock.total_ticks
+    game.turn_orchestrator.advance_turns(3 * TICKS_PER_HOUR)
+
+    assert len(calls) == 1
+    assert calls[0][0] == start + 3 * TICKS_PER_HOUR
+    assert calls[0][1] >= 3, "one dispatch per hour boundary was folded in"
+    # The real subscribers caught up in that single call.
+    assert gc.ctx.economy.last_processed_hour == gc.ctx.world_clock.total_ticks // TICKS_PER_HOUR
+    assert gc.ctx.world_chronicle.last_processed_hour == gc.ctx.world_clock.total_ticks // TICKS_PER_HOUR
+
+
+def test_rest_restocks_from_the_economy_of_each_hour():
+    gc, game = _boot_game()
+    economy, restock = gc.ctx.economy, gc.ctx.merchant_restock
+    location = gc.ctx.world_graph.current_location_id
+    # A good the settlement is out of, produced at 0.4/hour: it crosses
+    # RESTOCK_MIN_ECON_STOCK three hours into the rest.
+    economy.stocks[location]["test_flour"] = 0.0
+    economy.rates_per_day[location]["test_flour"] = 0.4 * 24
+    start_ticks = gc.ctx.world_clock.total_ticks
+
+    # Reference: the same services ticked hour by hour, economy first.
+    ref_economy = copy.deepcopy(economy)
+    ref_restock = MerchantRestockService(
+        economy=ref_economy, world_graph=gc.ctx.world_graph, last_hour=restock.last_hour
+    )
+    ref = esper.create_entity(Merchant(stock=[], base_stock=["test_flour"] * 8))
+    for hour in range(1, 9):
+        state = {"total_ticks": start_ticks + hour * TICKS_PER_HOUR}
+        ref_economy.on_clock_tick(state)
+        ref_restock.on_clock_tick(state)
+    expected = esper.component_for_entity(ref, Merchant).stock.count("test_flour")
+    esper.delete_entity(ref, immediate=True)
+    assert expected == 6
+
+    shop = esper.create_entity(Merchant(stock=[], base_stock=["test_flour"] * 8))
+    assert game.turn_orchestrator.advance_turns(8 * TICKS_PER_HOUR)["elapsed"] == 8 * TICKS_PER_HOUR
+
+    assert esper.component_for_entity(shop, Merchant).stock.count("test_flour") == expected
+    assert economy.stocks[location]["test_flour"] == ref_economy.stocks[location]["test_flour"]
+
+
+def test_rest_restocks_after_a_mid_rest_escalation_at_the_current_settlement():
+    gc, game = _boot_game()
+    economy, chronicle = gc.ctx.economy, gc.ctx.world_chronicle
+    location = gc.ctx.world_graph.current_location_id
+    economy.stocks[location]["health_potion"] = 2.5
+    economy.rates_per_day[location]["health_potion"] = 0.0
+    start_hour = gc.ctx.world_clock.total_ticks // TICKS_PER_HOUR
+    # A raid two hours in takes 2 potions: the settlement drops below
+    # RESTOCK_MIN_ECON_STOCK and the shelves stop filling.
+    raid = PendingEscalation(location, start_hour + 2, "caravan_raided", "bandits_spotted")
+    chronicle.pending_escalations.append(raid)
+
+    # Reference: economy, chronicle and restock ticked hour by hour, in that
+    # order; the chronicle only knows the escalation (no rolled events).
+    ref_economy = copy.deepcopy(economy)
+    ref_chronicle = WorldChronicleService(
+        ctx=SimpleNamespace(world_graph=gc.ctx.world_graph, economy=ref_economy),
+        templates=[t for t in chronicle.templates if t.weight == 0],
+        last_processed_hour=chronicle.last_processed_hour,
+        pending_escalations=[copy.copy(raid)],
+    )
+    ref_restock = MerchantRestockService(
+        economy=ref_economy, world_graph=gc.ctx.world_graph, last_hour=gc.ctx.merchant_restock.last_hour
+    )
+    ref = esper.create_entity(Merchant(stock=[], base_stock=["health_potion"] * 8))
+    for hour in range(1, 9):
+        state = {"total_ticks": (start_hour + hour) * TICKS_PER_HOUR}
+        ref_economy.on_clock_tick(state)
+        ref_chronicle.on_clock_tick(state)
+        ref_restock.on_clock_tick(state)
+    expected = esper.component_for_entity(ref, Merchant).stock.count("health_potion")
+    esper.delete_entity(ref, immediate=True)
+    assert 0 < expected < 8
+
+    shop = esper.create_entity(Merchant(stock=[], base_stock=["health_potion"] * 8))
+    game.turn_orchestrator.advance_turns(8 * TICKS_PER_HOUR)
+
+    assert esper.component_for_entity(shop, Merchant).stock.count("health_potion") == expected
+    assert economy.stocks[location]["health_potion"] == ref_economy.stocks[location]["health_potion"]
+
+
 # --- Bed tile bump --------------------------------------------------------
 
 
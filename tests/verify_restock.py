@@ -41,7 +41,7 @@ def test_restock_rate_is_one_per_hour():
 
 def test_scarcity_blocks_restock_of_tracked_goods():
     ent = _merchant(stock=[], base=["grain", "grain"])
-    economy = types.SimpleNamespace(stocks={"Village": {"grain": 0.0}})
+    economy = types.SimpleNamespace(stocks={"Village": {"grain": 0.0}}, advance_to_hour=lambda hour: None)
     world_graph = types.SimpleNamespace(current_location_id="Village")
     svc = MerchantRestockService(economy=economy, world_graph=world_graph)
     svc.on_clock_tick({"total_ticks": 10 * TICKS_PER_HOUR})
@@ -50,7 +50,8 @@ def test_scarcity_blocks_restock_of_tracked_goods():
 
 def test_untracked_goods_always_restock():
     ent = _merchant(stock=[], base=["iron_sword", "iron_sword"])
-    economy = types.SimpleNamespace(stocks={"Village": {"grain": 9.0}})  # iron_sword not tracked
+    economy = types.SimpleNamespace(stocks={"Village": {"grain": 9.0}}, advance_to_hour=lambda hour: None)
+    # iron_sword is not tracked
     world_graph = types.SimpleNamespace(current_location_id="Village")
     svc = MerchantRestockService(economy=economy, world_graph=world_graph)
     svc.on_clock_tick({"total_ticks": 10 * TICKS_PER_HOUR})
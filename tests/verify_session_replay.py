@@ -0,0 +1,138 @@
+"""Tests for input recording and deterministic headless replay."""
+
+import esper
+import pygame
+import pytest
+
+import headless
+from bootstrap import build_game_context
+from core.ecs import reset_world
+from core.input_manager import InputCommand
+from game.components import Position, Purse
+from game.content.entity_factory import EntityFactory
+from game.services.session_recorder import SessionRecorder, SessionRecording, state_hash
+from game.states.world_map import WorldMapState
+from headless import HeadlessSession, RandomPolicy
+
+SEED = 7
+
+# Keys for the commands RandomPolicy plays, as the player-turn mapping reads them.
+_POLICY_KEYS = {
+    InputCommand.MOVE_UP: pygame.K_UP,
+    InputCommand.MOVE_DOWN: pygame.K_DOWN,
+    InputCommand.MOVE_LEFT: pygame.K_LEFT,
+    InputCommand.MOVE_RIGHT: pygame.K_RIGHT,
+    InputCommand.WAIT: pygame.K_SPACE,
+    InputCommand.INTERACT: pygame.K_g,
+}
+
+# Bump the merchant, buy, switch panes and sell it back, leave; bump the
+# guard, ask for news and the roads, leave; a round trip to the world map.
+_WINDOW_KEYS = [
+    pygame.K_RIGHT,
+    pygame.K_DOWN,
+    pygame.K_RETURN,
+    pygame.K_RIGHT,
+    pygame.K_RETURN,
+    pygame.K_ESCAPE,
+    pygame.K_LEFT,
+    pygame.K_DOWN,
+    pygame.K_RETURN,
+    pygame.K_UP,
+    pygame.K_RETURN,
+    pygame.K_ESCAPE,
+    pygame.K_m,
+    pygame.K_ESCAPE,
+]
+
+
+def _session(company=True):
+    """A session on SEED; with `company`, a merchant and a guard flank the player."""
+    session = HeadlessSession(SEED)
+    if company:
+        pos = esper.component_for_entity(session.ctx.player_entity, Position)
+        esper.add_component(session.ctx.player_entity, Purse(gold=500))
+        EntityFactory.create(esper, "traveling_merchant", pos.x + 1, pos.y)
+        EntityFactory.create(esper, "caravan_guard", pos.x - 1, pos.y)
+    return session
+
+
+def _record_session(keys, turns=0, company=True):
+    """Play like the main loop: one key press per frame, then idle frame updates.
+
+    `keys` are pressed first, then `turns` presses of a random walk.
+    """
+    session = _session(company)
+    recorder = session.ctx.input_manager.recorder = SessionRecorder(SEED)
+    policy = RandomPolicy(3)
+    states = {"GAME": session.state, "WORLD_MAP": WorldMapState()}
+    name = "GAME"
+    presses = list(keys) + [None] * turns
+    for key in presses:
+        recorder.next_frame(name)
+        if key is None:
+            key = _POLICY_KEYS[policy.next_command(session)]
+        states[name].get_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+        for _ in range(3):
+            states[name].update(1 / 60)
+        state = states[name]
+        if state.done:
+            state.done = False
+            if state.next_state not in states:
+                break
+            name = state.next_state
+            states[name].startup(session.ctx)
+    session.ctx.input_manager.recorder = None
+    recorder.recording.final_hash = state_hash(session.ctx)
+    return recorder.recording
+
+
+def test_replay_reproduces_the_recorded_state(tmp_path):
+    recording = _record_session(_WINDOW_KEYS, turns=60)
+    states = {entry.state for entry in recording.entries}
+    assert states == {"GAME", "WORLD_MAP"}
+    path = tmp_path / "run.json"
+    recording.save(str(path))
+
+    loaded = SessionRecording.load(str(path))
+    assert loaded.entries == recording.entries
+    assert _session().replay(loaded) == recording.final_hash
+
+
+def test_window_input_is_recorded_and_replayed():
+    recording = _record_session(_WINDOW_KEYS)
+    # The windows' own translations are recorded, ahead of the state's.
+    window_commands = [entry.command for entry in recording.entries if entry.context == "INVENTORY"]
+    assert window_commands[:5] == ["MOVE_DOWN", "CONFIRM", "MOVE_RIGHT", "CONFIRM", "CANCEL"]
+    assert _session().replay(recording) == recording.final_hash
+
+    # Without the purchase, the merchant, the purse and the economy differ.
+    buy = recording.entries[1].press + 1
+    recording.entries = [entry for entry in recording.entries if entry.press != buy]
+    assert _session().replay(recording) != recording.final_hash
+
+
+def test_different_input_gives_a_different_hash():
+    recording = _record_session([], turns=30, company=False)
+    recording.entries = [entry for entry in recording.entries if entry.command != "MOVE_UP"]
+    assert HeadlessSession(SEED).replay(recording) != recording.final_hash
+
+
+def test_runtime_rngs_are_seeded_from_the_world_seed():
+    def draws():
+        reset_world()
+        systems = build_game_context(seed=SEED).systems
+        return [s.rng.random() for s in (systems.ai_system, systems.combat_system, systems.death_system)]
+
+    assert draws() == draws()
+
+
+def test_cli_replay_exits_nonzero_on_mismatch(tmp_path, capsys):
+    recording = _record_session([], turns=10, company=False)
+    recording.final_hash = "0" * 64
+    path = tmp_path / "run.json"
+    recording.save(str(path))
+    with pytest.raises(SystemExit) as exc:
+        headless.main(["--replay", str(path)])
+    assert exc.value.code == 1
+    assert "MISMATCH" in capsys.readouterr().out
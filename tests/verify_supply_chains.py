@@ -10,6 +10,8 @@ import os
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
+import pytest
+
 from config import PROSPERITY_START, TICKS_PER_HOUR
 from game.services.economy_service import EconomyService
 from game.services.quest_service import QuestService
@@ -38,16 +40,16 @@ def test_production_consumes_its_inputs():
     economy = _smithy_economy()
     _tick(economy, 24)  # one day: 4 swords forged from 4 ore
 
-    assert economy.stocks["Eastmoor"]["iron_sword"] == 4.0
-    assert economy.stocks["Eastmoor"]["iron_ore"] == 2.0
+    assert economy.stocks["Eastmoor"]["iron_sword"] == pytest.approx(4.0)
+    assert economy.stocks["Eastmoor"]["iron_ore"] == pytest.approx(2.0)
 
 
 def test_production_stalls_without_inputs():
     economy = _smithy_economy()
     _tick(economy, 24 * 10)  # ten days, but only 6 ore in stock
 
-    assert economy.stocks["Eastmoor"]["iron_sword"] == 6.0, "production must stop when the ore runs out"
-    assert economy.stocks["Eastmoor"]["iron_ore"] == 0.0
+    assert economy.stocks["Eastmoor"]["iron_sword"] == pytest.approx(6.0), "production must stop when the ore runs out"
+    assert economy.stocks["Eastmoor"]["iron_ore"] == pytest.approx(0.0)
 
 
 def test_inputs_count_as_consumed_goods():
@@ -0,0 +1,101 @@
+"""Tests for per-system profiling (core.profiling) and its debug overlay."""
+
+import json
+
+import pygame
+
+from bootstrap import build_game_context
+from core.camera import Camera
+from core.input_manager import InputCommand
+from core.profiling import SystemProfiler
+from game.controllers.input_controller import InputController
+from game.systems.debug_render_system import DebugRenderSystem
+from game_context import DebugFlags
+
+
+class _Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, amount=1):
+        self.calls += amount
+        return self.calls
+
+
+def test_attach_times_calls_and_detach_restores_process():
+    system = _Counter()
+    profiler = SystemProfiler(history=3)
+    profiler.attach({"counter": system})
+    for _ in range(5):
+        system.process(2)
+
+    stats = profiler.stats["counter"]
+    assert system.calls == 10
+    assert stats.calls == 5
+    assert len(stats.samples) == 3  # ring buffer keeps only the newest calls
+    assert stats.total >= sum(stats.samples)
+
+    profiler.detach()
+    assert not profiler.attached
+    assert "process" not in vars(system)
+    system.process()
+    assert stats.calls == 5
+
+
+def test_attach_twice_does_not_double_wrap():
+    system = _Counter()
+    profiler = SystemProfiler()
+    profiler.attach({"counter": system})
+    profiler.attach({"counter": system})
+    system.process()
+    assert profiler.stats["counter"].calls == 1
+
+
+def test_snapshot_and_dump(tmp_path):
+    profiler = SystemProfiler(history=4)
+    fast, slow = _Counter(), _Counter()
+    profiler.attach({"fast": fast, "slow": slow})
+    fast.process()
+    profiler.stats["slow"].record(0.5)
+
+    assert list(profiler.snapshot()) == ["slow", "fast"]
+    path = tmp_path / "out" / "systems.json"
+    profiler.dump(str(path))
+    data = json.loads(path.read_text())
+    assert data["systems"]["slow"]["max_ms"] == 500.0
+    assert data["samples_ms"]["slow"] == [500.0]
+
+    profiler.reset()
+    assert profiler.snapshot()["slow"]["calls"] == 0
+
+
+def test_f8_toggle_attaches_the_profiler_to_every_system():
+    ctx = build_game_context(seed=1)
+    controller = InputController(ctx)
+    ctx.debug_flags.master = True
+
+    controller.handle_player_input(InputCommand.DEBUG_TOGGLE_PROFILER, None)
+    assert ctx.debug_flags.profiler
+    profiled = ctx.systems.profiled()
+    assert "ai_system" in profiled and "visibility_system" in profiled
+    assert all("process" in vars(system) for system in profiled.values())
+
+    controller.handle_player_input(InputCommand.DEBUG_TOGGLE_PROFILER, None)
+    assert not ctx.profiler.attached
+    assert all("process" not in vars(system) for system in profiled.values())
+
+
+def test_overlay_renders_the_timing_table():
+    pygame.init()
+    try:
+        system = DebugRenderSystem(Camera(320, 240))
+        profiler = SystemProfiler()
+        profiler.attach({"ai_system": _Counter()})
+        profiler.stats["ai_system"].record(0.002)
+        flags = DebugFlags(master=True, player_fov=False, chase=False, labels=False, profiler=True)
+        surface = pygame.Surface((320, 240))
+        system.process(surface, flags, 0, profiler)
+        # The table's background is drawn in the top-left corner.
+        assert system.overlay.get_at((6, 6)).a > 0
+    finally:
+        pygame.quit()
@@ -0,0 +1,69 @@
+"""Tests for flyweight tiles: shared TileType data with copy-on-write overrides."""
+
+import pickle
+
+import pytest
+
+from config import SpriteLayer
+from game.content.resource_loader import ResourceLoader
+from game.map.tile import Tile, VisibilityState
+from game.map.tile_registry import tile_registry
+
+TILE_FILE = "assets/data/tile_types.json"
+
+
+@pytest.fixture(autouse=True)
+def _tiles():
+    ResourceLoader.load_tiles(TILE_FILE)
+
+
+def test_tiles_read_the_flyweight_and_cannot_write_through_it():
+    a, b = Tile(type_id="floor_stone"), Tile(type_id="floor_stone")
+    tile_type = tile_registry.get("floor_stone")
+    assert a.tile_type is tile_type
+    assert a.sprites is b.sprites is tile_type.sprites
+    assert not a.is_customized
+    with pytest.raises(TypeError):
+        a.sprites[SpriteLayer.GROUND] = "X"
+
+
+def test_override_is_per_tile_and_set_type_drops_it():
+    tile = Tile(type_id="floor_stone")
+    tile.set_sprite(SpriteLayer.GROUND, "#")
+    assert tile.is_customized
+    assert tile.sprites[SpriteLayer.GROUND] == "#"
+    assert not tile.is_transparent, "a wall glyph blocks sight, as before"
+    assert tile_registry.get("floor_stone").sprites[SpriteLayer.GROUND] == "."
+
+    tile.set_sprite_color(SpriteLayer.GROUND, (1, 2, 3))
+    assert tile.sprite_colors[SpriteLayer.GROUND] == (1, 2, 3)
+
+    tile.set_type("floor_stone")
+    assert not tile.is_customized
+    assert tile.is_transparent
+
+
+def test_rest_and_station_flags_come_from_the_type():
+    bed = Tile(type_id="furniture_bed")
+    forge = Tile(type_id="station_forge")
+    floor = Tile(type_id="floor_stone")
+    assert bed.provides_rest and not floor.provides_rest
+    assert forge.crafting_station == "forge" and floor.crafting_station == ""
+
+    floor.set_type("furniture_bed")
+    assert floor.provides_rest
+    assert not Tile(sprites={SpriteLayer.GROUND: "."}).provides_rest
+
+
+def test_pickle_round_trips_plain_customized_and_legacy_tiles():
+    plain = Tile(type_id="floor_grass")
+    plain.visibility_state = VisibilityState.SHROUDED
+    custom = Tile(type_id="floor_stone", dark=True)
+    custom.set_sprite(SpriteLayer.DECOR_BOTTOM, "T")
+    legacy = Tile(transparent=False, sprites={SpriteLayer.GROUND: "."})
+
+    plain2, custom2, legacy2 = pickle.loads(pickle.dumps([plain, custom, legacy]))
+    assert plain2.sprites is plain.sprites
+    assert plain2.visibility_state == VisibilityState.SHROUDED
+    assert custom2.dark and custom2.sprites[SpriteLayer.DECOR_BOTTOM] == "T"
+    assert legacy2.type_id is None and legacy2.walkable and not legacy2.transparent
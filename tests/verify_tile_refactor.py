@@ -55,11 +55,13 @@ def main():
     check("After set_type('wall_stone'): transparent False", t.transparent is False)
     print()
 
-    print("Checking sprite dicts are per-instance copies (not shared)...")
+    print("Checking sprite overrides are copy-on-write (flyweight data stays shared)...")
     t1 = Tile(type_id="floor_stone")
     t2 = Tile(type_id="floor_stone")
-    t1.sprites[SpriteLayer.GROUND] = "X"
-    check("Mutating t1 sprites doesn't affect t2", t2.sprites.get(SpriteLayer.GROUND) == ".")
+    check("Unmodified tiles share the flyweight's sprites", t1.sprites is t2.sprites)
+    t1.set_sprite(SpriteLayer.GROUND, "X")
+    check("Overriding t1's sprite changes t1", t1.sprites.get(SpriteLayer.GROUND) == "X")
+    check("Overriding t1's sprite doesn't affect t2", t2.sprites.get(SpriteLayer.GROUND) == ".")
     print()
 
     print("Checking legacy Tile construction still works...")
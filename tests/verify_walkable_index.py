@@ -0,0 +1,114 @@
+"""Tests for the per-layer WalkableIndex and the code that queries it."""
+
+import random
+
+import esper
+
+from game.components import LootTable, Name, Position
+from game.content.item_registry import ItemTemplate, item_registry
+from game.content.resource_loader import ResourceLoader
+from game.map.map_container import MapContainer
+from game.map.map_layer import MapLayer
+from game.map.tile import Tile
+from game.systems.death_system import DeathSystem
+
+
+def _layer(width=20, height=15, seed=4):
+    ResourceLoader.load_tiles("assets/data/tile_types.json")
+    rng = random.Random(seed)
+    kinds = ["floor_stone", "floor_stone", "wall_stone", "door_stone"]
+    return MapLayer([[Tile(type_id=rng.choice(kinds)) for _ in range(width)] for _ in range(height)])
+
+
+def _spiral(layer, sx, sy, max_radius, exclude=None, avoid=None):
+    """The plain ring-by-ring search the index must agree with."""
+    rows, cols = len(layer.tiles), len(layer.tiles[0])
+
+    def ok(x, y, strict):
+        if not (0 <= x < cols and 0 <= y < rows) or not layer.tiles[y][x].walkable:
+            return False
+        if exclude and (x, y) in exclude:
+            return False
+        return not (strict and avoid and layer.tiles[y][x].type_id in avoid)
+
+    for strict in (True, False):
+        if ok(sx, sy, strict):
+            return sx, sy
+        for r in range(1, max_radius + 1):
+            for dx in range(-r, r + 1):
+                for dy in range(-r, r + 1):
+                    if (abs(dx) == r or abs(dy) == r) and ok(sx + dx, sy + dy, strict):
+                        return sx + dx, sy + dy
+        if not avoid:
+            break
+    return None
+
+
+def test_nearest_matches_the_spiral_search():
+    layer = _layer()
+    index = layer.walkable_index
+    exclude = {(3, 3), (4, 3), (10, 7)}
+    for _ in range(3):  # before and after the distance transform is built
+        for y in range(-1, 16):
+            for x in range(-1, 21):
+                for radius in (1, 3):
+                    assert index.nearest(x, y, radius) == _spiral(layer, x, y, radius)
+                    assert index.nearest(x, y, radius, exclude, {"door_stone"}) == _spiral(
+                        layer, x, y, radius, exclude, {"door_stone"}
+                    )
+
+
+def test_distance_transform_gives_up_beyond_the_radius():
+    ResourceLoader.load_tiles("assets/data/tile_types.json")
+    layer = MapLayer([[Tile(type_id="wall_stone") for _ in range(12)] for _ in range(12)])
+    layer.set_tile_type(0, 0, "floor_stone")
+    index = layer.walkable_index
+    assert index.distance(11, 11) == 11 and index.distance(3, 1) == 3
+    assert index.nearest(11, 11, max_radius=10) is None
+    assert index.nearest(11, 11, max_radius=11) == (0, 0)
+
+
+def test_layer_edits_keep_the_index_in_sync():
+    layer = _layer()
+    index = layer.walkable_index
+    assert len(index) == sum(t.walkable for row in layer.tiles for t in row)
+
+    layer.fill_rect(2, 2, 5, 4, "wall_stone")
+    layer.set_tile_type(3, 3, "floor_stone")
+    layer.write_span(0, 10, [Tile(type_id="floor_stone") for _ in range(8)])
+    expected = [(x, y) for y, row in enumerate(layer.tiles) for x, t in enumerate(row) if t.walkable]
+    assert index.positions() == expected
+    assert index.positions(region=(0, 9, 8, 2)) == [p for p in expected if p[0] < 8 and 9 <= p[1] < 11]
+
+    rng = random.Random(2)
+    picks = index.sample(rng, 10, exclude={(3, 3)})
+    assert len(set(picks)) == 10 and (3, 3) not in picks
+    assert all(layer.tiles[y][x].walkable for x, y in picks)
+    only = expected[-1]
+    assert index.choice(rng, exclude=set(expected) - {only}) == only
+
+
+def test_blocked_death_drops_land_on_the_nearest_open_tile():
+    ResourceLoader.load_tiles("assets/data/tile_types.json")
+    layer = MapLayer([[Tile(type_id="wall_stone") for _ in range(9)] for _ in range(9)])
+    layer.set_tile_type(6, 4, "floor_stone")
+    death_system = DeathSystem(rng=random.Random(1))
+    death_system.set_map(MapContainer([layer]))
+
+    item_registry.clear()
+    item_registry.register(
+        ItemTemplate(
+            id="test_item",
+            name="Test Item",
+            sprite="i",
+            color=(255, 255, 255),
+            sprite_layer="ITEMS",
+            weight=1.0,
+            material="gold",
+        )
+    )
+    monster = esper.create_entity(Position(4, 4), LootTable(entries=[("test_item", 1.0)]), Name("Monster"))
+    esper.dispatch_event("entity_died", monster)
+
+    drops = [(p.x, p.y) for _, (p, n) in esper.get_components(Position, Name) if n.name == "Test Item"]
+    assert drops == [(6, 4)]
@@ -9,7 +9,8 @@ os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 import pygame
 
 from config import TICKS_PER_HOUR
-from game.services.world_chronicle_service import WorldChronicleService
+from game.services import world_chronicle_service
+from game.services.world_chronicle_service import PendingEscalation, WorldChronicleService
 from game.services.world_graph_service import WorldGraphService, WorldLocation
 
 EVENTS_FILE = "assets/data/world_events.json"
@@ -63,6 +64,33 @@ def test_clock_tick_is_idempotent_per_hour():
     assert len(chronicle.events) == count
 
 
+def test_long_jump_matches_hour_by_hour_ticking():
+    """Rolling is batched over a jump; the chronicle must not depend on how the clock was chunked."""
+    stepped = _chronicle(_ctx_with_two_settlements(current=None), seed=3)
+    for hour in range(1, 10 * 24 + 1):
+        stepped.on_clock_tick({"total_ticks": hour * TICKS_PER_HOUR})
+    jumped = _chronicle(_ctx_with_two_settlements(current=None), seed=3)
+    jumped.on_clock_tick({"total_ticks": 10 * 24 * TICKS_PER_HOUR})
+
+    assert len(stepped.events) > 0
+    assert [(e.tick, e.location_id, e.event_id) for e in jumped.events] == [
+        (e.tick, e.location_id, e.event_id) for e in stepped.events
+    ]
+    assert jumped.to_dict()["pending_escalations"] == stepped.to_dict()["pending_escalations"]
+
+
+def test_zero_event_chance_rolls_nothing(monkeypatch):
+    monkeypatch.setattr(world_chronicle_service, "SIM_EVENT_CHANCE_PER_HOUR", 0.0)
+    chronicle = _chronicle(_ctx_with_two_settlements())
+    # Escalations still fire on schedule.
+    chronicle.pending_escalations.append(PendingEscalation("B", 5, "caravan_raided", "bandits_spotted"))
+
+    chronicle.on_clock_tick({"total_ticks": 30 * 24 * TICKS_PER_HOUR})
+
+    assert [(e.tick, e.event_id) for e in chronicle.events] == [(5 * TICKS_PER_HOUR, "caravan_raided")]
+    assert chronicle.last_processed_hour == 30 * 24
+
+
 def test_events_for_filters_by_location_and_tick():
     ctx = _ctx_with_two_settlements()
     chronicle = _chronicle(ctx)
@@ -74,6 +102,44 @@ def test_events_for_filters_by_location_and_tick():
     assert [e.event_id for e in recent_b] == ["fresh"]
 
 
+def test_events_for_filters_by_type_and_keeps_tick_order():
+    chronicle = WorldChronicleService()
+    chronicle.record("B", tick=500, text="Wolves again.", event_id="wolves_spotted")
+    chronicle.record("B", tick=100, text="Late report.", event_id="wolves_spotted")  # recorded out of order
+    chronicle.record("B", tick=300, text="Market day.", event_id="market")
+    chronicle.record("A", tick=400, text="Wolves here too.", event_id="wolves_spotted")
+
+    wolves_b = chronicle.events_for("B", since_tick=0, event_id="wolves_spotted")
+    assert [e.tick for e in wolves_b] == [100, 500]
+    assert [e.location_id for e in chronicle.events_for(None, since_tick=200, event_id="wolves_spotted")] == ["A", "B"]
+    assert [e.tick for e in chronicle.events] == [100, 300, 400, 500]
+    assert chronicle.events_for("C") == []
+
+
+def test_compaction_drops_old_events_but_keeps_newest_per_location():
+    chronicle = WorldChronicleService()
+    for tick in range(0, 100):
+        chronicle.record("B", tick=tick, text="Busy town.", event_id="busy")
+    chronicle.record("A", tick=5, text="Quiet town, long ago.", event_id="quiet")
+
+    dropped = chronicle.events.compact(now_tick=200, retention_ticks=110, keep_per_location=3)
+
+    assert dropped == 91  # B's ticks 0..90; its newest three are recent anyway
+    assert [e.tick for e in chronicle.events_for("B")] == list(range(91, 100))
+    assert [e.text for e in chronicle.events_for("A", since_tick=-1)] == ["Quiet town, long ago."]
+
+
+def test_clock_ticks_compact_daily():
+    ctx = _ctx_with_two_settlements()
+    chronicle = _chronicle(ctx)
+    chronicle.record("B", tick=0, text="Ancient history.", event_id="ancient")
+    chronicle.record("B", tick=1, text="Also ancient.", event_id="ancient")
+    chronicle.on_clock_tick({"total_ticks": 400 * 24 * TICKS_PER_HOUR})
+
+    assert chronicle.events, "a year of rolls leaves recent events"
+    assert all(e.event_id != "ancient" for e in chronicle.events)
+
+
 def test_serialization_roundtrip():
     ctx = _ctx_with_two_settlements()
     chronicle = _chronicle(ctx)
@@ -0,0 +1,82 @@
+"""Tests for world template snapshots (new-run reset without regeneration)."""
+
+import esper
+import pygame
+import pytest
+
+from bootstrap import build_game_context
+from core.ecs import reset_world
+from game.components import Name, Position
+from game.services.world_template import WorldTemplate
+
+SEED = 4242
+
+
+@pytest.fixture(autouse=True)
+def _pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _live_summary():
+    return sorted((name.name, pos.x, pos.y, pos.layer) for _, (name, pos) in esper.get_components(Name, Position))
+
+
+def _maps_summary(map_service, map_ids):
+    summary = {}
+    for map_id in map_ids:
+        container = map_service.get_map(map_id)
+        summary[map_id] = (
+            [[tile.type_id for tile in row] for layer in container.layers for row in layer.tiles],
+            len(container.frozen_entities),
+        )
+    return summary
+
+
+def test_restored_run_matches_a_fresh_build():
+    fresh = build_game_context(seed=SEED)
+    fresh_live = _live_summary()
+    built = list(fresh.map_service.maps)
+    fresh_maps = _maps_summary(fresh.map_service, built)
+    fresh_stocks = {loc: dict(stock) for loc, stock in fresh.economy.stocks.items()}
+    template = WorldTemplate.capture(fresh)
+
+    reset_world()
+    restored = build_game_context(seed=SEED, template=template)
+
+    assert restored.map_service.active_map_id == fresh.map_service.active_map_id
+    assert _live_summary() == fresh_live
+    assert restored.economy.stocks == fresh_stocks
+    assert set(restored.map_service.maps) | set(restored.map_service.pending) == set(built) | set(
+        fresh.map_service.pending
+    )
+    # Captured maps are cloned lazily, on first access.
+    assert _maps_summary(restored.map_service, built) == fresh_maps
+
+
+def test_play_does_not_leak_into_the_template():
+    ctx = build_game_context(seed=SEED)
+    template = WorldTemplate.capture(ctx)
+    start_id = ctx.world_graph.start_location_id
+
+    # Mutate everything the template covers.
+    other = next(loc for loc in ctx.world_graph.locations.values() if loc.id != start_id)
+    other.discovered = True
+    ctx.economy.stocks[start_id] = {}
+    for ent in list(esper._entities):
+        esper.delete_entity(ent, immediate=True)
+
+    reset_world()
+    restored = build_game_context(seed=SEED, template=template)
+    assert not restored.world_graph.get_location(other.id).discovered
+    assert restored.economy.stocks[start_id]
+    assert _live_summary()
+
+
+def test_template_for_another_seed_is_ignored():
+    template = WorldTemplate.capture(build_game_context(seed=SEED))
+    reset_world()
+    ctx = build_game_context(seed=SEED + 1, template=template)
+    assert ctx.world_seed == SEED + 1
+    assert ctx.map_service.get_active_map() is not None